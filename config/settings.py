@@ -18,6 +18,8 @@ KRAKEN_API_SECRET = os.getenv('KRAKEN_API_SECRET')
 # Redis Configuration
 REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
 REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
+# Shared connection pool size (each Pub/Sub listener holds one connection)
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 256))
 
 # PHASE 3.2: GitHub API Token (for Code moat data)
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
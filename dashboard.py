@@ -764,7 +764,7 @@ def start_redis_listener(app_queue: Queue):
             pubsub.psubscribe(pattern)
             for message in pubsub.listen():
                 try:
-                    data = json.loads(message['data'])
+                    data = RedisClient.decode_message(message['channel'], message['data'])
                     app_queue.put({'type': msg_type, 'data': data, 'channel': message['channel'], 'time': time.time()})
                 except:
                     pass
@@ -3,10 +3,14 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import time
+import random
+import threading
+from collections import deque
+from itertools import islice
 from streamlit_echarts import st_echarts
 from src.connectors.redis_client import RedisClient
-import json
 
 # Page configuration - Modern, wide layout
 st.set_page_config(
@@ -52,56 +56,160 @@ def get_redis():
 
 redis_client = get_redis()
 
+# Agents PUBLISH their id on this channel whenever their agent:<id> state changes
+AGENT_UPDATES_CHANNEL = 'agent.updates'
+# Announcements kept for sessions to catch up on; a session further behind rescans
+AGENT_UPDATE_LOG_SIZE = 10000
+
+
+class AgentUpdateListener:
+    """
+    Background subscriber for agent state deltas.
+
+    Shared by every browser session (cache_resource), so it never hands out
+    and forgets ids: it appends each announced id to a sequence-numbered log,
+    and each session reads the ids after its own cursor. Each rerun then only
+    refetches agents that actually changed instead of polling the full set.
+    """
+
+    def __init__(self, connection):
+        self._log = deque(maxlen=AGENT_UPDATE_LOG_SIZE)
+        self._seq = 0  # Sequence number of the newest logged id
+        self._lock = threading.Lock()
+        self._pubsub = connection.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(AGENT_UPDATES_CHANNEL)
+        self._thread = threading.Thread(target=self._listen, daemon=True)
+        self._thread.start()
+
+    def _listen(self):
+        for message in self._pubsub.listen():
+            agent_id = message['data']
+            if isinstance(agent_id, bytes):
+                agent_id = agent_id.decode('utf-8')
+            with self._lock:
+                self._log.append(agent_id)
+                self._seq += 1
+
+    def cursor(self) -> int:
+        """Current position in the log, for a session that has just done a full scan"""
+        with self._lock:
+            return self._seq
+
+    def changes_since(self, cursor: int):
+        """
+        Return (new cursor, ids announced after cursor). The ids are None when
+        the log no longer reaches back to cursor and the caller must rescan.
+        """
+        with self._lock:
+            behind = self._seq - cursor
+            if behind > len(self._log):
+                return self._seq, None
+            changed = set(islice(self._log, len(self._log) - behind, None))
+            return self._seq, changed
+
+
+@st.cache_resource
+def get_agent_update_listener():
+    if not redis_client.connection:
+        return None
+    return AgentUpdateListener(redis_client.connection)
+
+agent_update_listener = get_agent_update_listener()
+
+# agent:<id> is a Redis hash; only the fields the dashboard renders are fetched
+AGENT_FIELDS = ('status', 'position', 'rsi', 'momentum', 'atr', 'signals', 'last_update')
+_AGENT_FIELD_TYPES = {'rsi': float, 'momentum': float, 'atr': float, 'signals': int, 'last_update': float}
+
+def _decode_agent_fields(values):
+    """Turn an HMGET reply into a dict, skipping fields the agent never set"""
+    agent_info = {}
+    for field, raw in zip(AGENT_FIELDS, values):
+        if raw is None:
+            continue
+        value = raw.decode('utf-8')
+        cast = _AGENT_FIELD_TYPES.get(field)
+        agent_info[field] = cast(float(value)) if cast else value
+    return agent_info
+
+def _scan_agent_ids():
+    """Discover all agent ids with a non-blocking SCAN (only on a cold cache)"""
+    return [
+        key.decode('utf-8').replace('agent:', '')
+        for key in redis_client.connection.scan_iter(match='agent:*', count=500)
+    ]
+
+def _build_agent_record(agent_id, agent_info):
+    # Categorize agent
+    if 'DataMiner' in agent_id or 'DataEngineer' in agent_id:
+        agent_type = 'Data Engineer'
+        color = '#3b82f6'
+    elif 'PatternLearner' in agent_id or 'SwarmBrain' in agent_id:
+        agent_type = 'Pattern Learner'
+        color = '#a855f7'
+    elif 'TradingAgent' in agent_id:
+        agent_type = 'Trading Executor'
+        color = '#fbbf24'
+    elif 'RiskManagement' in agent_id:
+        agent_type = 'Risk Guardian'
+        color = '#ef4444'
+    else:
+        agent_type = 'Unknown'
+        color = '#6b7280'
+
+    # Build comprehensive agent record
+    return {
+        'id': agent_id,
+        'type': agent_type,
+        'color': color,
+        'status': agent_info.get('status', 'Active'),
+        'position': agent_info.get('position', 'FLAT'),
+        'rsi': agent_info.get('rsi', None),
+        'momentum': agent_info.get('momentum', None),
+        'atr': agent_info.get('atr', None),
+        'signals': agent_info.get('signals', 0),
+        'last_update': agent_info.get('last_update', time.time())
+    }
+
 # Function to collect agent data
 def collect_agent_data():
-    """Meticulous data collection from all agents"""
-    try:
-        # Get all agent keys from Redis
-        all_keys = redis_client.connection.keys('agent:*') if redis_client.connection else []
-
-        agent_data = []
-        for key in all_keys:
-            agent_id = key.decode('utf-8').replace('agent:', '')
-
-            # Fetch detailed agent info from Redis
-            agent_info_raw = redis_client.connection.get(key)
-            if agent_info_raw:
-                agent_info = json.loads(agent_info_raw)
-            else:
-                agent_info = {}
-
-            # Categorize agent
-            if 'DataMiner' in agent_id or 'DataEngineer' in agent_id:
-                agent_type = 'Data Engineer'
-                color = '#3b82f6'
-            elif 'PatternLearner' in agent_id or 'SwarmBrain' in agent_id:
-                agent_type = 'Pattern Learner'
-                color = '#a855f7'
-            elif 'TradingAgent' in agent_id:
-                agent_type = 'Trading Executor'
-                color = '#fbbf24'
-            elif 'RiskManagement' in agent_id:
-                agent_type = 'Risk Guardian'
-                color = '#ef4444'
-            else:
-                agent_type = 'Unknown'
-                color = '#6b7280'
-
-            # Build comprehensive agent record
-            agent_record = {
-                'id': agent_id,
-                'type': agent_type,
-                'color': color,
-                'status': agent_info.get('status', 'Active'),
-                'position': agent_info.get('position', 'FLAT'),
-                'rsi': agent_info.get('rsi', None),
-                'momentum': agent_info.get('momentum', None),
-                'atr': agent_info.get('atr', None),
-                'signals': agent_info.get('signals', 0),
-                'last_update': agent_info.get('last_update', time.time())
-            }
+    """
+    Meticulous data collection from all agents
 
-            agent_data.append(agent_record)
+    Reads from a session-local cache. Ids announced on AGENT_UPDATES_CHANNEL
+    since this session's last read are invalidated, and only missing ids are
+    refetched with one pipelined HMGET.
+    """
+    try:
+        if not redis_client.connection:
+            return pd.DataFrame(create_fallback_data())
+
+        agent_cache = st.session_state.setdefault('agent_cache', {})
+        cursor = st.session_state.get('agent_update_cursor')
+
+        changed = None
+        if agent_cache and agent_update_listener and cursor is not None:
+            st.session_state['agent_update_cursor'], changed = agent_update_listener.changes_since(cursor)
+
+        if changed is None:
+            # Cold cache (or fell behind the update log): full scan. The cursor is
+            # taken first, so ids announced during the scan are refetched next run.
+            if agent_update_listener:
+                st.session_state['agent_update_cursor'] = agent_update_listener.cursor()
+            agent_cache.clear()
+            missing_ids = _scan_agent_ids()
+        else:
+            missing_ids = list(changed)
+            for agent_id in missing_ids:
+                agent_cache.pop(agent_id, None)
+
+        if missing_ids:
+            pipe = redis_client.connection.pipeline(transaction=False)
+            for agent_id in missing_ids:
+                pipe.hmget(f'agent:{agent_id}', *AGENT_FIELDS)
+            for agent_id, values in zip(missing_ids, pipe.execute()):
+                agent_cache[agent_id] = _build_agent_record(agent_id, _decode_agent_fields(values))
+
+        agent_data = list(agent_cache.values())
 
         # Create fallback data if Redis is empty
         if not agent_data:
@@ -113,9 +221,14 @@ def collect_agent_data():
         st.error(f"Error collecting agent data: {e}")
         return pd.DataFrame(create_fallback_data())
 
+@st.cache_data(ttl=60)
 def create_fallback_data():
-    """Create sample data when Redis is not populated"""
-    import random
+    """
+    Create sample data when Redis is not populated
+
+    Cached for a minute so an empty Redis doesn't regenerate ~100 random
+    agents on every 2s refresh.
+    """
     fallback = []
 
     # 100 Pattern Learners
@@ -193,27 +306,48 @@ def create_fallback_data():
 # Collect data
 df = collect_agent_data()
 
-# Top metrics row
+# Top metrics row - computed in one pass over the materialized columns
+_ACTIVE = ('Active', 'Analyzing', 'Signaling')
+
+status_arr = df['status'].to_numpy()
+pos_arr = df['position'].to_numpy()
+sig_arr = df['signals'].to_numpy()
+
+total_agents = len(df)
+active_agents = int(np.isin(status_arr, _ACTIVE).sum())
+long_positions = int((pos_arr == 'LONG').sum())
+total_signals = int(sig_arr.sum())
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    st.metric("Total Agents", len(df), delta=None)
+    st.metric("Total Agents", total_agents, delta=None)
 with col2:
-    active_agents = len(df[df['status'].str.contains('Active|Analyzing|Signaling', na=False)])
     st.metric("Active Agents", active_agents, delta=None)
 with col3:
-    long_positions = len(df[df['position'] == 'LONG'])
     st.metric("Long Positions", long_positions, delta=None)
 with col4:
-    total_signals = df['signals'].sum()
-    st.metric("Total Signals", int(total_signals), delta=None)
+    st.metric("Total Signals", total_signals, delta=None)
 
 st.markdown("---")
 
 # Main dashboard layout
-tab1, tab2, tab3, tab4 = st.tabs(["📊 Agent Grid", "🔮 Swarm Intelligence", "📈 Performance", "⚙️ Agent Details"])
+# st.tabs runs every tab body on each rerun, so a radio selects the one view
+# to compute and render.
+TAB_GRID = "📊 Agent Grid"
+TAB_SWARM = "🔮 Swarm Intelligence"
+TAB_PERFORMANCE = "📈 Performance"
+TAB_DETAILS = "⚙️ Agent Details"
+
+active_tab = st.radio(
+    "View",
+    [TAB_GRID, TAB_SWARM, TAB_PERFORMANCE, TAB_DETAILS],
+    horizontal=True,
+    key='active_tab',
+    label_visibility='collapsed'
+)
 
-with tab1:
+if active_tab == TAB_GRID:
     st.header("Agent Status Grid")
     st.markdown("**Enterprise-grade monitoring of all 105 agents**")
 
@@ -275,7 +409,7 @@ with tab1:
         height=400
     )
 
-with tab2:
+elif active_tab == TAB_SWARM:
     st.header("Swarm Intelligence Visualization")
     st.markdown("**100-agent network showing signal propagation**")
 
@@ -359,7 +493,7 @@ with tab2:
 
     st_echarts(options=graph_options, height="600px")
 
-with tab3:
+elif active_tab == TAB_PERFORMANCE:
     st.header("Performance Metrics")
     st.markdown("**Real-time agent performance tracking**")
 
@@ -418,7 +552,7 @@ with tab3:
 
         st_echarts(options=histogram_options, height="400px")
 
-with tab4:
+elif active_tab == TAB_DETAILS:
     st.header("Agent Details")
     st.markdown("**Deep dive into individual agent performance**")
 
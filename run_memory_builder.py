@@ -14,6 +14,7 @@ The goal: Give our AI agents a rich memory to learn from.
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List
 import pandas as pd
@@ -24,7 +25,7 @@ sys.path.insert(0, './src')
 
 from backtesting.backtest_engine import BacktestEngine, BacktestConfig, StrategyType
 from backtesting.data_loader import load_backtest_data
-from storage.chroma_client import ChromaDBClient, create_pattern_embedding
+from storage.chroma_client import ChromaDBClient, create_pattern_embedding, create_pattern_embeddings_from_columns
 from connectors.market_data_aggregator import MarketDataAggregator
 
 # Configure logging
@@ -37,6 +38,14 @@ logging.basicConfig(
     ]
 )
 
+# Kraken pair -> market data API symbol
+_PAIR_SYMBOL_MAP = {
+    "XXBTZUSD": "BTC",
+    "XETHZUSD": "ETH",
+    "XLTCZUSD": "LTC",
+    "XXRPZUSD": "XRP",
+}
+
 
 class MemoryBuilder:
     """
@@ -54,6 +63,10 @@ class MemoryBuilder:
         self.aggregator = MarketDataAggregator()
         self.engine = BacktestEngine()
 
+        # Hash of the last stored market snapshot per symbol, so unchanged
+        # API responses don't add duplicate rows to ChromaDB
+        self._last_enriched_hash: Dict[str, int] = {}
+
         logging.info("[MEMORY] Memory builder initialized")
 
     def run_backtest_and_store(self, pairs: List[str], days_back: int = 90,
@@ -68,8 +81,9 @@ class MemoryBuilder:
         """
         logging.info(f"[MEMORY] Starting backtest for {len(pairs)} pairs, {days_back} days back")
 
-        # Calculate date range
-        end_date = datetime.now()
+        # Calculate date range (aligned to the hour so reruns within the same
+        # hour hit load_backtest_data's parquet cache)
+        end_date = datetime.now().replace(minute=0, second=0, microsecond=0)
         start_date = end_date - timedelta(days=days_back)
 
         # Create backtest config
@@ -116,42 +130,52 @@ class MemoryBuilder:
         logging.info(f"[MEMORY] Storing patterns from {strategy_name}...")
 
         result = results[strategy]
+        positions = result.closed_positions_df
+
+        # Column-wise extraction: one pass per column instead of per-row dict lookups
+        entry_times = pd.to_datetime(positions['entry_time'])
+        # ChromaDB metadata only takes str/int/float/bool, so timestamps go in as ISO strings
+        entry_isos = entry_times.map(pd.Timestamp.isoformat).astype(str)
+        ids = (f"{strategy.value}_" + positions['pair'] + "_" + entry_isos).tolist()
+        metadatas = pd.DataFrame({
+            'pair': positions['pair'],
+            'direction': positions['direction'],
+            'entry_price': positions['entry_price'],
+            'exit_price': positions['exit_price'],
+            'pnl_pct': positions['pnl_pct'],
+            'rsi': positions['entry_rsi'].fillna(50.0),
+            'macd': positions['entry_macd'].fillna(0.0),
+            'volume': 0.0,
+            'cross_moat_score': positions['cross_moat_score'].fillna(0),
+            'timestamp': entry_isos,
+            'strategy': strategy.value
+        }).to_dict('records')
+        # Embed straight from the position columns into one preallocated buffer
+        embeddings = create_pattern_embeddings_from_columns(
+            len(positions),
+            rsi=positions['entry_rsi'].fillna(50.0).to_numpy(),
+            macd=positions['entry_macd'].fillna(0.0).to_numpy(),
+            volume=0.0,
+            cross_moat_score=positions['cross_moat_score'].fillna(0).to_numpy(),
+            hour=entry_times.dt.hour.to_numpy(),
+            weekday=entry_times.dt.weekday.to_numpy(),
+            pnl_pct=positions['pnl_pct'].to_numpy()
+        )
 
-        # Store each closed position as a pattern
-        for position in result.closed_positions:
-            pattern_id = f"{strategy.value}_{position['pair']}_{position['entry_time'].isoformat()}"
-
-            # Create pattern data
-            pattern_data = {
-                'pair': position['pair'],
-                'direction': position['direction'],
-                'entry_price': position['entry_price'],
-                'exit_price': position['exit_price'],
-                'pnl_pct': position['pnl_pct'],
-                'rsi': position.get('entry_rsi', 50.0),
-                'macd': position.get('entry_macd', 0.0),
-                'volume': position.get('entry_volume', 0.0),
-                'cross_moat_score': position.get('cross_moat_score', 0),
-                'timestamp': position['entry_time'],
-                'strategy': strategy.value
-            }
-
-            # Create embedding
-            embedding = create_pattern_embedding(pattern_data)
-
-            # Determine success (profitable = success)
-            success = position['pnl_pct'] > 0
+        # Determine success (profitable = success)
+        successes = positions['pnl_pct'].to_numpy() > 0
 
-            # Store in ChromaDB
-            self.chroma.store_pattern(
-                pattern_id=pattern_id,
-                embedding=embedding,
-                metadata=pattern_data,
-                success=success
-            )
+        # Store in ChromaDB
+        self.chroma.store_patterns_bulk(
+            ids=ids,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            successes=successes,
+            batch_size=500
+        )
 
         logging.info(
-            f"[MEMORY] Stored {len(result.closed_positions)} patterns from {strategy_name} "
+            f"[MEMORY] Stored {len(positions)} patterns from {strategy_name} "
             f"(Success rate: {result.win_rate*100:.1f}%)"
         )
 
@@ -164,34 +188,56 @@ class MemoryBuilder:
         """
         logging.info("[MEMORY] Enriching memory with current market data...")
 
-        for pair in pairs:
-            # Extract symbol (e.g., 'XXBTZUSD' -> 'BTC')
-            if 'BTC' in pair:
-                symbol = 'BTC'
-            elif 'ETH' in pair:
-                symbol = 'ETH'
-            elif 'LTC' in pair:
-                symbol = 'LTC'
-            elif 'XRP' in pair:
-                symbol = 'XRP'
-            else:
-                continue
-
-            logging.info(f"[MEMORY] Fetching enriched data for {symbol}...")
-
-            # Get enriched market data
-            enriched_data = self.aggregator.get_enriched_market_data(symbol)
-
-            if enriched_data and 'price' in enriched_data:
+        # Extract symbols (e.g., 'XXBTZUSD' -> 'BTC')
+        symbol_pairs = {_PAIR_SYMBOL_MAP[pair]: pair for pair in pairs if pair in _PAIR_SYMBOL_MAP}
+
+        # API fetches are I/O bound: run them concurrently, but keep the
+        # ChromaDB writes on this thread (the client isn't safe for concurrent writes)
+        with ThreadPoolExecutor(max_workers=max(1, len(symbol_pairs))) as executor:
+            futures = {
+                executor.submit(self.aggregator.get_enriched_market_data, symbol): symbol
+                for symbol in symbol_pairs
+            }
+
+            for future in as_completed(futures):
+                symbol = futures[future]
+                pair = symbol_pairs[symbol]
+
+                try:
+                    enriched_data = future.result()
+                except Exception as e:
+                    logging.error(f"[MEMORY] Failed to fetch enriched data for {symbol}: {e}")
+                    continue
+
+                if not enriched_data or 'price' not in enriched_data:
+                    continue
+
+                price = enriched_data['price']
+                market_cap = enriched_data.get('market_cap', 0)
+                volume_24h = enriched_data.get('volume_24h', 0)
+                change_24h = enriched_data.get('change_24h', 0)
+
+                # Skip the write if the market hasn't moved since the last snapshot
+                snapshot_hash = hash((
+                    round(price or 0, 2),
+                    round(market_cap or 0, 0),
+                    round(volume_24h or 0, 0),
+                    round(change_24h or 0, 4)
+                ))
+                if self._last_enriched_hash.get(symbol) == snapshot_hash:
+                    logging.debug("[MEMORY] Market state unchanged for %s, skipping", symbol)
+                    continue
+                self._last_enriched_hash[symbol] = snapshot_hash
+
                 # Create a "current state" pattern
                 pattern_id = f"current_{symbol}_{datetime.now().isoformat()}"
 
                 pattern_data = {
                     'pair': pair,
-                    'price': enriched_data['price'],
-                    'market_cap': enriched_data.get('market_cap', 0),
-                    'volume_24h': enriched_data.get('volume_24h', 0),
-                    'change_24h': enriched_data.get('change_24h', 0),
+                    'price': price,
+                    'market_cap': market_cap,
+                    'volume_24h': volume_24h,
+                    'change_24h': change_24h,
                     'timestamp': datetime.now(),
                     'source': 'market_data_api'
                 }
@@ -256,21 +302,25 @@ class MemoryBuilder:
         # Get top patterns
         top_patterns = self.chroma.get_top_performing_patterns(n_results=20)
 
-        summary = {
-            'timestamp': datetime.now().isoformat(),
-            'stats': stats,
-            'top_patterns': [
-                {
+        # Stream the document one pattern at a time instead of building the
+        # whole summary dict (and its JSON string) in memory first
+        with open(output_file, 'w') as f:
+            f.write('{\n')
+            f.write(f'  "timestamp": {json.dumps(datetime.now().isoformat())},\n')
+            f.write('  "stats": ')
+            f.write(json.dumps(stats, indent=2, default=str).replace('\n', '\n  '))
+            f.write(',\n  "top_patterns": [')
+
+            for i, p in enumerate(top_patterns):
+                entry = {
                     'id': p['id'],
                     'pnl_pct': p['pnl_pct'],
                     'metadata': p['metadata']
                 }
-                for p in top_patterns
-            ]
-        }
+                f.write(',\n    ' if i else '\n    ')
+                f.write(json.dumps(entry, indent=2, default=str).replace('\n', '\n    '))
 
-        with open(output_file, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
+            f.write('\n  ]\n}' if top_patterns else ']\n}')
 
         logging.info(f"[MEMORY] Summary exported to {output_file}")
 
@@ -1,26 +1,31 @@
 import sqlite3
+from contextlib import closing
 
-conn = sqlite3.connect('mycelial_patterns.db')
-cursor = conn.cursor()
+# closing() guarantees the connection is released even if a query fails
+# (sqlite3's own context manager only commits/rolls back, it doesn't close)
+with closing(sqlite3.connect('mycelial_patterns.db')) as conn:
+    conn.execute('PRAGMA query_only = 1')
+    cursor = conn.cursor()
+    cursor.arraysize = 1000
 
-# Check if table exists
-cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-tables = cursor.fetchall()
-print("Tables:", tables)
+    # Check if table exists
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = cursor.fetchall()
+    print("Tables:", tables)
 
-# Check pattern count
-try:
-    cursor.execute('SELECT COUNT(*) FROM patterns')
-    count = cursor.fetchone()[0]
-    print(f'\nTotal patterns in DB: {count}')
+    # Check pattern count
+    try:
+        # SQLite counts by scanning the smallest covering index
+        # (idx_patterns_timestamp) rather than the full table rows
+        cursor.execute('SELECT COUNT(*) FROM patterns')
+        count = cursor.fetchone()[0]
+        print(f'\nTotal patterns in DB: {count}')
 
-    # Get recent patterns
-    cursor.execute('SELECT * FROM patterns ORDER BY timestamp DESC LIMIT 5')
-    rows = cursor.fetchall()
-    print(f'\nRecent 5 patterns:')
-    for row in rows:
-        print(row)
-except Exception as e:
-    print(f'Error querying patterns: {e}')
-
-conn.close()
+        # Get recent patterns (index seek on idx_patterns_timestamp, no sort)
+        cursor.execute('SELECT * FROM patterns ORDER BY timestamp DESC LIMIT 5')
+        rows = cursor.fetchmany(5)
+        print(f'\nRecent 5 patterns:')
+        for row in rows:
+            print(row)
+    except Exception as e:
+        print(f'Error querying patterns: {e}')
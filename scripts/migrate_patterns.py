@@ -9,6 +9,14 @@ logging.basicConfig(level=logging.INFO)
 conn = sqlite3.connect('mycelial_patterns.db')
 cursor = conn.cursor()
 
+# Bulk-migration pragmas: WAL group commits instead of an fsync per statement,
+# temp B-trees in memory, and a large page cache / mmap window for the scans
+cursor.execute("PRAGMA journal_mode=WAL")
+cursor.execute("PRAGMA synchronous=NORMAL")
+cursor.execute("PRAGMA temp_store=MEMORY")
+cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+cursor.execute("PRAGMA cache_size=-200000")   # ~200 MB
+
 try:
     # Add new columns
     cursor.execute("ALTER TABLE patterns ADD COLUMN moat TEXT DEFAULT 'Finance'")
@@ -26,11 +34,39 @@ except Exception as e:
 # Agent ID 22 is CorpDataMiner (Corporations moat)
 # Agent IDs 23+ are SwarmBrains (mixed)
 
-cursor.execute("UPDATE patterns SET moat = 'Finance', product = 'Crypto Markets', signal_type = 'market-data' WHERE agent_id BETWEEN 1 AND 18")
-cursor.execute("UPDATE patterns SET moat = 'Code Innovation', product = 'Code', signal_type = 'repo-data' WHERE agent_id = 19")
-cursor.execute("UPDATE patterns SET moat = 'Logistics', product = 'Logistics', signal_type = 'logistics-data' WHERE agent_id = 20")
-cursor.execute("UPDATE patterns SET moat = 'Government', product = 'Government', signal_type = 'govt-data' WHERE agent_id = 21")
-cursor.execute("UPDATE patterns SET moat = 'US Corporations', product = 'Corporations', signal_type = 'corp-data' WHERE agent_id = 22")
+# Run the whole categorization as one transaction, with an index so each
+# UPDATE seeks its agent_id range instead of walking the table
+cursor.execute("BEGIN")
+cursor.execute("CREATE INDEX IF NOT EXISTS idx_patterns_agent_id ON patterns(agent_id)")
+cursor.execute("CREATE INDEX IF NOT EXISTS idx_patterns_timestamp ON patterns(timestamp DESC)")
+
+# Fixed data engineers (agent IDs 1-22): one pass over the range with CASE
+# instead of five separate UPDATEs
+cursor.execute("""
+    UPDATE patterns
+    SET moat = CASE
+        WHEN agent_id <= 18 THEN 'Finance'
+        WHEN agent_id = 19 THEN 'Code Innovation'
+        WHEN agent_id = 20 THEN 'Logistics'
+        WHEN agent_id = 21 THEN 'Government'
+        ELSE 'US Corporations'
+    END,
+    product = CASE
+        WHEN agent_id <= 18 THEN 'Crypto Markets'
+        WHEN agent_id = 19 THEN 'Code'
+        WHEN agent_id = 20 THEN 'Logistics'
+        WHEN agent_id = 21 THEN 'Government'
+        ELSE 'Corporations'
+    END,
+    signal_type = CASE
+        WHEN agent_id <= 18 THEN 'market-data'
+        WHEN agent_id = 19 THEN 'repo-data'
+        WHEN agent_id = 20 THEN 'logistics-data'
+        WHEN agent_id = 21 THEN 'govt-data'
+        ELSE 'corp-data'
+    END
+    WHERE agent_id BETWEEN 1 AND 22
+""")
 
 # SwarmBrains are distributed across all moats - categorize by modulo
 cursor.execute("""
@@ -20,9 +20,10 @@ def handle_test_message(message: dict):
 def run_test():
     logging.info("--- Starting Redis Backbone Test ---")
 
-    # Create two "agents" (clients)
-    publisher_client = RedisClient()
-    subscriber_client = RedisClient()
+    # Create two "agents" (clients) sharing one connection pool
+    pool = RedisClient.default_pool()
+    publisher_client = RedisClient(pool=pool)
+    subscriber_client = RedisClient(pool=pool)
 
     if not publisher_client.connection or not subscriber_client.connection:
         logging.error("Failed to connect to Redis. Test aborted.")
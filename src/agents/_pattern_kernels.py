@@ -0,0 +1,56 @@
+# src/agents/_pattern_kernels.py - JIT-compiled SwarmBrain policy kernel
+"""
+Numeric core of PatternLearnerAgent.handle_features().
+
+Turns one tick's features into the agent's prediction score, strategy
+vector and trade action in a single call. Compiled with Numba when
+available (see src/storage/_njit.py), plain Python otherwise.
+"""
+
+import numpy as np
+
+from src.storage._njit import njit
+
+
+# Action codes returned by compute_policy
+ACTION_HOLD = 0
+ACTION_BUY = 1
+ACTION_SELL = -1
+
+
+@njit(cache=True, fastmath=True)
+def compute_policy(rsi, mom, atr, rsi_thresh, atr_mult, position_long):
+    """
+    Returns (prediction_score, strategy_vec, action_code).
+
+    prediction_score: confidence rising with momentum and falling with
+        volatility, clipped to 0.1-0.9
+    strategy_vec: [RSI threshold, ATR multiplier, momentum, RSI confidence]
+    action_code: ACTION_BUY to open a long (only when flat, > 80% confident,
+        oversold and rising), ACTION_SELL to exit a long once RSI clears the
+        agent's threshold, otherwise ACTION_HOLD
+    """
+    score = 0.5 + abs(mom) * 2.0 - atr * 0.05
+    if score < 0.1:
+        score = 0.1
+    elif score > 0.9:
+        score = 0.9
+
+    vec = np.empty(4)
+    vec[0] = rsi_thresh
+    vec[1] = atr_mult
+    vec[2] = mom
+    vec[3] = 100.0 - abs(50.0 - rsi) * 2.0  # Higher confidence when extreme RSI
+
+    action = ACTION_HOLD
+    if not position_long:
+        if score > 0.8 and rsi < 30.0 and mom > 0.0:
+            action = ACTION_BUY
+    elif rsi > rsi_thresh:
+        action = ACTION_SELL
+    return score, vec, action
+
+
+def warm_up():
+    """Trigger JIT compilation with dummy features so the first tick skips it"""
+    compute_policy(50.0, 0.0, 1.0, 70.0, 1.0, False)
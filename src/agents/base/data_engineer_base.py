@@ -53,12 +53,30 @@ class DataEngineerBase(MycelialAgent, ABC):
         self.channel = f"{channel_prefix}:{target}"
         self.name = f"{agent_name_prefix}_{self.unique_id}"
 
+        # Bound methods used every step, resolved once instead of per call
+        self._fetch = self._fetch_data
+        self._encode = self.redis_client.encode_message
+        # Publishes go through the model's per-step pipeline when it has one
+        self._publish = getattr(model, 'queue_publish', self.redis_client.publish_raw)
+
         # Caching and rate limiting
+        # last_fetch_time is on the monotonic clock (immune to wall-clock jumps);
+        # starting one interval in the past makes the first step fetch
         self.fetch_interval = fetch_interval
         self.cache_enabled = cache_enabled
-        self.last_fetch_time = 0
+        self.last_fetch_time = time.monotonic() - fetch_interval
         self.cached_data: Optional[Dict] = None
 
+        # Key used as the 'close' proxy; discovered on first use, since the
+        # feature schema is fixed per agent
+        self._close_key: Optional[str] = None
+
+        # Serialized form of the last published cached_data message, split
+        # around its timestamp so republishing only re-encodes the timestamp
+        self._cached_wire_data: Optional[Dict] = None
+        self._cached_wire_prefix: Optional[bytes] = None
+        self._cached_wire_suffix: Optional[bytes] = None
+
         logging.info(
             f"[{self.name}] Initialized | Target: {target} | "
             f"Channel: {self.channel} | "
@@ -76,7 +94,7 @@ class DataEngineerBase(MycelialAgent, ABC):
         3. Publish data to Redis channel
         """
         try:
-            current_time = time.time()
+            current_time = time.monotonic()
 
             # Rate limiting: check if we should fetch new data
             time_since_last_fetch = current_time - self.last_fetch_time
@@ -85,15 +103,16 @@ class DataEngineerBase(MycelialAgent, ABC):
                 # Use cached data if available
                 if self.cached_data:
                     self._publish_cached_data()
-                    logging.debug(
-                        f"[{self.name}] Using cached data "
-                        f"(next fetch in {self.fetch_interval - time_since_last_fetch:.0f}s)"
-                    )
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(
+                            "[%s] Using cached data (next fetch in %.0fs)",
+                            self.name, self.fetch_interval - time_since_last_fetch
+                        )
                 return
 
             # Fetch fresh data
-            logging.debug(f"[{self.name}] Fetching fresh data for {self.target}...")
-            data = self._fetch_data()
+            logging.debug("[%s] Fetching fresh data for %s...", self.name, self.target)
+            data = self._fetch()
 
             if data:
                 # Update cache
@@ -102,7 +121,7 @@ class DataEngineerBase(MycelialAgent, ABC):
                 self.last_fetch_time = current_time
 
                 # Publish to Redis
-                self._publish_data(data)
+                self._publish_data(data, now=time.time())
             else:
                 logging.warning(f"[{self.name}] No data returned from _fetch_data()")
 
@@ -135,7 +154,7 @@ class DataEngineerBase(MycelialAgent, ABC):
         """
         pass
 
-    def _publish_data(self, data: Dict):
+    def _publish_data(self, data: Dict, now: Optional[float] = None):
         """
         Publish enriched data to Redis channel
 
@@ -146,19 +165,27 @@ class DataEngineerBase(MycelialAgent, ABC):
 
         Args:
             data: Enriched feature dictionary from _fetch_data()
+            now: Wall-clock timestamp for the message (default: time.time())
         """
+        timestamp = time.time() if now is None else now
         message = {
             "source": self.name,
-            "timestamp": time.time(),
+            "timestamp": timestamp,
             "features": data
         }
 
-        self.publish(self.channel, message)
+        wire = self._encode(message)
+        self._publish(self.channel, wire)
 
-        logging.debug(
-            f"[{self.name}] Published to {self.channel} | "
-            f"Features: {len(data)} keys"
-        )
+        if data is self.cached_data:
+            # Remember the payload around the timestamp for _publish_cached_data
+            ts_wire = self._encode(timestamp)
+            ts_start = wire.index(ts_wire, wire.index(b'"timestamp":'))
+            self._cached_wire_prefix = wire[:ts_start]
+            self._cached_wire_suffix = wire[ts_start + len(ts_wire):]
+            self._cached_wire_data = data
+
+        logging.debug("[%s] Published to %s | Features: %d keys", self.name, self.channel, len(data))
 
     def _publish_cached_data(self):
         """
@@ -167,8 +194,19 @@ class DataEngineerBase(MycelialAgent, ABC):
         Useful when rate limiting prevents new fetches but downstream
         agents still need recent data.
         """
-        if self.cached_data:
+        if not self.cached_data:
+            return
+
+        if self._cached_wire_data is not self.cached_data:
             self._publish_data(self.cached_data)
+            return
+
+        wire = (
+            self._cached_wire_prefix
+            + self._encode(time.time())
+            + self._cached_wire_suffix
+        )
+        self._publish(self.channel, wire)
 
     def _ensure_feature_compatibility(self, data: Dict) -> Dict:
         """
@@ -183,12 +221,19 @@ class DataEngineerBase(MycelialAgent, ABC):
         Returns:
             data: Same dict with 'close' added if missing
         """
-        if 'close' not in data and len(data) > 0:
-            # Use first numeric value as 'close' proxy
-            for key, value in data.items():
-                if isinstance(value, (int, float)):
-                    data['close'] = value
-                    break
+        if 'close' in data:
+            return data
+
+        if self._close_key is not None and self._close_key in data:
+            data['close'] = data[self._close_key]
+            return data
+
+        # First call (or schema changed): use first numeric value as 'close' proxy
+        for key, value in data.items():
+            if isinstance(value, (int, float)):
+                self._close_key = key
+                data['close'] = value
+                break
 
         return data
 
@@ -199,12 +244,13 @@ class DataEngineerBase(MycelialAgent, ABC):
         Returns:
             dict: Cache statistics
         """
+        time_since_last_fetch = time.monotonic() - self.last_fetch_time
         return {
             "agent": self.name,
             "target": self.target,
             "cache_enabled": self.cache_enabled,
             "has_cached_data": self.cached_data is not None,
-            "time_since_last_fetch": time.time() - self.last_fetch_time,
+            "time_since_last_fetch": time_since_last_fetch,
             "fetch_interval": self.fetch_interval,
-            "next_fetch_in": max(0, self.fetch_interval - (time.time() - self.last_fetch_time))
+            "next_fetch_in": max(0, self.fetch_interval - time_since_last_fetch)
         }
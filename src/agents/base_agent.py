@@ -4,6 +4,13 @@ from src.connectors.redis_client import RedisClient
 from src.connectors.kraken_client import KrakenClient
 import logging
 import random
+import struct
+from typing import Union
+
+# Latest cross-moat signal readings are stored under MOAT_FLOAT_PREFIX + <key>
+# as 4 raw little-endian float32 bytes, so readers skip JSON entirely
+MOAT_FLOAT_PREFIX = "moat-float:"
+MOAT_FLOAT = struct.Struct('<f')
 
 class MycelialAgent(mesa.Agent):
     """
@@ -11,6 +18,11 @@ class MycelialAgent(mesa.Agent):
     It now includes a VectorDB property for long-term memory (Vector Storage).
     Mesa 3.x: unique_id is auto-generated.
     """
+
+    # Agents that only act every N model steps override this; the model skips
+    # their step() call on the ticks in between.
+    step_interval = 1
+
     def __init__(self, model: mesa.Model, **kwargs):
         super().__init__(model, **kwargs)
 
@@ -34,12 +46,109 @@ class MycelialAgent(mesa.Agent):
         """
         raise NotImplementedError("Each agent must implement its own step() method.")
 
-    def publish(self, channel: str, message: dict):
-        """Helper method to publish a message to the network."""
-        logging.debug(f"[{self.name}] Publishing to {channel}")
-        self.redis_client.publish_message(channel, message)
+    def publish(self, channel: Union[str, bytes], message: dict):
+        """
+        Helper method to publish a message to the network.
+        The message is serialized now and, during a model step, queued on the
+        model's publish pipeline so the whole tick goes out in one round trip.
+        `channel` may be a str or pre-encoded bytes (redis-py accepts both).
+        """
+        logging.debug("[%s] Publishing to %s", self.name, channel)
+        queue_publish = getattr(self.model, 'queue_publish', None)
+        if queue_publish is None:
+            self.redis_client.publish_message(channel, message)
+            return
+
+        try:
+            payload = self.redis_client.encode_for_channel(channel, message)
+        except Exception as e:
+            logging.error(f"[{self.name}] Could not serialize message for {channel}: {e}")
+            return
+        queue_publish(channel, payload)
+
+    def publish_encoded(self, channel: Union[str, bytes], payload: bytes):
+        """
+        Publish a message that is already serialized to the JSON wire format
+        (e.g. by a specialized encoder), via the model's publish pipeline.
+        """
+        queue_publish = getattr(self.model, 'queue_publish', None)
+        if queue_publish is None:
+            self.redis_client.publish_raw(channel, payload)
+        else:
+            queue_publish(channel, payload)
+
+    def publish_batch(self, channel_messages):
+        """
+        Publish several messages together. `channel_messages` is a list of
+        (channel, message dict) tuples; all are serialized up front and sent
+        in a single pipelined round trip.
+        """
+        items = []
+        for channel, message in channel_messages:
+            try:
+                items.append((channel, self.redis_client.encode_for_channel(channel, message)))
+            except Exception as e:
+                logging.error(f"[{self.name}] Could not serialize message for {channel}: {e}")
+        if not items:
+            return
+
+        queue_publish_many = getattr(self.model, 'queue_publish_many', None)
+        if queue_publish_many is None:
+            self.redis_client.publish_raw_many(items)
+        else:
+            queue_publish_many(items)
 
     def _register_listener(self, channel: str, callback):
         """Helper method to subscribe to a channel."""
         logging.info(f"[{self.name}] Subscribing to {channel}")
         self.redis_client.subscribe(channel, callback)
+
+    def uses_feature_cache(self) -> bool:
+        """
+        True when this model shares DataMiner features in-process
+        (model.feature_cache), so market data is read in step() via
+        latest_features() instead of subscribing to market-data channels.
+        """
+        return getattr(self.model, 'feature_cache', None) is not None
+
+    def latest_features(self, pair: str):
+        """
+        The pair's newest FeatureSnapshot from model.feature_cache, or None if
+        there is none yet or this agent has already been handed it.
+        """
+        snapshot = self.model.feature_cache.get(pair)
+        if snapshot is None or snapshot is getattr(self, '_seen_feature_snapshot', None):
+            return None
+        self._seen_feature_snapshot = snapshot
+        return snapshot
+
+    def announce_state_change(self):
+        """
+        Notify dashboards that this agent's `agent:<name>` state changed.
+        Subscribers on 'agent.updates' refetch only the announced agent.
+        Goes out with the rest of the tick's publishes when called during a step.
+        """
+        self.publish_encoded("agent.updates", self.name.encode())
+
+    def store_moat_signal(self, key: str, value: float):
+        """
+        Store the latest reading of a cross-moat signal, e.g.
+        "govt-data:US-Federal:policy_stability", for MarketExplorer scans.
+        `value` is normalized to 0-1 by the caller and clamped here.
+        """
+        try:
+            self.vector_db.set(MOAT_FLOAT_PREFIX + key, MOAT_FLOAT.pack(min(max(value, 0.0), 1.0)))
+        except Exception as e:
+            logging.error(f"[{self.name}] Could not store moat signal {key}: {e}")
+
+    def save_state(self, **fields):
+        """
+        Write dashboard-facing state to the `agent:<name>` hash and announce it.
+        Only the given fields are written, so partial updates stay partial.
+        """
+        try:
+            self.vector_db.hset(f"agent:{self.name}", mapping=fields)
+        except Exception as e:
+            logging.error(f"[{self.name}] Could not save agent state: {e}")
+            return
+        self.announce_state_change()
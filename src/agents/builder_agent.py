@@ -5,6 +5,8 @@ from .data_miner_agent import DataMinerAgent
 from .technical_analysis_agent import TechnicalAnalysisAgent
 from .pattern_learner_agent import PatternLearnerAgent
 import time
+import heapq
+from collections import OrderedDict
 
 class BuilderAgent(MycelialAgent):
     """
@@ -31,11 +33,16 @@ class BuilderAgent(MycelialAgent):
         self.consensus_channel = "prospecting-consensus"  # New: MEA consensus
 
         # BIG ROCK 30: Request deduplication (tool requests)
-        self.tool_request_cache = {}
+        # {tool: request_time}, oldest first. TTL is checked passively on the
+        # requested key only; size is bounded by trimming the oldest entries.
+        self.tool_request_cache = OrderedDict()
         self.request_ttl = 60  # 60-second TTL
+        self.tool_request_cache_max = 4096  # Trim threshold
+        self.tool_request_cache_trim = 1024  # Oldest entries dropped per trim
 
         # BIG ROCK 43: Deployment tracking
         self.recent_deployments = {}  # {pair: timestamp}
+        self._deploy_heap = []  # [(cooldown_expiry, pair)] min-heap for evicting recent_deployments
         self.deployment_cooldown = 3600  # 1 hour cooldown per pair
         self.max_active_assets = 15  # Q3: Hard limit
 
@@ -82,6 +89,10 @@ class BuilderAgent(MycelialAgent):
                 f"Team: {team_type} | Votes: {votes} | Confidence: {confidence:.2%}"
             )
 
+            # Drop deployments whose cooldown has ended so the dict stays bounded
+            current_time = time.time()
+            self._expire_deployments(current_time)
+
             # Q3: Check if we're at capacity
             current_asset_count = len(getattr(self.model, 'active_assets', {}))
             if current_asset_count >= self.max_active_assets:
@@ -93,7 +104,6 @@ class BuilderAgent(MycelialAgent):
                 return
 
             # Check deployment cooldown (prevent duplicate deployments)
-            current_time = time.time()
             if pair in self.recent_deployments:
                 time_since_deploy = current_time - self.recent_deployments[pair]
                 if time_since_deploy < self.deployment_cooldown:
@@ -105,7 +115,7 @@ class BuilderAgent(MycelialAgent):
 
             # Check if already active (in case model.active_assets exists)
             if hasattr(self.model, 'active_assets') and pair in self.model.active_assets:
-                logging.debug(f"[{self.name}] {pair} already active, skipping deployment")
+                logging.debug("[%s] %s already active, skipping deployment", self.name, pair)
                 return
 
             # 🚀 DEPLOY AGENT TEAMS
@@ -119,6 +129,7 @@ class BuilderAgent(MycelialAgent):
                 self.successful_deployments += 1
                 self.total_deployments += 1
                 self.recent_deployments[pair] = current_time
+                heapq.heappush(self._deploy_heap, (current_time + self.deployment_cooldown, pair))
 
                 # Register with model (if model has active_assets tracking)
                 if hasattr(self.model, 'register_active_asset'):
@@ -135,6 +146,16 @@ class BuilderAgent(MycelialAgent):
         except Exception as e:
             logging.error(f"[{self.name}] Error handling consensus: {e}", exc_info=True)
 
+    def _expire_deployments(self, current_time: float):
+        """Pop expired cooldowns off the heap and forget those deployments"""
+        heap = self._deploy_heap
+        while heap and heap[0][0] <= current_time:
+            _, pair = heapq.heappop(heap)
+            # Only forget the pair if it wasn't redeployed since this entry was pushed
+            deployed_at = self.recent_deployments.get(pair)
+            if deployed_at is not None and current_time - deployed_at >= self.deployment_cooldown:
+                del self.recent_deployments[pair]
+
     def _deploy_agent_teams(self, pair: str, team_type: str, confidence: float) -> bool:
         """
         BIG ROCK 43: Spawn complete agent ecosystem for new asset
@@ -149,7 +170,9 @@ class BuilderAgent(MycelialAgent):
         Returns: True if successful, False if failed
         """
         try:
-            new_agents = []
+            # Mesa 3.x registers each agent with model.agents when it is
+            # constructed, so the team is built first and only handed to a
+            # legacy scheduler (if the model has one) in a single call.
 
             # 1. Deploy DataMinerAgent (market data source)
             logging.info(f"[{self.name}]   → Deploying DataMiner for {pair}")
@@ -158,24 +181,22 @@ class BuilderAgent(MycelialAgent):
                 pair_to_watch=pair,
                 period=14  # Default TA period
             )
-            new_agents.append(miner)
-            self.model.schedule.add(miner)
 
             # 2. Deploy TAA Team (3 agents for Rule of 3 baseline)
             logging.info(f"[{self.name}]   → Deploying 3x TA team for {pair}")
-            for team_id in [1, 2, 3]:
-                taa = TechnicalAnalysisAgent(
+            ta_team = [
+                TechnicalAnalysisAgent(
                     self.model,
                     pair_to_watch=pair,
                     team_id=team_id
                 )
-                new_agents.append(taa)
-                self.model.schedule.add(taa)
+                for team_id in (1, 2, 3)
+            ]
 
             # 3. Deploy PatternLearner Swarm (15 agents)
             logging.info(f"[{self.name}]   → Deploying 15x PatternLearner swarm for {pair}")
-            for i in range(15):
-                learner = PatternLearnerAgent(
+            learners = [
+                PatternLearnerAgent(
                     self.model,
                     pair_to_trade=pair,
                     product_focus="Finance",  # All focus on Finance for trading
@@ -184,8 +205,18 @@ class BuilderAgent(MycelialAgent):
                     parent_id=None,
                     generation=0
                 )
-                new_agents.append(learner)
-                self.model.schedule.add(learner)
+                for _ in range(15)
+            ]
+
+            new_agents = [miner, *ta_team, *learners]
+
+            schedule = getattr(self.model, 'schedule', None)
+            if schedule is not None:
+                if hasattr(schedule, 'add_many'):
+                    schedule.add_many(new_agents)
+                else:
+                    for agent in new_agents:
+                        schedule.add(agent)
 
             # Verify all agents registered
             agent_count = len(new_agents)
@@ -223,25 +254,26 @@ class BuilderAgent(MycelialAgent):
         # BIG ROCK 30: Deduplication check
         current_time = time.time()
 
-        # Clean up expired cache entries
-        expired_tools = [
-            tool for tool, timestamp in self.tool_request_cache.items()
-            if current_time - timestamp > self.request_ttl
-        ]
-        for tool in expired_tools:
-            del self.tool_request_cache[tool]
-
-        # Check if this tool was recently requested
-        if tool_needed in self.tool_request_cache:
-            time_since_last = current_time - self.tool_request_cache[tool_needed]
-            logging.debug(
-                f"[{self.name}] Duplicate tool request for {tool_needed} ignored "
-                f"(last request {time_since_last:.1f}s ago)"
-            )
-            return
+        # Check if this tool was recently requested (passive TTL: only this key)
+        cache = self.tool_request_cache
+        last_request = cache.get(tool_needed)
+        if last_request is not None:
+            time_since_last = current_time - last_request
+            if time_since_last <= self.request_ttl:
+                logging.debug(
+                    "[%s] Duplicate tool request for %s ignored (last request %.1fs ago)",
+                    self.name, tool_needed, time_since_last
+                )
+                return
+            # Expired - drop it so the fresh request is re-inserted as newest
+            del cache[tool_needed]
 
         # New unique request - process and cache it
-        self.tool_request_cache[tool_needed] = current_time
+        cache[tool_needed] = current_time
+        if len(cache) > self.tool_request_cache_max:
+            # Rare bulk trim of the oldest requests keeps the dict bounded
+            for _ in range(self.tool_request_cache_trim):
+                cache.popitem(last=False)
 
         logging.critical(f"[{self.name}] 🔧 TOOL BUILD REQUEST RECEIVED! 🔧")
         logging.critical(f"[{self.name}] TARGET: {tool_needed}")
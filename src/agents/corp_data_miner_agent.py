@@ -2,7 +2,11 @@
 import logging
 from .base_agent import MycelialAgent
 import time
-import random
+import numpy as np
+
+# Sampling bounds for (EarningsMomentum, MandA_Activity, MarketCapVelocity)
+_FEATURE_LOW = np.array([-10.0, 0.0, -5.0])
+_FEATURE_HIGH = np.array([10.0, 20.0, 5.0])
 
 class CorpDataMinerAgent(MycelialAgent):
     """
@@ -14,7 +18,9 @@ class CorpDataMinerAgent(MycelialAgent):
         super().__init__(model)
         self.target = target_sector
         self.channel = f"corp-data:{self.target}"
+        self._moat_key = f"{self.channel}:MA_Activity"
         self.name = f"CorpDataMiner_{self.unique_id}"
+        self._rng = np.random.default_rng()  # Per-agent PCG64 stream
         logging.info(f"[{self.name}] Initialized. Watching Corporate Intelligence for {self.target} sector.")
 
     def step(self):
@@ -23,9 +29,12 @@ class CorpDataMinerAgent(MycelialAgent):
         """
         try:
             # --- Simulate Unique Corporate Data Moat Features ---
-            earnings_momentum = random.uniform(-10.0, 10.0)  # Negative = declining, positive = growing
-            ma_activity = random.uniform(0.0, 20.0)  # M&A deals per quarter
-            market_cap_velocity = random.uniform(-5.0, 5.0)  # % change in market cap
+            # One vectorized draw for all three features:
+            # earnings momentum (negative = declining, positive = growing),
+            # M&A deals per quarter, % change in market cap
+            earnings_momentum, ma_activity, market_cap_velocity = (
+                self._rng.uniform(_FEATURE_LOW, _FEATURE_HIGH).tolist()
+            )
 
             # --- Simulated Data for the Pattern Swarm ---
             enriched_data = {
@@ -43,6 +52,8 @@ class CorpDataMinerAgent(MycelialAgent):
             }
             # Publish to the network for the Swarm to analyze
             self.publish(self.channel, message)
+            # Corporate moat reading for MarketExplorer (0-1)
+            self.store_moat_signal(self._moat_key, ma_activity / _FEATURE_HIGH[1])
 
         except Exception as e:
             logging.error(f"[{self.name}] Error in step: {e}")
@@ -1,37 +1,112 @@
 # src/agents/data_miner_agent.py
 import logging
 from .base_agent import MycelialAgent
+import math
 import time
-import pandas as pd
+from dataclasses import dataclass
 import numpy as np
+from src.storage._njit import njit
 
-# --- Technical Indicator Calculations (New) ---
-def calculate_features(df: pd.DataFrame, period=14):
-    """Calculates common technical features (RSI, ATR, MOM) on a DataFrame of closing prices."""
-    if df.empty or len(df) < period + 1:
-        return None
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+if MSGSPEC_AVAILABLE:
+    class MarketMsg(msgspec.Struct):
+        """Fixed-shape market-data message; encodes to the same JSON as the dict form"""
+        source: str
+        pair: str
+        timestamp: float
+        features: dict
+
+    _MARKET_MSG_ENCODER = msgspec.json.Encoder()
 
-    # Calculate Price Change
-    delta = df['close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+# Closes closer than this are treated as unchanged
+CLOSE_EPSILON = 1e-6
+# Max seconds an unchanged close goes without being republished
+UNCHANGED_REPUBLISH_INTERVAL = 5.0
+
+
+@dataclass(slots=True)
+class FeatureSnapshot:
+    """
+    Latest enriched tick for a pair, shared in-process via model.feature_cache.
+    `features` is the dict that is also published, so readers must not mutate it.
+    """
+    timestamp: float
+    features: dict
 
-    # Calculate RSI
-    rs = gain / loss
-    df['RSI'] = 100 - (100 / (1 + rs))
 
-    # Calculate ATR (Approximate method using High/Low/PrevClose)
-    high_low = df['high'] - df['low']
-    high_close = np.abs(df['high'] - df['close'].shift())
-    low_close = np.abs(df['low'] - df['close'].shift())
-    ranges = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    df['ATR'] = ranges.ewm(span=period, adjust=False).mean()
+# --- Technical Indicator Calculations (New) ---
+# fastmath without the no-NaN/no-Inf assumptions: RSI is legitimately 100/NaN
+# when there are no losing ticks in the window
+# nogil: DataMiners step on the model's I/O thread pool, so compiled feature
+# calculations for different pairs can run in parallel
+@njit(cache=True, nogil=True, fastmath={'reassoc', 'contract', 'arcp', 'nsz'})
+def _features_core(close, high, low, period):
+    """Latest (RSI, ATR, MOM) for oldest-to-newest float64 price arrays"""
+    n = close.shape[0]
+
+    # Calculate RSI (simple average gain/loss over the last `period` changes)
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        change = close[i] - close[i - 1]
+        if change > 0.0:
+            gain += change
+        else:
+            loss -= change
+    if loss > 0.0:
+        rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+    elif gain > 0.0:
+        rsi = 100.0
+    else:
+        rsi = np.nan
+
+    # Calculate ATR (Approximate method using High/Low/PrevClose):
+    # EWM (span=period, adjust=False) of the true range, seeded with the first
+    # bar's high - low since it has no previous close
+    alpha = 2.0 / (period + 1)
+    atr = high[0] - low[0]
+    for i in range(1, n):
+        tr = high[i] - low[i]
+        tr = max(tr, abs(high[i] - close[i - 1]))
+        tr = max(tr, abs(low[i] - close[i - 1]))
+        atr = alpha * tr + (1.0 - alpha) * atr
 
     # Calculate Momentum (Simple Rate of Change)
-    df['MOM'] = df['close'].pct_change(periods=5) # 5-period rate of change
+    mom = close[n - 1] / close[n - 6] - 1.0 if n > 5 else np.nan # 5-period rate of change
+
+    return rsi, atr, mom
+
+
+def calculate_features(close: np.ndarray, high: np.ndarray, low: np.ndarray, period=14):
+    """
+    Calculates common technical features (RSI, ATR, MOM) on oldest-to-newest
+    close/high/low price arrays (e.g. the views returned by DataMinerAgent._history()).
+    Only the latest value of each feature is needed, so it's computed in one
+    pass by the (Numba-compiled, when available) _features_core kernel.
+    """
+    if len(close) < period + 1:
+        return None
+
+    rsi, atr, mom = _features_core(close, high, low, period)
 
     # Return only the latest, enriched data point
-    return df.iloc[-1].to_dict()
+    features = {
+        'close': float(close[-1]),
+        'high': float(high[-1]),
+        'low': float(low[-1])
+    }
+    # Undefined indicators (e.g. RSI over a flat window) are left out rather
+    # than sent as NaN: orjson/msgspec would encode them as null, and
+    # consumers already fall back to a default for a missing feature
+    for name, value in (('RSI', rsi), ('ATR', atr), ('MOM', mom)):
+        if math.isfinite(value):
+            features[name] = float(value)
+    return features
 
 class DataMinerAgent(MycelialAgent):
     """
@@ -39,21 +114,63 @@ class DataMinerAgent(MycelialAgent):
     and publishes the rich feature set to the Redis network.
     It is the system's "Data Engineer."
     """
-    def __init__(self, model, pair_to_watch: str):
+    def __init__(self, model, pair_to_watch: str, period: int = 14):
         super().__init__(model)
         self.pair = pair_to_watch
         self.channel = f"market-data:{self.pair.replace('/', '-')}"
+        self._channel_b = self.channel.encode() # Pre-encoded for the publish pipeline
         self.name = f"DataEngineer_{self.unique_id}" # Simplified name
         logging.info(f"[{self.name}] Initialized. Watching {self.pair} on channel {self.channel}")
 
-        # Data storage buffer for calculating features (needs high, low, close)
-        self.history_buffer = pd.DataFrame(columns=['close', 'high', 'low'])
-        self.period = 14 # Standard period for calculations
+        self.period = period # Standard period for calculations (default 14)
+
+        # Ring buffers for calculating features (needs high, low, close).
+        # Each value is written twice (at cursor and cursor + buffer_size) so the
+        # latest window is always one contiguous slice, no copy or reorder needed.
+        self.buffer_size = self.period * 3 # period * 3 for stability
+        self.close_buf = np.empty(self.buffer_size * 2, dtype=np.float64)
+        self.high_buf = np.empty(self.buffer_size * 2, dtype=np.float64)
+        self.low_buf = np.empty(self.buffer_size * 2, dtype=np.float64)
+        self.cursor = 0 # Next write position
+        self.filled = 0 # Number of valid entries (saturates at buffer_size)
+
+        # Quiet-market coalescing: an unchanged close is republished at most
+        # every UNCHANGED_REPUBLISH_INTERVAL seconds
+        self._last_close = None
+        self._last_pub_ts = 0.0
+
+        # Reused outgoing message; step() only fills in timestamp and features.
+        # Safe because publishing encodes it to bytes before returning.
+        if MSGSPEC_AVAILABLE:
+            self._msg_skeleton = MarketMsg(self.name, self.pair, 0.0, None)
+        else:
+            self._msg_skeleton = {"source": self.name, "pair": self.pair, "timestamp": 0.0, "features": None}
+
+    def _append_prices(self, close_price: float, high_price: float, low_price: float):
+        """Write one tick into the ring buffers"""
+        i = self.cursor
+        j = i + self.buffer_size
+        self.close_buf[i] = self.close_buf[j] = close_price
+        self.high_buf[i] = self.high_buf[j] = high_price
+        self.low_buf[i] = self.low_buf[j] = low_price
+        self.cursor = (i + 1) % self.buffer_size
+        if self.filled < self.buffer_size:
+            self.filled += 1
+
+    def _history(self):
+        """Oldest-to-newest (close, high, low) views over the filled part of the buffer"""
+        end = self.cursor + self.buffer_size if self.cursor else self.buffer_size * 2
+        window = slice(end - self.filled, end)
+        return self.close_buf[window], self.high_buf[window], self.low_buf[window]
 
     def step(self):
-        logging.debug(f"[{self.name}] Fetching market data for {self.pair}...")
+        logging.debug("[%s] Fetching market data for %s...", self.name, self.pair)
         try:
-            market_data = self.kraken_client.get_market_data(self.pair)
+            # Use the model's per-tick batch snapshot; fetch directly only if
+            # this pair is missing from it
+            market_data = getattr(self.model, 'ticker_snapshot', {}).get(self.pair)
+            if not market_data:
+                market_data = self.kraken_client.get_market_data(self.pair)
 
             if market_data and 'c' in market_data:
                 # 1. Extract raw prices (Kraken data is nested)
@@ -61,33 +178,43 @@ class DataMinerAgent(MycelialAgent):
                 high_price = float(market_data['h'][0])
                 low_price = float(market_data['l'][0])
 
-                # 2. Add raw prices to history buffer
-                new_row = pd.DataFrame({
-                    'close': [close_price],
-                    'high': [high_price],
-                    'low': [low_price]
-                })
-                self.history_buffer = pd.concat([self.history_buffer, new_row], ignore_index=True)
+                # 2. Add raw prices to history buffer (oldest entry is overwritten once full)
+                self._append_prices(close_price, high_price, low_price)
 
-                # Maintain buffer size (period * 3 for stability)
-                if len(self.history_buffer) > self.period * 3:
-                    self.history_buffer = self.history_buffer.iloc[-(self.period * 3):].reset_index(drop=True)
+                # Skip the publish if the last trade price hasn't moved and subscribers
+                # heard from us recently (the buffer still records the tick)
+                now = time.time()
+                if (self._last_close is not None
+                        and abs(close_price - self._last_close) < CLOSE_EPSILON
+                        and now - self._last_pub_ts < UNCHANGED_REPUBLISH_INTERVAL):
+                    return
 
                 # 3. Calculate enriched features
-                enriched_data = calculate_features(self.history_buffer, self.period)
+                enriched_data = calculate_features(*self._history(), self.period)
 
                 if enriched_data:
-                    # Prepare the message with full feature set
-                    message = {
-                        "source": self.name,
-                        "pair": self.pair,
-                        "timestamp": time.time(),
-                        "features": enriched_data # This is the rich data moat
-                    }
-                    # 4. Publish enriched data
-                    self.publish(self.channel, message)
+                    self._last_close = close_price
+                    self._last_pub_ts = now
+
+                    # Same-process TA agents and SwarmBrains read the latest
+                    # features from the model instead of a Redis round trip
+                    feature_cache = getattr(self.model, 'feature_cache', None)
+                    if feature_cache is not None:
+                        feature_cache[self.pair] = FeatureSnapshot(now, enriched_data)
+
+                    # 4. Publish enriched data (the full feature set is the rich data moat)
+                    message = self._msg_skeleton
+                    if MSGSPEC_AVAILABLE:
+                        # Fixed message shape: the Struct encoder skips per-key type dispatch
+                        message.timestamp = now
+                        message.features = enriched_data
+                        self.publish_encoded(self._channel_b, _MARKET_MSG_ENCODER.encode(message))
+                    else:
+                        message["timestamp"] = now
+                        message["features"] = enriched_data
+                        self.publish(self._channel_b, message)
                 else:
-                    logging.info(f"[{self.name}] Building history buffer. Length: {len(self.history_buffer)}")
+                    logging.info(f"[{self.name}] Building history buffer. Length: {self.filled}")
 
             else:
                 logging.warning(f"[{self.name}] No market data returned or invalid structure for {self.pair}")
@@ -3,7 +3,70 @@ import logging
 from .base_agent import MycelialAgent
 import time
 import random
-import json
+from collections import deque
+import numpy as np
+from src.storage._njit import njit
+
+# Max queued patterns validated per step; their results go out in one batch
+RESEARCH_BATCH_SIZE = 64
+
+# Narratives below this quality are only built when someone is listening
+NARRATIVE_MIN_QUALITY = 60
+# Validations between refreshes of the narrative listener count
+LISTENER_REFRESH_INTERVAL = 100
+
+# Moat specializations a researcher can be assigned
+_SPECIALIZATIONS = ("Finance", "Code Innovation", "Logistics", "Government", "US Corporations")
+
+# Pre-rolled mixed-decision votes drawn per refill
+VOTE_POOL_SIZE = 4096
+
+# Narrative tiers, in the order of the tier code returned from _score_and_vote
+_TIERS = ("low", "medium", "high")
+
+@njit(cache=True)
+def _score_and_vote(prediction_score, interestingness, pattern_value, tie_vote):
+    """
+    Quality score, narrative tier code (0=low, 1=medium, 2=high) and vote
+    (-1/0/1) for a pattern. tie_vote (uniform over -1/0/1) is used for
+    mid-quality patterns.
+    """
+    quality_score = (prediction_score * 50.0) + (interestingness * 0.3) + (pattern_value * 0.2)
+
+    if quality_score > 80.0:
+        tier = 2
+    elif quality_score > 60.0:
+        tier = 1
+    else:
+        tier = 0
+
+    # Vote with bias toward high-quality patterns
+    if quality_score > 80.0:
+        vote = 1  # Approve
+    elif quality_score < 50.0:
+        vote = -1  # Reject
+    else:
+        vote = tie_vote  # Mixed decision
+    return quality_score, tier, vote
+
+# Fallback when a specialization/tier has no template
+_DEFAULT_NARRATIVE = "synthesized an unclassified pattern (Quality: {quality_score:.1f}/100) requiring additional research."
+
+# Positional arguments of every compiled narrative formatter
+_NARRATIVE_FIELDS = (
+    "RSI", "RSI_band", "ATR", "MOM", "close",
+    "prediction_pct", "pattern_value", "interestingness", "quality_score"
+)
+
+def _compile_narrative(template: str):
+    """
+    Turn a narrative format string into a function taking _NARRATIVE_FIELDS
+    positionally and evaluating the template as an f-string. Templates are
+    module constants; pattern values only ever arrive as arguments.
+    """
+    return eval(f"lambda {', '.join(_NARRATIVE_FIELDS)}: f{template!r}")
+
+_DEFAULT_FORMATTER = _compile_narrative(_DEFAULT_NARRATIVE)
 
 class DeepResearchAgent(MycelialAgent):
     """
@@ -17,21 +80,49 @@ class DeepResearchAgent(MycelialAgent):
     - Synthesizes high-value narrative based on moat specialization
     - Results published to Redis for consensus aggregation and dashboard display
     """
+    # BIG ROCK 33: Moat-specific narrative templates, keyed by (specialization, tier).
+    # Plain format strings, so only the chosen one is ever formatted.
+    _NARRATIVE_TEMPLATES = {
+        ("Finance", "high"): "discovered a **critical arbitrage signal** linking Capital Flow Momentum (RSI: {RSI:.1f}) with sudden Government Policy shifts. Prediction confidence: {prediction_pct:.1f}%.",
+        ("Finance", "medium"): "identified a **moderate correlation** between Market Volatility (ATR: {ATR:.2f}) and emerging regulatory patterns. Pattern strength: {pattern_value:.1f}/100.",
+        ("Finance", "low"): "flagged a **weak signal** in price momentum ({MOM:.4f}) that may warrant continued monitoring.",
+        ("Code Innovation", "high"): "validated an **emergent breakthrough** where Repository Novelty Spikes precede systemic risk drops in Logistics by 72 hours. Confidence: {prediction_pct:.1f}%.",
+        ("Code Innovation", "medium"): "confirmed a **moderate pattern** linking Python commit frequency with cross-sector innovation diffusion. Interestingness: {interestingness:.1f}/100.",
+        ("Code Innovation", "low"): "noted a **preliminary trend** in open-source activity that may indicate early-stage innovation cycles.",
+        ("Logistics", "high"): "identified a **robust anomaly** linking Supply Chain Congestion decay with predictable {close:.2f} USD spikes in Corporate sector activity. High confidence.",
+        ("Logistics", "medium"): "detected a **significant pattern** in routing efficiency metrics correlating with Logistics sector volatility (ATR: {ATR:.2f}).",
+        ("Logistics", "low"): "observed a **marginal shift** in logistics flow patterns that warrants further investigation.",
+        ("Government", "high"): "confirmed a **major regulatory signal** linking Policy Intensity Index with high-confidence (>{prediction_pct:.0f}%) collective SwarmBrain consensus shifts.",
+        ("Government", "medium"): "validated a **moderate correlation** between Federal Policy updates and {interestingness:.0f}-point interestingness spikes across Finance agents.",
+        ("Government", "low"): "flagged a **weak regulatory indicator** in the {RSI_band:.0f} RSI band that may precede policy changes.",
+        ("US Corporations", "high"): "isolated a **key leading indicator**: Tech Sector Index drops (RSI: {RSI:.1f}) immediately trigger consensus shifts in Finance Moat ({prediction_pct:.1f}% confidence).",
+        ("US Corporations", "medium"): "identified a **moderate trend** where Corporate Earnings volatility (ATR: {ATR:.2f}) precedes Swarm strategy adjustments.",
+        ("US Corporations", "low"): "noted a **preliminary correlation** between sector rotation patterns and interestingness scores ({interestingness:.0f}/100)."
+    }
+    _NARRATIVE_FORMATTERS = {key: _compile_narrative(t) for key, t in _NARRATIVE_TEMPLATES.items()}
+
     def __init__(self, model):
         super().__init__(model)
         self.name = f"Research_{self.unique_id}"
-        self.research_queue = []  # Patterns awaiting validation
+        self.research_queue = deque()  # Patterns awaiting validation (FIFO)
         self.total_patterns_validated = 0
         self.validation_results = {"approved": 0, "neutral": 0, "rejected": 0}
+        self._narrative_listeners = None  # Cached subscriber count for pattern-narrative
 
         # BIG ROCK 33: Moat Specialization for narrative generation
-        self.specialization = random.choice([
-            "Finance",
-            "Code Innovation",
-            "Logistics",
-            "Government",
-            "US Corporations"
-        ])
+        self.specialization = random.choice(_SPECIALIZATIONS)
+        # Compiled formatters for this specialization, indexed by tier code
+        self._my_formatters = tuple(
+            self._NARRATIVE_FORMATTERS.get((self.specialization, tier), _DEFAULT_FORMATTER)
+            for tier in _TIERS
+        )
+        # Fixed part of the narrative header that follows the pattern id
+        self._narrative_prefix = f" ({self.specialization} Moat):** {self.name} "
+
+        # Mixed-decision votes, pre-rolled in bulk and refilled when used up
+        self._rng = np.random.default_rng()
+        self._vote_pool = None
+        self._vote_i = VOTE_POOL_SIZE
 
         # Listen for pattern validation requests
         self._register_listener("pattern-validation-request", self.handle_validation_request)
@@ -39,10 +130,15 @@ class DeepResearchAgent(MycelialAgent):
         logging.info(f"[{self.name}] Initialized. Redundant validation active (Specialization: {self.specialization})")
 
     def step(self):
-        """Process research queue."""
-        if self.research_queue:
-            pattern_info = self.research_queue.pop(0)
-            self._validate_pattern(pattern_info)
+        """Process research queue, publishing the whole batch's results at once."""
+        if not self.research_queue:
+            return
+
+        outbox = []
+        for _ in range(min(RESEARCH_BATCH_SIZE, len(self.research_queue))):
+            outbox.extend(self._validate_pattern(self.research_queue.popleft()))
+        if outbox:
+            self.publish_batch(outbox)
 
     def handle_validation_request(self, message: dict):
         """
@@ -57,96 +153,77 @@ class DeepResearchAgent(MycelialAgent):
                 'data': pattern_data,
                 'received_at': time.time()
             })
-            logging.debug(f"[{self.name}] Pattern {pattern_id} queued for validation (queue size: {len(self.research_queue)})")
+            logging.debug("[%s] Pattern %s queued for validation (queue size: %d)", self.name, pattern_id, len(self.research_queue))
 
-    def _generate_narrative(self, pattern_id, pattern_data):
+    def _generate_narrative(self, pattern_id, quality_score, tier, prediction_score,
+                            interestingness, pattern_value, raw_features):
         """
         BIG ROCK 33: Synthesize a high-value, human-readable pattern story.
         Generates narratives based on moat specialization and pattern characteristics.
+        Takes the metrics and quality score/tier already computed by _validate_pattern.
         """
-        # Extract pattern metrics
-        prediction_score = pattern_data.get('prediction_score', 0.5)
-        interestingness = pattern_data.get('interestingness_score', 50)
-        pattern_value = pattern_data.get('pattern_value', 50)
-        raw_features = pattern_data.get('raw_features', {})
-
-        # Moat-specific narrative templates
-        moat_narratives = {
-            "Finance": {
-                "high": f"discovered a **critical arbitrage signal** linking Capital Flow Momentum (RSI: {raw_features.get('RSI', 0):.1f}) with sudden Government Policy shifts. Prediction confidence: {prediction_score*100:.1f}%.",
-                "medium": f"identified a **moderate correlation** between Market Volatility (ATR: {raw_features.get('ATR', 0):.2f}) and emerging regulatory patterns. Pattern strength: {pattern_value:.1f}/100.",
-                "low": f"flagged a **weak signal** in price momentum ({raw_features.get('MOM', 0):.4f}) that may warrant continued monitoring."
-            },
-            "Code Innovation": {
-                "high": f"validated an **emergent breakthrough** where Repository Novelty Spikes precede systemic risk drops in Logistics by 72 hours. Confidence: {prediction_score*100:.1f}%.",
-                "medium": f"confirmed a **moderate pattern** linking Python commit frequency with cross-sector innovation diffusion. Interestingness: {interestingness:.1f}/100.",
-                "low": f"noted a **preliminary trend** in open-source activity that may indicate early-stage innovation cycles."
-            },
-            "Logistics": {
-                "high": f"identified a **robust anomaly** linking Supply Chain Congestion decay with predictable {raw_features.get('close', 0):.2f} USD spikes in Corporate sector activity. High confidence.",
-                "medium": f"detected a **significant pattern** in routing efficiency metrics correlating with {self.specialization} sector volatility (ATR: {raw_features.get('ATR', 0):.2f}).",
-                "low": f"observed a **marginal shift** in logistics flow patterns that warrants further investigation."
-            },
-            "Government": {
-                "high": f"confirmed a **major regulatory signal** linking Policy Intensity Index with high-confidence (>{prediction_score*100:.0f}%) collective SwarmBrain consensus shifts.",
-                "medium": f"validated a **moderate correlation** between Federal Policy updates and {interestingness:.0f}-point interestingness spikes across Finance agents.",
-                "low": f"flagged a **weak regulatory indicator** in the {raw_features.get('RSI', 50):.0f} RSI band that may precede policy changes."
-            },
-            "US Corporations": {
-                "high": f"isolated a **key leading indicator**: Tech Sector Index drops (RSI: {raw_features.get('RSI', 0):.1f}) immediately trigger consensus shifts in Finance Moat ({prediction_score*100:.1f}% confidence).",
-                "medium": f"identified a **moderate trend** where Corporate Earnings volatility (ATR: {raw_features.get('ATR', 0):.2f}) precedes Swarm strategy adjustments.",
-                "low": f"noted a **preliminary correlation** between sector rotation patterns and interestingness scores ({interestingness:.0f}/100)."
-            }
-        }
-
-        # Determine narrative quality tier based on combined metrics
-        quality_score = (prediction_score * 50) + (interestingness * 0.3) + (pattern_value * 0.2)
-
-        if quality_score > 80:
-            tier = "high"
-        elif quality_score > 60:
-            tier = "medium"
-        else:
-            tier = "low"
-
-        # Select narrative template
-        narrative_text = moat_narratives.get(self.specialization, {}).get(
-            tier,
-            f"synthesized an unclassified pattern (Quality: {quality_score:.1f}/100) requiring additional research."
+        # Fill in only the selected template
+        narrative_text = self._my_formatters[tier](
+            raw_features.get('RSI', 0),
+            raw_features.get('RSI', 50),
+            raw_features.get('ATR', 0),
+            raw_features.get('MOM', 0),
+            raw_features.get('close', 0),
+            prediction_score * 100,
+            pattern_value,
+            interestingness,
+            quality_score
         )
 
         # Format final narrative with pattern ID and agent signature
-        narrative = f"🔮 **PATTERN {pattern_id} ({self.specialization} Moat):** {self.name} {narrative_text}"
+        return "🔮 **PATTERN " + str(pattern_id) + self._narrative_prefix + narrative_text
+
+    def _next_tie_vote(self) -> int:
+        if self._vote_i >= VOTE_POOL_SIZE:
+            self._vote_pool = self._rng.integers(-1, 2, size=VOTE_POOL_SIZE, dtype=np.int8).tolist()
+            self._vote_i = 0
+        vote = self._vote_pool[self._vote_i]
+        self._vote_i += 1
+        return vote
 
-        return narrative
+    def _has_narrative_listeners(self) -> bool:
+        """
+        Whether anything subscribes to pattern-narrative, refreshed every
+        LISTENER_REFRESH_INTERVAL validations. The dashboard uses PSUBSCRIBE,
+        which NUMSUB doesn't count, so any pattern subscription counts too.
+        """
+        if self._narrative_listeners is None or self.total_patterns_validated % LISTENER_REFRESH_INTERVAL == 0:
+            try:
+                conn = self.redis_client.connection
+                self._narrative_listeners = conn.pubsub_numsub("pattern-narrative")[0][1] + conn.pubsub_numpat()
+            except Exception as e:
+                logging.warning(f"[{self.name}] Could not check narrative subscribers: {e}")
+                self._narrative_listeners = 1  # Assume someone is listening
+        return self._narrative_listeners > 0
 
     def _validate_pattern(self, pattern_info):
         """
         Validate a pattern using redundant research methodology and generate narrative.
         BIG ROCK 33: Now publishes rich narratives to pattern-narrative channel.
+
+        Returns the (channel, message) pairs to publish; step() sends them in batch.
         """
         try:
-            pattern_id = pattern_info if isinstance(pattern_info, str) else pattern_info.get('id', 'unknown')
-            pattern_data = pattern_info.get('data', {}) if isinstance(pattern_info, dict) else {}
+            # handle_validation_request is the only producer: always {'id', 'data', ...}
+            pattern_id = pattern_info['id']
+            pattern_data = pattern_info['data']
 
             # Simulated validation logic with bias toward approval for high-quality patterns
             prediction_score = pattern_data.get('prediction_score', 0.5)
             interestingness = pattern_data.get('interestingness_score', 50)
             pattern_value = pattern_data.get('pattern_value', 50)
 
-            # Calculate validation confidence based on pattern quality
-            quality_score = (prediction_score * 50) + (interestingness * 0.3) + (pattern_value * 0.2)
-
-            # Vote with bias toward high-quality patterns
-            if quality_score > 80:
-                vote = 1  # Approve
-            elif quality_score < 50:
-                vote = -1  # Reject
-            else:
-                vote = random.choice([-1, 0, 1])  # Mixed decision
+            # Validation confidence and vote (biased toward high-quality patterns)
+            quality_score, tier, vote = _score_and_vote(
+                float(prediction_score), float(interestingness), float(pattern_value), self._next_tie_vote()
+            )
 
-            # BIG ROCK 33: Generate human-readable narrative
-            narrative = self._generate_narrative(pattern_id, pattern_data)
+            now = time.time()  # One timestamp for the result and its narrative
 
             # Record results
             self.total_patterns_validated += 1
@@ -163,10 +240,21 @@ class DeepResearchAgent(MycelialAgent):
                 "pattern_id": pattern_id,
                 "vote": vote,
                 "quality_score": quality_score,
-                "timestamp": time.time(),
+                "timestamp": now,
                 "specialization": self.specialization
             }
-            self.publish("pattern-validation-result", validation_message)
+
+            # Low-quality narratives nobody subscribes to are skipped entirely;
+            # the validation result always goes out for the consensus engine
+            if quality_score < NARRATIVE_MIN_QUALITY and not self._has_narrative_listeners():
+                logging.debug("[%s] Pattern %s validated. Vote: %s (narrative skipped)", self.name, pattern_id, vote)
+                return [("pattern-validation-result", validation_message)]
+
+            # BIG ROCK 33: Generate human-readable narrative
+            narrative = self._generate_narrative(
+                pattern_id, quality_score, tier, prediction_score, interestingness,
+                pattern_value, pattern_data.get('raw_features', {})
+            )
 
             # BIG ROCK 33: Publish narrative to dashboard-displayable channel
             narrative_message = {
@@ -176,18 +264,24 @@ class DeepResearchAgent(MycelialAgent):
                 "vote": vote,
                 "narrative": narrative,
                 "quality_score": quality_score,
-                "timestamp": time.time()
+                "timestamp": now
             }
-            self.publish("pattern-narrative", narrative_message)
 
             if self.total_patterns_validated % 10 == 0:  # Log periodically
-                logging.info(f"[{self.name}] Pattern {pattern_id} validated. Vote: {vote} (quality: {quality_score:.1f}). "
-                           f"Narrative published. Total validations: {self.total_patterns_validated} "
-                           f"(Approved: {self.validation_results['approved']}, "
-                           f"Neutral: {self.validation_results['neutral']}, "
-                           f"Rejected: {self.validation_results['rejected']})")
+                logging.info("[%s] Pattern %s validated. Vote: %s (quality: %.1f). "
+                             "Narrative published. Total validations: %d "
+                             "(Approved: %d, Neutral: %d, Rejected: %d)",
+                             self.name, pattern_id, vote, quality_score, self.total_patterns_validated,
+                             self.validation_results['approved'], self.validation_results['neutral'],
+                             self.validation_results['rejected'])
             else:
-                logging.debug(f"[{self.name}] Pattern {pattern_id} validated. Vote: {vote}. Narrative: {narrative[:80]}...")
+                logging.debug("[%s] Pattern %s validated. Vote: %s. Narrative: %.80s...", self.name, pattern_id, vote, narrative)
+
+            return [
+                ("pattern-validation-result", validation_message),
+                ("pattern-narrative", narrative_message)
+            ]
 
         except Exception as e:
             logging.error(f"[{self.name}] Error validating pattern: {e}")
+            return []
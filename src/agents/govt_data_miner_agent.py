@@ -2,7 +2,13 @@
 import logging
 from .base_agent import MycelialAgent
 import time
-import random
+import numpy as np
+
+# Sampling bounds for (RegulatoryIntensity, PolicyStability, LegislativeVelocity)
+_FEATURE_LOW = np.array([1.0, 0.0, 0.0])
+_FEATURE_HIGH = np.array([10.0, 100.0, 50.0])
+# Steps' worth of feature draws generated per refill
+RANDOM_POOL_SIZE = 1024
 
 class GovtDataMinerAgent(MycelialAgent):
     """
@@ -14,18 +20,32 @@ class GovtDataMinerAgent(MycelialAgent):
         super().__init__(model)
         self.target = target_region
         self.channel = f"govt-data:{self.target}"
+        self._channel_b = self.channel.encode() # Pre-encoded for the publish pipeline
+        self._moat_key = f"{self.channel}:policy_stability"
         self.name = f"GovtDataMiner_{self.unique_id}"
+        self._rng = np.random.default_rng()  # Per-agent PCG64 stream
+        self._pool = None
+        self._pool_idx = RANDOM_POOL_SIZE  # Forces a fill on first step
         logging.info(f"[{self.name}] Initialized. Watching Government Policy for {self.target}.")
 
+    def _next_draw(self):
+        """Next row of pre-drawn features, refilling the pool in one vectorized call when spent"""
+        if self._pool_idx >= RANDOM_POOL_SIZE:
+            self._pool = self._rng.uniform(_FEATURE_LOW, _FEATURE_HIGH, size=(RANDOM_POOL_SIZE, _FEATURE_LOW.size)).tolist()
+            self._pool_idx = 0
+        row = self._pool[self._pool_idx]
+        self._pool_idx += 1
+        return row
+
     def step(self):
         """
         Simulates fetching and enriching government policy data.
         """
         try:
             # --- Simulate Unique Government Data Moat Features ---
-            regulatory_intensity = random.uniform(1.0, 10.0)  # 1=low regulation, 10=high
-            policy_stability = random.uniform(0.0, 100.0)  # 0=unstable, 100=stable
-            legislative_velocity = random.uniform(0.0, 50.0)  # Bills per session
+            # regulatory intensity (1=low regulation, 10=high),
+            # policy stability (0=unstable, 100=stable), bills per session
+            regulatory_intensity, policy_stability, legislative_velocity = self._next_draw()
 
             # --- Simulated Data for the Pattern Swarm ---
             enriched_data = {
@@ -42,7 +62,9 @@ class GovtDataMinerAgent(MycelialAgent):
                 "features": enriched_data
             }
             # Publish to the network for the Swarm to analyze
-            self.publish(self.channel, message)
+            self.publish(self._channel_b, message)
+            # Government moat reading for MarketExplorer (0-1)
+            self.store_moat_signal(self._moat_key, policy_stability / _FEATURE_HIGH[1])
 
         except Exception as e:
             logging.error(f"[{self.name}] Error in step: {e}")
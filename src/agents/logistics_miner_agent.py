@@ -2,7 +2,13 @@
 import logging
 from .base_agent import MycelialAgent
 import time
-import random
+import numpy as np
+
+# Sampling bounds for (CongestionScore, InventoryVelocity)
+_FEATURE_LOW = np.array([1.0, 50.0])
+_FEATURE_HIGH = np.array([10.0, 500.0])
+# Steps' worth of feature draws generated per refill
+RANDOM_POOL_SIZE = 1024
 
 class LogisticsMinerAgent(MycelialAgent):
     """
@@ -14,17 +20,31 @@ class LogisticsMinerAgent(MycelialAgent):
         super().__init__(model)
         self.target = target_region
         self.channel = f"logistics-data:{self.target}"
+        self._channel_b = self.channel.encode() # Pre-encoded for the publish pipeline
+        self._moat_key = f"{self.channel}:inventory_velocity"
         self.name = f"LogisticsMiner_{self.unique_id}"
+        self._rng = np.random.default_rng()  # Per-agent PCG64 stream
+        self._pool = None
+        self._pool_idx = RANDOM_POOL_SIZE  # Forces a fill on first step
         logging.info(f"[{self.name}] Initialized. Watching Logistics Flow for {self.target}.")
 
+    def _next_draw(self):
+        """Next row of pre-drawn features, refilling the pool in one vectorized call when spent"""
+        if self._pool_idx >= RANDOM_POOL_SIZE:
+            self._pool = self._rng.uniform(_FEATURE_LOW, _FEATURE_HIGH, size=(RANDOM_POOL_SIZE, _FEATURE_LOW.size)).tolist()
+            self._pool_idx = 0
+        row = self._pool[self._pool_idx]
+        self._pool_idx += 1
+        return row
+
     def step(self):
         """
         Simulates fetching and enriching logistics flow data.
         """
         try:
             # --- Simulate Unique Data Moat Features ---
-            congestion_score = random.uniform(1.0, 10.0) # 1=low, 10=high
-            inventory_velocity = random.uniform(50.0, 500.0)
+            # congestion score (1=low, 10=high), inventory velocity
+            congestion_score, inventory_velocity = self._next_draw()
 
             # --- Simulated Data for the Pattern Swarm ---
             enriched_data = {
@@ -40,7 +60,12 @@ class LogisticsMinerAgent(MycelialAgent):
                 "features": enriched_data
             }
             # Publish to the network for the Swarm to analyze
-            self.publish(self.channel, message)
+            self.publish(self._channel_b, message)
+            # Logistics moat reading for MarketExplorer (0-1 across the sampled range)
+            self.store_moat_signal(
+                self._moat_key,
+                (inventory_velocity - _FEATURE_LOW[1]) / (_FEATURE_HIGH[1] - _FEATURE_LOW[1])
+            )
 
         except Exception as e:
             logging.error(f"[{self.name}] Error in step: {e}")
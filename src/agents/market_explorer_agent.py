@@ -1,11 +1,117 @@
 # src/agents/market_explorer_agent.py - BIG ROCK 43: The "Rule of 3" Prospecting Engine
 import logging
-from .base_agent import MycelialAgent
+from .base_agent import MycelialAgent, MOAT_FLOAT_PREFIX, MOAT_FLOAT
 from typing import Literal
 import time
 import random
-import json
 import numpy as np
+from src.storage._njit import njit
+
+# Prospecting criteria (1 point each) and proposal threshold
+ATR_PCT_MIN = 2.0              # Volatility: 24h range > 2% of close
+VOLUME_USD_MIN = 10_000_000    # Volume: daily USD volume > $10M
+SPREAD_PCT_MAX = 0.5           # Liquidity: bid-ask spread < 0.5%
+MOMENTUM_PCT_MIN = 15.0        # Momentum: |change vs open| > 15%
+PROPOSAL_SCORE_MIN = 4         # Out of 8
+# Criterion names in bit order of the per-pair criteria mask (bit 0 = volatility)
+_CRITERIA = ("volatility", "volume", "liquidity", "momentum", "novelty")
+
+# Cross-moat signals; the miners store each latest 0-1 reading under
+# MOAT_FLOAT_PREFIX + key (see MycelialAgent.store_moat_signal)
+MOAT_SIGNAL_KEYS = {
+    "code": "code-data:Python:dependency_entropy",
+    "government": "govt-data:US-Federal:policy_stability",
+    "logistics": "logistics-data:US-West:inventory_velocity",
+    "corporate": "corp-data:Tech:MA_Activity",
+}
+
+# Cross-moat checks in bit order: (moat, base assets it applies to, signal threshold)
+_MOAT_CHECKS = (
+    ("code", ("ETH", "LINK", "MATIC", "AVAX", "SOL", "DOT", "ADA"), 0.7),        # Smart contract platforms: GitHub activity
+    ("government", ("BTC", "ETH", "USDT", "USDC", "XRP", "LTC"), 0.7),          # Institutional targets: policy stability
+    ("logistics", ("BTC", "LTC", "BCH", "DOGE", "ZEC", "XMR"), 0.8),            # PoW coins: supply chain velocity
+    ("corporate", ("BNB", "UNI", "AAVE", "CRV", "SUSHI", "COMP", "MKR"), 0.6),  # Exchange/DeFi tokens: M&A activity
+)
+
+_MOAT_NAMES = tuple(moat for moat, _, _ in _MOAT_CHECKS)
+_MOAT_THRESHOLDS = np.array([threshold for _, _, threshold in _MOAT_CHECKS], dtype=np.float32)
+# Row m holds the 0/1 moat membership bits of mask m (16 x 4)
+_MASK_BITS = ((np.arange(16)[:, None] >> np.arange(len(_MOAT_CHECKS))) & 1).astype(np.float32)
+
+# Base asset -> 4-bit mask of the moats it is checked against
+# (bit 0 = code, bit 1 = government, bit 2 = logistics, bit 3 = corporate)
+MOAT_MEMBERSHIP = {}
+for _bit, (_moat, _assets, _threshold) in enumerate(_MOAT_CHECKS):
+    for _asset in _assets:
+        MOAT_MEMBERSHIP[_asset] = MOAT_MEMBERSHIP.get(_asset, 0) | (1 << _bit)
+
+# Kraken's legacy X/Z-prefixed asset codes -> common tickers
+KRAKEN_ASSET_ALIASES = {
+    "XXBT": "BTC", "XBT": "BTC", "XXDG": "DOGE", "XDG": "DOGE",
+    "XETH": "ETH", "XETC": "ETC", "XLTC": "LTC", "XXRP": "XRP",
+    "XXMR": "XMR", "XZEC": "ZEC", "XXLM": "XLM", "XREP": "REP",
+    "XMLN": "MLN", "ZUSD": "USD", "ZEUR": "EUR", "ZGBP": "GBP",
+    "ZCAD": "CAD", "ZJPY": "JPY", "ZAUD": "AUD", "ZCHF": "CHF",
+}
+
+# Pair name -> base asset, filled from each AssetPairs response's 'base'
+# field; seeded with the fallback pairs used when Kraken is unreachable
+PAIR_TO_BASE = {
+    "XXBTZUSD": "BTC", "XETHZUSD": "ETH", "ADAUSD": "ADA",
+    "SOLUSD": "SOL", "MATICUSD": "MATIC", "LINKUSD": "LINK",
+}
+
+def _ticker_row(ticker: dict):
+    """
+    (high_24h, low_24h, close, volume_24h, bid, ask, open) from a Kraken
+    ticker, or None if it is malformed. Kraken returns 'o' as a plain string.
+    """
+    try:
+        close = float(ticker['c'][0])
+        open_price = ticker.get('o', close)
+        if isinstance(open_price, list):
+            open_price = open_price[0]
+        return (
+            float(ticker['h'][1]), float(ticker['l'][1]), close, float(ticker['v'][1]),
+            float(ticker['b'][0]), float(ticker['a'][0]), float(open_price)
+        )
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+def _moat_signal_value(raw) -> float:
+    """
+    Signal strength (0-1) from a stored moat reading: the raw float32 bytes
+    written by MycelialAgent.store_moat_signal, or 0.0 if there is none.
+    """
+    if raw is None or len(raw) != MOAT_FLOAT.size:
+        return 0.0
+    return MOAT_FLOAT.unpack(raw)[0]
+
+@njit(cache=True, fastmath={'reassoc', 'contract', 'arcp', 'nsz'})
+def _score_kernel(high, low, close, volume, bid, ask, open_price):
+    """
+    One fused, branch-free pass over the candidate arrays. Returns a uint8
+    criteria mask per pair (bits in _CRITERIA order: volatility, volume,
+    liquidity, momentum, novelty) and the number of set bits.
+    """
+    n = close.shape[0]
+    masks = np.zeros(n, dtype=np.uint8)
+    base_scores = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        c = close[i]
+        atr_pct = (high[i] - low[i]) / c * 100.0 if c > 0.0 else 0.0
+        spread_pct = (ask[i] - bid[i]) / bid[i] * 100.0 if bid[i] > 0.0 else 999.0
+        o = open_price[i]
+        momentum_pct = (c - o) / o * 100.0 if o > 0.0 else 0.0
+
+        volatility = int(atr_pct > ATR_PCT_MIN)
+        liquid_volume = int(volume[i] * c > VOLUME_USD_MIN)
+        liquidity = int(spread_pct < SPREAD_PCT_MAX)
+        momentum = int(abs(momentum_pct) > MOMENTUM_PCT_MIN)
+        # Novelty (bit 4) is always set: candidates are never active assets
+        masks[i] = volatility | (liquid_volume << 1) | (liquidity << 2) | (momentum << 3) | (1 << 4)
+        base_scores[i] = volatility + liquid_volume + liquidity + momentum + 1
+    return masks, base_scores
 
 class MarketExplorerAgent(MycelialAgent):
     """
@@ -22,6 +128,9 @@ class MarketExplorerAgent(MycelialAgent):
     Innovation: Cross-moat signals weighted 2x (Q6) - assets with Code/Gov/Logistics/Corp
     activity receive priority, creating informational edge over pure price-based systems.
     """
+    # Scan every 60 steps (1 step = 1 second); the model only steps us on those ticks
+    step_interval = 60
+
     def __init__(self, model, team_type: Literal["HFT", "DayTrade", "Swing"], team_id: int):
         super().__init__(model)
         self.team_type = team_type
@@ -30,14 +139,15 @@ class MarketExplorerAgent(MycelialAgent):
 
         # Q8: Team-specific cross-moat preferences based on timeframe
         self.moat_weights = self._get_moat_weights()
+        # The same weights as a vector in _MOAT_CHECKS bit order
+        self.moat_w = np.array([self.moat_weights[moat] for moat in _MOAT_NAMES], dtype=np.float32)
 
         # Prospecting parameters
-        self.scan_frequency = 60  # Scan every 60 seconds (1 step = 1 second)
-        self.steps_since_scan = 0
         self.confidence_threshold = 0.70  # Q1: 70% confidence minimum
 
         # Channels
         self.proposal_channel = f"prospecting-proposals:{team_type}"
+        self._proposal_channel_b = self.proposal_channel.encode() # Pre-encoded for the publish pipeline
         self.consensus_channel = "prospecting-consensus"
 
         # Discovery tracking
@@ -82,12 +192,8 @@ class MarketExplorerAgent(MycelialAgent):
             }
 
     def step(self):
-        """Scan Kraken markets every 60 steps (60 seconds)"""
-        self.steps_since_scan += 1
-
-        if self.steps_since_scan >= self.scan_frequency:
-            self._scan_markets()
-            self.steps_since_scan = 0
+        """Scan Kraken markets (called every step_interval = 60 steps)"""
+        self._scan_markets()
 
     def _scan_markets(self):
         """
@@ -98,108 +204,169 @@ class MarketExplorerAgent(MycelialAgent):
             tradeable_pairs = self._get_tradeable_pairs()
 
             if not tradeable_pairs:
-                logging.warning(f"[{self.name}] No tradeable pairs returned from Kraken")
+                logging.warning("[%s] No tradeable pairs returned from Kraken", self.name)
                 return
 
-            proposals_this_scan = 0
+            # One batched ticker snapshot per step, shared by all explorer teams
+            get_ticker_snapshot = getattr(self.model, 'get_ticker_snapshot', None)
+            if get_ticker_snapshot is not None:
+                tickers = get_ticker_snapshot(tradeable_pairs)
+            else:
+                tickers = self.kraken_client.get_market_data_batch(tradeable_pairs)
+
+            # Skip pairs that are already active (Q3: model tracks max 15 assets)
+            active_assets = getattr(self.model, 'active_assets', {})
+            candidates = [pair for pair in tradeable_pairs if pair not in active_assets]
 
-            for pair in tradeable_pairs:
-                # Skip if already active (Q3: model tracks max 15 assets)
-                if hasattr(self.model, 'active_assets') and pair in self.model.active_assets:
-                    continue
-
-                # Calculate prospecting score (0-8 scale)
-                score_data = self._calculate_prospecting_score(pair)
-
-                # Threshold: 4/8 points minimum
-                if score_data['total_score'] >= 4:
-                    # Publish proposal to team-specific channel
-                    proposal = {
-                        "source": self.name,
-                        "team_type": self.team_type,
-                        "team_id": self.team_id,
-                        "pair": pair,
-                        "score": score_data['total_score'],
-                        "confidence": score_data['confidence'],
-                        "breakdown": score_data['breakdown'],
-                        "timestamp": time.time()
-                    }
-
-                    self.publish(self.proposal_channel, proposal)
-                    proposals_this_scan += 1
-                    self.total_proposals += 1
-
-                    logging.info(
-                        f"[{self.name}] Proposing {pair} | Score: {score_data['total_score']}/8 | "
-                        f"Cross-Moat: {score_data['breakdown']['cross_moat']}/2 | "
-                        f"Confidence: {score_data['confidence']:.2%}"
-                    )
+            proposals_this_scan = 0
+            scan_time = time.time()  # All proposals from one scan share its timestamp
+
+            # The five 1-point criteria for every candidate at once, as bitmasks
+            pairs, masks, base_scores = self._score_candidates(candidates, tickers)
+
+            # Cross-moat points for every candidate: one lookup table per scan,
+            # indexed by each pair's moat membership mask
+            cross_moat_table = self._cross_moat_table(self._get_moat_signals())
+            moat_masks = np.fromiter(
+                (MOAT_MEMBERSHIP.get(self._extract_base_asset(pair), 0) for pair in pairs),
+                dtype=np.intp, count=len(pairs)
+            )
+            cross_moat_scores = cross_moat_table[moat_masks]
+            total_scores = base_scores + cross_moat_scores
+
+            # Threshold: 4/8 points minimum
+            for i in np.flatnonzero(total_scores >= PROPOSAL_SCORE_MIN):
+                pair = pairs[i]
+                cross_moat_score = int(cross_moat_scores[i])
+                total_score = int(total_scores[i])
+                mask = int(masks[i])
+                breakdown = {name: (mask >> bit) & 1 for bit, name in enumerate(_CRITERIA)}
+                breakdown['cross_moat'] = cross_moat_score
+                confidence = total_score / 8.0
+
+                # Publish proposal to team-specific channel
+                proposal = {
+                    "source": self.name,
+                    "team_type": self.team_type,
+                    "team_id": self.team_id,
+                    "pair": pair,
+                    "score": total_score,
+                    "confidence": confidence,
+                    "breakdown": breakdown,
+                    "timestamp": scan_time
+                }
+
+                self.publish(self._proposal_channel_b, proposal)
+                proposals_this_scan += 1
+                self.total_proposals += 1
+
+                logging.info(
+                    "[%s] Proposing %s | Score: %s/8 | Cross-Moat: %s/2 | Confidence: %.2f%%",
+                    self.name, pair, total_score, cross_moat_score, confidence * 100
+                )
 
             if proposals_this_scan > 0:
-                logging.info(f"[{self.name}] Scan complete: {proposals_this_scan} proposals submitted")
+                logging.info("[%s] Scan complete: %d proposals submitted", self.name, proposals_this_scan)
 
         except Exception as e:
-            logging.error(f"[{self.name}] Error scanning markets: {e}")
+            logging.error("[%s] Error scanning markets: %s", self.name, e)
 
     def _get_tradeable_pairs(self):
         """
         Fetch all tradeable pairs from Kraken API
         Returns list of pairs like ["XXBTZUSD", "XETHZUSD", "ADAUSD", ...]
+
+        The pair universe changes over days, so the list is cached on the
+        model for TRADEABLE_PAIRS_TTL seconds and shared by all explorers.
         """
         try:
-            # Get tradeable asset pairs from Kraken
-            tradeable_pairs_data = self.kraken_client.market.get_tradable_asset_pairs()
-
-            if not tradeable_pairs_data or 'result' not in tradeable_pairs_data:
-                return []
-
-            # Extract pairs that trade against USD
-            usd_pairs = []
-            for pair_name, pair_info in tradeable_pairs_data['result'].items():
-                # Filter for USD pairs only
-                if 'USD' in pair_name and pair_info.get('status') == 'online':
-                    usd_pairs.append(pair_name)
-
-            logging.debug(f"[{self.name}] Found {len(usd_pairs)} USD trading pairs on Kraken")
-            return usd_pairs
+            get_tradeable_pairs = getattr(self.model, 'get_tradeable_pairs', None)
+            if get_tradeable_pairs is not None:
+                return get_tradeable_pairs(self._fetch_tradeable_pairs)
+            return self._fetch_tradeable_pairs()
 
         except Exception as e:
-            logging.error(f"[{self.name}] Error fetching tradeable pairs: {e}")
+            logging.error("[%s] Error fetching tradeable pairs: %s", self.name, e)
             # Fallback to known pairs if API fails
             return ["XXBTZUSD", "XETHZUSD", "ADAUSD", "SOLUSD", "MATICUSD", "LINKUSD"]
 
-    def _calculate_prospecting_score(self, pair: str) -> dict:
+    def _fetch_tradeable_pairs(self):
+        """Online USD pairs from Kraken's AssetPairs endpoint (empty if the request failed)"""
+        # Get tradeable asset pairs from Kraken ({pair: info}; uncached and
+        # rate limited, so each TRADEABLE_PAIRS_TTL refresh sees new listings)
+        tradeable_pairs_data = self.kraken_client.get_asset_pairs()
+
+        if not tradeable_pairs_data:
+            return []
+
+        # Extract pairs that trade against USD
+        usd_pairs = []
+        for pair_name, pair_info in tradeable_pairs_data.items():
+            # Filter for USD pairs only
+            if 'USD' in pair_name and pair_info.get('status') == 'online':
+                usd_pairs.append(pair_name)
+                base = pair_info.get('base')
+                if base:
+                    PAIR_TO_BASE[pair_name] = KRAKEN_ASSET_ALIASES.get(base, base)
+
+        logging.debug("[%s] Found %d USD trading pairs on Kraken", self.name, len(usd_pairs))
+        return usd_pairs
+
+    def _score_candidates(self, candidates, tickers):
+        """
+        1-point criteria for every candidate pair with ticker data.
+        Returns (pairs, masks, base_scores): the scored pairs, a uint8 criteria
+        bitmask per pair (see _CRITERIA) and the number of criteria met.
+        Candidates are never active assets, so novelty is always set.
+        """
+        pairs, rows = [], []
+        for pair in candidates:
+            ticker = tickers.get(pair)
+            row = _ticker_row(ticker) if ticker else None
+            if row is not None:
+                pairs.append(pair)
+                rows.append(row)
+
+        if not rows:
+            return pairs, np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=np.int8)
+
+        # Contiguous columns for the kernel
+        columns = np.ascontiguousarray(np.array(rows, dtype=np.float64).T)
+        masks, base_scores = _score_kernel(*columns)
+        return pairs, masks, base_scores
+
+    def _calculate_prospecting_score(self, pair: str, ticker_data: dict) -> dict:
         """
         Calculate 8-point prospecting score:
         - 1 point each: volatility, volume, liquidity, momentum, novelty (5 criteria)
         - 0-2 points: cross-moat signal (Q6: double weight)
 
         Total: 0-8 scale
+
+        Single-pair form of the scan scoring (_scan_markets scores all
+        candidates at once via _score_candidates).
         """
         breakdown = {}
 
         try:
-            # Fetch ticker data for this pair
-            ticker_data = self._get_ticker_data(pair)
-
             if not ticker_data:
                 return {"total_score": 0, "confidence": 0.0, "breakdown": {}}
 
             # 1. Volatility Score (ATR-based)
             atr = self._calculate_atr(ticker_data)
-            breakdown['volatility'] = 1 if atr > 2.0 else 0
+            breakdown['volatility'] = 1 if atr > ATR_PCT_MIN else 0
 
             # 2. Volume Score (daily USD volume > $10M)
             daily_volume_usd = self._calculate_daily_volume(ticker_data)
-            breakdown['volume'] = 1 if daily_volume_usd > 10_000_000 else 0
+            breakdown['volume'] = 1 if daily_volume_usd > VOLUME_USD_MIN else 0
 
             # 3. Liquidity Score (bid-ask spread < 0.5%)
             spread_pct = self._calculate_spread(ticker_data)
-            breakdown['liquidity'] = 1 if spread_pct < 0.5 else 0
+            breakdown['liquidity'] = 1 if spread_pct < SPREAD_PCT_MAX else 0
 
             # 4. Momentum Score (30-day price change > ±15%)
-            momentum_30d = self._calculate_momentum(pair)
-            breakdown['momentum'] = 1 if abs(momentum_30d) > 15 else 0
+            momentum_30d = self._calculate_momentum(ticker_data)
+            breakdown['momentum'] = 1 if abs(momentum_30d) > MOMENTUM_PCT_MIN else 0
 
             # 5. Novelty Score (not already tracked)
             is_novel = pair not in getattr(self.model, 'active_assets', {})
@@ -223,22 +390,9 @@ class MarketExplorerAgent(MycelialAgent):
             }
 
         except Exception as e:
-            logging.error(f"[{self.name}] Error calculating prospecting score for {pair}: {e}")
+            logging.error("[%s] Error calculating prospecting score for %s: %s", self.name, pair, e)
             return {"total_score": 0, "confidence": 0.0, "breakdown": {}}
 
-    def _get_ticker_data(self, pair: str):
-        """
-        Fetch ticker data for specific pair from Kraken
-        """
-        try:
-            ticker = self.kraken_client.market.get_ticker(pair=pair)
-            if ticker and 'result' in ticker:
-                return ticker['result'].get(pair, {})
-            return None
-        except Exception as e:
-            logging.debug(f"[{self.name}] Error fetching ticker for {pair}: {e}")
-            return None
-
     def _calculate_atr(self, ticker_data):
         """
         Calculate Average True Range (volatility measure)
@@ -254,7 +408,7 @@ class MarketExplorerAgent(MycelialAgent):
                 return atr_pct
             return 0.0
         except Exception as e:
-            logging.debug(f"[{self.name}] Error calculating ATR: {e}")
+            logging.debug("[%s] Error calculating ATR: %s", self.name, e)
             return 0.0
 
     def _calculate_daily_volume(self, ticker_data):
@@ -268,7 +422,7 @@ class MarketExplorerAgent(MycelialAgent):
             volume_usd = volume_24h * current_price
             return volume_usd
         except Exception as e:
-            logging.debug(f"[{self.name}] Error calculating volume: {e}")
+            logging.debug("[%s] Error calculating volume: %s", self.name, e)
             return 0.0
 
     def _calculate_spread(self, ticker_data):
@@ -284,31 +438,34 @@ class MarketExplorerAgent(MycelialAgent):
                 return spread_pct
             return 999.0  # Invalid spread
         except Exception as e:
-            logging.debug(f"[{self.name}] Error calculating spread: {e}")
+            logging.debug("[%s] Error calculating spread: %s", self.name, e)
             return 999.0
 
-    def _calculate_momentum(self, pair: str):
+    def _calculate_momentum(self, ticker_data):
         """
         Calculate 30-day price momentum
-        Simplified: use current price vs opening price from ticker
+        Simplified: use current price vs opening price from the ticker
+        already fetched for scoring
         """
         try:
-            ticker_data = self._get_ticker_data(pair)
             if not ticker_data:
                 return 0.0
 
             current_price = float(ticker_data.get('c', [0])[0])
-            open_price = float(ticker_data.get('o', [current_price])[0])
+            open_price = ticker_data.get('o', current_price)
+            if isinstance(open_price, list):
+                open_price = open_price[0]
+            open_price = float(open_price)  # Kraken returns 'o' as a plain string
 
             if open_price > 0:
                 momentum_pct = ((current_price - open_price) / open_price) * 100
                 return momentum_pct
             return 0.0
         except Exception as e:
-            logging.debug(f"[{self.name}] Error calculating momentum: {e}")
+            logging.debug("[%s] Error calculating momentum: %s", self.name, e)
             return 0.0
 
-    def _query_cross_moat_signals(self, pair: str) -> int:
+    def _query_cross_moat_signals(self, pair: str, moat_signals: dict = None) -> int:
         """
         Q4 + Q6 + Q8: Calculate cross-moat signal score (0-2 points)
 
@@ -318,85 +475,86 @@ class MarketExplorerAgent(MycelialAgent):
         This is the INNOVATION: We look for causal signals in external data
         (GitHub, government, logistics, corporate) that predict crypto moves
         BEFORE they show up in price data.
-        """
-        moat_activity = 0.0
 
+        `moat_signals` ({redis key: float}) lets a scan pass in the readings it
+        already fetched; otherwise they are looked up here.
+        """
         try:
             # Extract base asset (e.g., "BTC" from "XXBTZUSD", "ETH" from "XETHZUSD")
             base_asset = self._extract_base_asset(pair)
 
-            # Check Code Moat (GitHub activity) - Smart contract platforms
-            if base_asset in ["ETH", "LINK", "MATIC", "AVAX", "SOL", "DOT", "ADA"]:
-                code_signal = self._get_redis_signal("code-data:Python:dependency_entropy")
-                if code_signal > 0.7:  # High GitHub activity
-                    moat_activity += self.moat_weights["code"]
-                    logging.debug(f"[{self.name}] {pair} has strong Code moat signal (entropy={code_signal:.2f})")
-
-            # Check Government Moat (regulatory environment) - Institutional targets
-            if base_asset in ["BTC", "ETH", "USDT", "USDC", "XRP", "LTC"]:
-                policy_signal = self._get_redis_signal("govt-data:US-Federal:policy_stability")
-                if policy_signal > 0.7:  # Favorable policy environment
-                    moat_activity += self.moat_weights["government"]
-                    logging.debug(f"[{self.name}] {pair} has strong Gov moat signal (stability={policy_signal:.2f})")
-
-            # Check Logistics Moat (supply chain/mining) - PoW coins
-            if base_asset in ["BTC", "LTC", "BCH", "DOGE", "ZEC", "XMR"]:
-                logistics_signal = self._get_redis_signal("logistics-data:US-West:inventory_velocity")
-                if logistics_signal > 0.8:  # High supply chain activity
-                    moat_activity += self.moat_weights["logistics"]
-                    logging.debug(f"[{self.name}] {pair} has strong Logistics moat signal (velocity={logistics_signal:.2f})")
-
-            # Check Corporate Moat (M&A, institutional activity) - Exchange/DeFi tokens
-            if base_asset in ["BNB", "UNI", "AAVE", "CRV", "SUSHI", "COMP", "MKR"]:
-                corp_signal = self._get_redis_signal("corp-data:Tech:MA_Activity")
-                if corp_signal > 0.6:  # High M&A activity
-                    moat_activity += self.moat_weights["corporate"]
-                    logging.debug(f"[{self.name}] {pair} has strong Corp moat signal (M&A={corp_signal:.2f})")
-
-            # Return 0, 1, or 2 points based on weighted moat activity
-            if moat_activity >= 1.5:
-                return 2  # Strong cross-moat signal (Q6: double weight)
-            elif moat_activity >= 0.5:
-                return 1  # Weak cross-moat signal
-            else:
+            # Which moats (code / government / logistics / corporate) apply to it
+            mask = MOAT_MEMBERSHIP.get(base_asset, 0)
+            if not mask:
                 return 0  # No cross-moat signal
+            if moat_signals is None:
+                moat_signals = self._get_moat_signals()
+
+            return int(self._cross_moat_table(moat_signals)[mask])
 
         except Exception as e:
-            logging.error(f"[{self.name}] Error querying cross-moat signals for {pair}: {e}")
+            logging.error("[%s] Error querying cross-moat signals for %s: %s", self.name, pair, e)
             return 0
 
+    def _cross_moat_table(self, moat_signals: dict) -> np.ndarray:
+        """
+        Cross-moat points (0, 1 or 2) for each of the 16 moat membership masks,
+        given the current signal readings and this team's moat weights.
+
+        A moat counts when its signal clears its threshold; an asset's activity
+        is the summed weight of the active moats it belongs to. >= 1.5 is a
+        strong signal (2 points, Q6: double weight), >= 0.5 a weak one (1).
+        """
+        signals = np.array([moat_signals.get(MOAT_SIGNAL_KEYS[moat], 0.0) for moat in _MOAT_NAMES],
+                           dtype=np.float32)
+        active_w = self.moat_w * (signals > _MOAT_THRESHOLDS)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for moat, weight, signal in zip(_MOAT_NAMES, active_w.tolist(), signals.tolist()):
+                if weight:
+                    logging.debug("[%s] Strong %s moat signal (%.2f)", self.name, moat, signal)
+        moat_activity = _MASK_BITS @ active_w
+        return (moat_activity >= 0.5).astype(np.int8) + (moat_activity >= 1.5)
+
     def _extract_base_asset(self, pair: str) -> str:
         """
-        Extract base asset from Kraken pair name
+        Base asset of a Kraken pair, as reported by AssetPairs
         Examples:
         - "XXBTZUSD" -> "BTC"
         - "XETHZUSD" -> "ETH"
-        - "ADAUSD" -> "ADA"
-        - "SOLUSD" -> "SOL"
+        - "AVAXUSD" -> "AVAX"
+        Pairs Kraken has not described are returned unchanged.
+        """
+        return PAIR_TO_BASE.get(pair, pair)
+
+    def _get_moat_signals(self) -> dict:
         """
-        # Kraken uses X prefix for some assets, Z for fiat
-        pair_clean = pair.replace('X', '').replace('Z', '')
-
-        # Remove USD suffix
-        if 'USD' in pair_clean:
-            base = pair_clean.replace('USD', '')
-        else:
-            base = pair_clean[:3]  # First 3 chars
-
-        # Known mappings
-        mappings = {
-            "BT": "BTC",
-            "XBT": "BTC",
-            "ETH": "ETH",
-            "ADA": "ADA",
-            "SOL": "SOL",
-            "MATIC": "MATIC",
-            "LINK": "LINK",
-            "DOT": "DOT",
-            "AVAX": "AVAX"
-        }
-
-        return mappings.get(base, base)
+        Latest cross-moat readings ({redis key: float}). Cached on the model
+        for MOAT_SIGNAL_TTL seconds so all nine explorer teams share one lookup.
+        """
+        get_moat_signals = getattr(self.model, 'get_moat_signals', None)
+        if get_moat_signals is not None:
+            return get_moat_signals(self._fetch_moat_signals)
+        return self._fetch_moat_signals()
+
+    def _fetch_moat_signals(self) -> dict:
+        """Read all four float32 moat readings from Redis in a single MGET"""
+        keys = list(MOAT_SIGNAL_KEYS.values())
+        try:
+            if getattr(self, 'vector_db', None) is None:
+                return {}
+            values = self.vector_db.mget([MOAT_FLOAT_PREFIX + key for key in keys])
+        except Exception as e:
+            logging.debug("[%s] Error getting Redis moat signals: %s", self.name, e)
+            return {}
+
+        signals = {}
+        for key, data in zip(keys, values):
+            try:
+                signals[key] = _moat_signal_value(data)
+            except Exception as e:
+                logging.debug("[%s] Error parsing Redis signal for %s: %s", self.name, key, e)
+                signals[key] = 0.0
+        return signals
 
     def _get_redis_signal(self, key: str) -> float:
         """
@@ -408,26 +566,9 @@ class MarketExplorerAgent(MycelialAgent):
             if not hasattr(self, 'vector_db') or self.vector_db is None:
                 return 0.0
 
-            # Query Redis for the moat signal
-            data = self.vector_db.get(key)
-
-            if data:
-                # Parse JSON data
-                signal_data = json.loads(data) if isinstance(data, (str, bytes)) else data
-
-                # Extract signal value (assuming it's stored as 'close' or direct value)
-                if isinstance(signal_data, dict):
-                    signal_value = signal_data.get('features', {}).get('close', 0.0)
-                    if signal_value == 0.0:
-                        # Try alternative keys
-                        signal_value = signal_data.get('close', 0.0)
-                else:
-                    signal_value = float(signal_data)
-
-                return float(signal_value)
-
-            return 0.0
+            # Query Redis for the moat signal's float32 reading
+            return _moat_signal_value(self.vector_db.get(MOAT_FLOAT_PREFIX + key))
 
         except Exception as e:
-            logging.debug(f"[{self.name}] Error getting Redis signal for {key}: {e}")
+            logging.debug("[%s] Error getting Redis signal for %s: %s", self.name, key, e)
             return 0.0
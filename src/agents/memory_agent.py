@@ -12,6 +12,8 @@ Integration with market data APIs for enriched context.
 """
 
 import logging
+import functools
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import numpy as np
@@ -19,6 +21,139 @@ import numpy as np
 from src.storage.chroma_client import ChromaDBClient, create_pattern_embedding
 from src.connectors.market_data_aggregator import MarketDataAggregator
 
+# Kraken's legacy X-prefixed base codes (the first four characters of pairs
+# like XXBTZUSD) and three-letter aliases -> common ticker symbols
+SYMBOL_MAP = {
+    'XXBT': 'BTC', 'XETH': 'ETH', 'XLTC': 'LTC', 'XXRP': 'XRP',
+    'XXDG': 'DOGE', 'XXMR': 'XMR', 'XZEC': 'ZEC', 'XETC': 'ETC',
+    'XXLM': 'XLM', 'XREP': 'REP', 'XMLN': 'MLN',
+    'XBT': 'BTC', 'XDG': 'DOGE',
+}
+
+# Memory-driven decisions, indexed by classify_memory_decisions():
+# (confidence, recommendation, reasoning template)
+_DECISIONS = (
+    ('high', 'BUY',
+     "Found {n} similar patterns. "
+     "Success rate: {success_pct:.1f}%. "
+     "Average profit: {avg_profit:.2f}%. "
+     "Market sentiment: {sentiment}. "
+     "Historical data suggests this is a good opportunity."),
+    ('medium', 'BUY_SMALL',
+     "Found {n} similar patterns with moderate success. "
+     "Success rate: {success_pct:.1f}%. "
+     "Average profit: {avg_profit:.2f}%. "
+     "Recommend small position to test this pattern."),
+    ('medium', 'AVOID',
+     "Found {n} similar patterns with poor outcomes. "
+     "Success rate: {success_pct:.1f}%. "
+     "Average profit: {avg_profit:.2f}%. "
+     "Historical data suggests avoiding this trade."),
+    ('low', 'OBSERVE',
+     "Found {n} similar patterns, but results are mixed. "
+     "Success rate: {success_pct:.1f}%. "
+     "Not enough confidence to make a move."),
+)
+
+
+def classify_memory_decisions(counts, success_rates, avg_profits) -> np.ndarray:
+    """
+    Decision code (index into _DECISIONS) for each row of similar-pattern
+    statistics, evaluated for a whole batch of agents in one np.select.
+    Rules, first match wins: BUY, BUY_SMALL, AVOID, otherwise OBSERVE.
+    """
+    counts = np.asarray(counts)
+    success_rates = np.asarray(success_rates)
+    avg_profits = np.asarray(avg_profits)
+    return np.select(
+        [(counts >= 5) & (success_rates > 0.6) & (avg_profits > 1.0),
+         (counts >= 3) & (success_rates > 0.5),
+         (avg_profits < -1.0) | (success_rates < 0.4)],
+        [0, 1, 2],
+        default=3
+    )
+
+
+def build_memory_analysis(similar_patterns: List[Dict], success_rate: float, avg_profit: float,
+                          market_sentiment: str, decision: int) -> Dict:
+    """Analysis dict for one agent; the reasoning text is only formatted here, once"""
+    confidence, recommendation, reasoning = _DECISIONS[decision]
+    return {
+        'confidence': confidence,
+        'recommendation': recommendation,
+        'reasoning': reasoning.format(n=len(similar_patterns), success_pct=success_rate * 100,
+                                      avg_profit=avg_profit, sentiment=market_sentiment),
+        'similar_count': len(similar_patterns),
+        'success_rate': success_rate,
+        'avg_profit': avg_profit,
+        'market_sentiment': market_sentiment,
+        'top_similar_patterns': similar_patterns[:3]  # Top 3 most similar
+    }
+
+def _no_memory_analysis() -> Dict:
+    """Analysis when memory holds no similar patterns"""
+    return {
+        'confidence': 'low',
+        'recommendation': 'OBSERVE',
+        'reasoning': 'No similar historical patterns found. Not enough data to make confident decision.',
+        'similar_count': 0
+    }
+
+
+def _pattern_statistics(similar_patterns: List[Dict]) -> Tuple[float, float]:
+    """(success_rate, avg_profit) of a non-empty list of similar patterns"""
+    profits = np.fromiter((p['metadata'].get('pnl_pct', 0) for p in similar_patterns),
+                          dtype=np.float64, count=len(similar_patterns))
+    return float((profits > 0).mean()), profits.mean()
+
+
+def _market_sentiment(enriched_data: Optional[Dict]) -> str:
+    """Overall market sentiment from enriched market data (NEUTRAL if unknown)"""
+    if enriched_data and 'market_sentiment' in enriched_data:
+        return enriched_data['market_sentiment'].get('sentiment', 'NEUTRAL')
+    return 'NEUTRAL'
+
+
+# Similar patterns retrieved from memory per analysis
+MEMORY_QUERY_RESULTS = 10
+
+# Query embeddings memoized by quantized market state (see _quantized_embedding)
+EMBEDDING_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def _cached_embedding(rsi: float, macd: float, volume: float, price_change_pct: float,
+                      cross_moat_score: float, hour: datetime) -> tuple:
+    """Embedding for one quantized market state (immutable, so it can be cached)"""
+    return tuple(create_pattern_embedding({
+        'rsi': rsi,
+        'macd': macd,
+        'volume': volume,
+        'price_change_pct': price_change_pct,
+        'cross_moat_score': cross_moat_score,
+        'timestamp': hour
+    }))
+
+
+def _quantized_embedding(pattern_data: Dict) -> List[float]:
+    """
+    Query embedding for pattern_data, memoized on a quantized key
+
+    RSI is bucketed to 0.5, MACD and price change to 0.01, volume to three
+    significant figures and the timestamp to the hour (the embedding only
+    uses hour and weekday). In stable regimes consecutive calls land in the
+    same bucket and reuse the cached vector.
+    """
+    timestamp = pattern_data.get('timestamp') or datetime.now()
+    return list(_cached_embedding(
+        round(pattern_data.get('rsi', 50.0) * 2) / 2,
+        round(pattern_data.get('macd', 0.0), 2),
+        float(f"{pattern_data.get('volume', 0.0):.3g}"),
+        round(pattern_data.get('price_change_pct', 0.0), 2),
+        pattern_data.get('cross_moat_score', 0),
+        timestamp.replace(minute=0, second=0, microsecond=0)
+    ))
+
 
 class MemoryAgent:
     """
@@ -28,7 +163,8 @@ class MemoryAgent:
     enabling learning from historical experiences.
     """
 
-    def __init__(self, agent_id: str, pair: str, chroma_client: ChromaDBClient = None):
+    def __init__(self, agent_id: str, pair: str, chroma_client: ChromaDBClient = None,
+                 market_data: MarketDataAggregator = None):
         """
         Initialize memory agent
 
@@ -36,6 +172,8 @@ class MemoryAgent:
             agent_id: Unique agent identifier
             pair: Trading pair this agent focuses on
             chroma_client: Optional ChromaDB client (creates new if None)
+            market_data: Optional market data aggregator (process-wide shared
+                instance if None)
         """
         self.agent_id = agent_id
         self.pair = pair
@@ -46,13 +184,14 @@ class MemoryAgent:
         else:
             self.chroma = ChromaDBClient(persist_directory="./chroma_db")
 
-        # Initialize market data aggregator
-        self.market_data = MarketDataAggregator()
+        # Market data aggregator (shared, so agents reuse its clients and cache)
+        self.market_data = market_data or MarketDataAggregator.shared()
 
         # Agent learning stats
         self.patterns_stored = 0
         self.successful_patterns = 0
         self.failed_patterns = 0
+        self._pattern_ctr = 0  # Keeps pattern ids unique within a clock tick
 
         logging.info(f"[MEMORY-AGENT] {agent_id} initialized for {pair}")
 
@@ -66,120 +205,75 @@ class MemoryAgent:
         Returns:
             Analysis with recommendations based on memory
         """
-        # Extract symbol from pair (e.g., XXBTZUSD -> BTC)
-        symbol = self._extract_symbol(self.pair)
-
         # Get enriched market data
-        enriched_data = self.market_data.get_enriched_market_data(symbol)
+        enriched_data = self.get_enriched_data()
 
         # Create pattern embedding from current state
-        pattern_data = {
-            'rsi': market_state.get('rsi', 50.0),
-            'macd': market_state.get('macd', 0.0),
-            'volume': market_state.get('volume', 0.0),
-            'price_change_pct': enriched_data.get('change_24h', 0.0) if enriched_data else 0.0,
-            'cross_moat_score': market_state.get('cross_moat_score', 0),
-            'timestamp': datetime.now()
-        }
-
-        current_embedding = create_pattern_embedding(pattern_data)
+        current_embedding = self.build_query_vector(market_state, enriched_data)
 
         # Search memory for similar patterns
         similar_patterns = self.chroma.find_similar_patterns(
-            query_embedding=current_embedding,
-            n_results=10,
+            query_embedding=current_embedding.tolist(),
+            n_results=MEMORY_QUERY_RESULTS,
             success_only=True,
             filter_metadata={'pair': self.pair}
         )
 
         # Analyze similar patterns
-        analysis = self._analyze_similar_patterns(similar_patterns, pattern_data, enriched_data)
+        return self.interpret_results(similar_patterns, market_state, enriched_data)
 
-        return analysis
+    def get_enriched_data(self) -> Dict:
+        """Enriched market data for this agent's symbol (cached by the aggregator)"""
+        # Extract symbol from pair (e.g., XXBTZUSD -> BTC)
+        return self.market_data.get_enriched_market_data(self._extract_symbol(self.pair))
 
-    def _analyze_similar_patterns(self, similar_patterns: List[Dict],
-                                  current_data: Dict, enriched_data: Optional[Dict]) -> Dict:
+    def build_query_vector(self, market_state: Dict, enriched_data: Optional[Dict] = None) -> np.ndarray:
+        """
+        Embedding of the current market state, without querying memory
+
+        Args:
+            market_state: Current market indicators (RSI, MACD, volume, etc.)
+            enriched_data: Enriched market data (fetched if None)
+
+        Returns:
+            Float32 query vector
+        """
+        if enriched_data is None:
+            enriched_data = self.get_enriched_data()
+
+        pattern_data = {
+            'rsi': market_state.get('rsi', 50.0),
+            'macd': market_state.get('macd', 0.0),
+            'volume': market_state.get('volume', 0.0),
+            'price_change_pct': enriched_data.get('change_24h', 0.0) if enriched_data else 0.0,
+            'cross_moat_score': market_state.get('cross_moat_score', 0),
+            'timestamp': datetime.now()
+        }
+        return np.asarray(_quantized_embedding(pattern_data), dtype=np.float32)
+
+    def interpret_results(self, similar_patterns: List[Dict],
+                          market_state: Dict, enriched_data: Optional[Dict]) -> Dict:
         """
         Analyze similar patterns and generate recommendations
 
         Args:
-            similar_patterns: List of similar historical patterns
-            current_data: Current market state
+            similar_patterns: List of similar historical patterns (already fetched)
+            market_state: Current market state
             enriched_data: Enriched market data from APIs
 
         Returns:
             Analysis with confidence, recommendation, and reasoning
         """
         if not similar_patterns:
-            return {
-                'confidence': 'low',
-                'recommendation': 'OBSERVE',
-                'reasoning': 'No similar historical patterns found. Not enough data to make confident decision.',
-                'similar_count': 0
-            }
+            return _no_memory_analysis()
 
         # Calculate statistics from similar patterns
-        profits = [p['metadata'].get('pnl_pct', 0) for p in similar_patterns]
-        avg_profit = np.mean(profits)
-        success_rate = sum(1 for p in profits if p > 0) / len(profits)
-
-        # Get market sentiment
-        market_sentiment = 'NEUTRAL'
-        if enriched_data and 'market_sentiment' in enriched_data:
-            market_sentiment = enriched_data['market_sentiment'].get('sentiment', 'NEUTRAL')
-
-        # Decision logic
-        confidence = 'low'
-        recommendation = 'OBSERVE'
-        reasoning = ''
-
-        if len(similar_patterns) >= 5 and success_rate > 0.6 and avg_profit > 1.0:
-            confidence = 'high'
-            recommendation = 'BUY'
-            reasoning = (
-                f"Found {len(similar_patterns)} similar patterns. "
-                f"Success rate: {success_rate*100:.1f}%. "
-                f"Average profit: {avg_profit:.2f}%. "
-                f"Market sentiment: {market_sentiment}. "
-                f"Historical data suggests this is a good opportunity."
-            )
-        elif len(similar_patterns) >= 3 and success_rate > 0.5:
-            confidence = 'medium'
-            recommendation = 'BUY_SMALL'
-            reasoning = (
-                f"Found {len(similar_patterns)} similar patterns with moderate success. "
-                f"Success rate: {success_rate*100:.1f}%. "
-                f"Average profit: {avg_profit:.2f}%. "
-                f"Recommend small position to test this pattern."
-            )
-        elif avg_profit < -1.0 or success_rate < 0.4:
-            confidence = 'medium'
-            recommendation = 'AVOID'
-            reasoning = (
-                f"Found {len(similar_patterns)} similar patterns with poor outcomes. "
-                f"Success rate: {success_rate*100:.1f}%. "
-                f"Average profit: {avg_profit:.2f}%. "
-                f"Historical data suggests avoiding this trade."
-            )
-        else:
-            confidence = 'low'
-            recommendation = 'OBSERVE'
-            reasoning = (
-                f"Found {len(similar_patterns)} similar patterns, but results are mixed. "
-                f"Success rate: {success_rate*100:.1f}%. "
-                f"Not enough confidence to make a move."
-            )
+        success_rate, avg_profit = _pattern_statistics(similar_patterns)
+        market_sentiment = _market_sentiment(enriched_data)
 
-        return {
-            'confidence': confidence,
-            'recommendation': recommendation,
-            'reasoning': reasoning,
-            'similar_count': len(similar_patterns),
-            'success_rate': success_rate,
-            'avg_profit': avg_profit,
-            'market_sentiment': market_sentiment,
-            'top_similar_patterns': similar_patterns[:3]  # Top 3 most similar
-        }
+        decision = int(classify_memory_decisions(len(similar_patterns), success_rate, avg_profit))
+        return build_memory_analysis(similar_patterns, success_rate, avg_profit,
+                                     market_sentiment, decision)
 
     def store_trade_outcome(self, trade_data: Dict, pnl_pct: float):
         """
@@ -189,7 +283,8 @@ class MemoryAgent:
             trade_data: Trade details (entry signals, market state, etc.)
             pnl_pct: Profit/loss percentage
         """
-        pattern_id = f"{self.agent_id}_{self.pair}_{datetime.now().isoformat()}"
+        self._pattern_ctr += 1
+        pattern_id = f"{self.agent_id}_{self.pair}_{time.time_ns()}_{self._pattern_ctr}"
 
         # Create pattern data
         pattern_data = {
@@ -206,8 +301,8 @@ class MemoryAgent:
             'timestamp': datetime.now()
         }
 
-        # Create embedding
-        embedding = create_pattern_embedding(pattern_data)
+        # Create embedding (float32, the precision ChromaDB's index stores)
+        embedding = np.asarray(create_pattern_embedding(pattern_data), dtype=np.float32)
 
         # Determine success
         success = pnl_pct > 0
@@ -285,17 +380,12 @@ class MemoryAgent:
             return "Unable to read market conditions right now."
 
     def _extract_symbol(self, pair: str) -> str:
-        """Extract symbol from trading pair (e.g., XXBTZUSD -> BTC)"""
-        if 'BTC' in pair:
-            return 'BTC'
-        elif 'ETH' in pair:
-            return 'ETH'
-        elif 'LTC' in pair:
-            return 'LTC'
-        elif 'XRP' in pair:
-            return 'XRP'
-        else:
-            return pair[:3]  # Fallback
+        """Extract symbol from trading pair (e.g., XXBTZUSD -> BTC, ETHUSD -> ETH)"""
+        symbol = SYMBOL_MAP.get(pair[:4])
+        if symbol is None:
+            symbol = pair[:3]  # Fallback
+            symbol = SYMBOL_MAP.get(symbol, symbol)
+        return symbol
 
 
 # =============================================================================
@@ -334,7 +424,8 @@ class MemoryAgentSwarm:
 
     def analyze_all_pairs(self, market_states: Dict[str, Dict]) -> Dict[str, Dict]:
         """
-        Analyze all pairs with memory-driven intelligence
+        Analyze all pairs with memory-driven intelligence, using one batched
+        similarity search for the whole swarm
 
         Args:
             market_states: Dict mapping pair -> market state
@@ -342,12 +433,55 @@ class MemoryAgentSwarm:
         Returns:
             Dict mapping pair -> analysis
         """
-        analyses = {}
+        pairs = [pair for pair in market_states if pair in self.agents]
+        if not pairs:
+            return {}
+
+        # One query vector per pair, stacked for a single batched search
+        enriched = [self.agents[pair].get_enriched_data() for pair in pairs]
+        vectors = np.stack([
+            self.agents[pair].build_query_vector(market_states[pair], enriched_data)
+            for pair, enriched_data in zip(pairs, enriched)
+        ])
+
+        # Chroma applies one filter to the whole batch, so each query searches
+        # all swarm pairs and keeps only its own pair's neighbours. A full
+        # result row may have cut them short; those pairs are re-queried alone.
+        k = MEMORY_QUERY_RESULTS
+        n_results = k * len(pairs)
+        pair_filter = {'pair': pairs[0]} if len(pairs) == 1 else {'pair': {'$in': pairs}}
+        rows = self.chroma.find_similar_patterns_batch(
+            vectors, n_results=n_results, success_only=True, filter_metadata=pair_filter
+        )
 
-        for pair, market_state in market_states.items():
-            if pair in self.agents:
-                analysis = self.agents[pair].analyze_current_situation(market_state)
-                analyses[pair] = analysis
+        neighbours = []
+        for i, pair in enumerate(pairs):
+            similar = [p for p in rows[i] if p['metadata'].get('pair') == pair][:k]
+            if len(similar) < k and len(rows[i]) == n_results:
+                similar = self.chroma.find_similar_patterns(
+                    query_embedding=vectors[i].tolist(), n_results=k,
+                    success_only=True, filter_metadata={'pair': pair}
+                )
+            neighbours.append(similar)
+
+        # Decide for every pair at once, then format each analysis
+        stats = [_pattern_statistics(similar) if similar else (0.0, 0.0) for similar in neighbours]
+        decisions = classify_memory_decisions(
+            [len(similar) for similar in neighbours],
+            [success_rate for success_rate, _ in stats],
+            [avg_profit for _, avg_profit in stats]
+        )
+
+        analyses = {}
+        for i, pair in enumerate(pairs):
+            if not neighbours[i]:
+                analyses[pair] = _no_memory_analysis()
+                continue
+            success_rate, avg_profit = stats[i]
+            analyses[pair] = build_memory_analysis(
+                neighbours[i], success_rate, avg_profit,
+                _market_sentiment(enriched[i]), int(decisions[i])
+            )
 
         return analyses
 
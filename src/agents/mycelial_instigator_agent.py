@@ -35,20 +35,17 @@ class MycelialInstigatorAgent(MycelialAgent):
         Select 3 SwarmBrain agents and trigger forced collaboration.
         """
         try:
-            # Find all SwarmBrain agents
-            all_swarm_agents = [a for a in self.model.agents
-                              if hasattr(a, 'name') and 'SwarmBrain' in str(a.name)]
+            # All live SwarmBrain agents (registry maintained by the model)
+            all_swarm_agents = self.model.swarm_brains
 
             if len(all_swarm_agents) < 3:
-                logging.debug(f"[{self.name}] Insufficient agents for Rule of 3 (need 3, have {len(all_swarm_agents)})")
+                logging.debug("[%s] Insufficient agents for Rule of 3 (need 3, have %d)", self.name, len(all_swarm_agents))
                 return
 
-            # Select one target agent and two partners
-            target = random.choice(all_swarm_agents)
-            partners = random.sample([a for a in all_swarm_agents if a.unique_id != target.unique_id], 2)
+            # Select one target agent and two partners (three distinct agents)
+            collaboration_group = random.sample(all_swarm_agents, 3)
 
             # Publish FORCE_SHARE signal to all three agents
-            collaboration_group = [target] + partners
             agent_ids = [str(a.unique_id) for a in collaboration_group]
 
             message = {
@@ -66,7 +63,7 @@ class MycelialInstigatorAgent(MycelialAgent):
             if self.total_collaborations_triggered % 100 == 1:  # Log periodically
                 logging.info(f"[{self.name}] Rule of 3 enforced: {agent_ids} (total collaborations: {self.total_collaborations_triggered})")
             else:
-                logging.debug(f"[{self.name}] Rule of 3 enforced: {agent_ids}")
+                logging.debug("[%s] Rule of 3 enforced: %s", self.name, agent_ids)
 
         except Exception as e:
             logging.error(f"[{self.name}] Error enforcing Rule of 3: {e}")
@@ -1,18 +1,90 @@
 # src/agents/pattern_learner_agent.py - BIG ROCK 41: Alpha Tournament (ProfitSeekerAgent)
 import logging
 from .base_agent import MycelialAgent
-import pandas as pd
 import time
 import random
-import numpy as np
 import json
+import threading
 from collections import deque
+from config.settings import CONFIG
+from src.storage._njit import NUMBA_AVAILABLE
+from ._pattern_kernels import compute_policy, ACTION_HOLD, ACTION_BUY, ACTION_SELL, warm_up as _warm_up_policy_kernel
 
 # PHASE 2.1: Realistic trading costs (Kraken fees + market impact)
 TRADING_FEE_PCT = 0.26  # 0.26% per trade (Kraken maker/taker average)
 SLIPPAGE_PCT = 0.10     # 0.10% slippage (market impact)
 TOTAL_COST_PCT = (TRADING_FEE_PCT + SLIPPAGE_PCT) / 100.0  # 0.0036 (0.36% per trade)
 
+# Compile the policy kernel at import so the first market tick doesn't pay for it
+if NUMBA_AVAILABLE:
+    _warm_up_policy_kernel()
+
+# Model steps between writes of the buffered policy:<name> snapshots
+POLICY_FLUSH_EVERY_N_TICKS = CONFIG.get('database.redis.policy_flush_every_n_ticks', 50) if CONFIG else 50
+
+# Seconds between dashboard state (agent:<name>) writes while the position is unchanged
+AGENT_STATE_SAVE_INTERVAL = 5.0
+
+
+def _feature(features: dict, name: str, default):
+    """A market-data feature, or default when it is missing or null (undefined indicator)"""
+    value = features.get(name)
+    return default if value is None else value
+
+
+class _PolicyWriteBuffer:
+    """
+    Write-behind buffer for the SwarmBrains' `policy:<name>` snapshots.
+
+    Only an agent's latest snapshot matters, so put() just overwrites its
+    entry in an in-process dict (no serialization on the tick). The model
+    calls tick() once per step; every flush_every_n_ticks steps the pending
+    snapshots are written in a single pipelined round trip. One buffer is
+    shared by all agents of a model (see for_model).
+    """
+    def __init__(self, connection, flush_every_n_ticks: int = POLICY_FLUSH_EVERY_N_TICKS):
+        self.connection = connection
+        self.flush_every_n_ticks = max(1, int(flush_every_n_ticks))
+        self._pending = {}
+        self._ticks = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_model(cls, model) -> '_PolicyWriteBuffer':
+        """The model's shared buffer, created on first use"""
+        buffer = getattr(model, 'policy_write_buffer', None)
+        if buffer is None:
+            buffer = cls(model.redis_client.connection)
+            model.policy_write_buffer = buffer
+        return buffer
+
+    def put(self, key: str, log_data: dict):
+        """Queue the latest snapshot for `key`, replacing any unflushed one"""
+        with self._lock:
+            self._pending[key] = log_data
+
+    def tick(self):
+        """Called once per model step; flushes every flush_every_n_ticks steps"""
+        self._ticks += 1
+        if self._ticks >= self.flush_every_n_ticks:
+            self._ticks = 0
+            self.flush()
+
+    def flush(self):
+        """Write all pending snapshots (as JSON) in one pipelined round trip"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending or not self.connection:
+            return
+
+        try:
+            pipe = self.connection.pipeline(transaction=False)
+            for key, log_data in pending.items():
+                pipe.set(key, json.dumps(log_data))
+            pipe.execute()
+        except Exception as e:
+            logging.error(f"[POLICY] Error writing {len(pending)} policy snapshots: {e}")
+
 class PatternLearnerAgent(MycelialAgent):
     """
     BIG ROCK 41: ProfitSeekerAgent - The Alpha Tournament Engine
@@ -62,53 +134,83 @@ class PatternLearnerAgent(MycelialAgent):
         self.control_channel = "system-control"
 
         # Listen to market data and control channels
-        self._register_listener(self.market_data_channel, self.handle_market_data)
+        # Finance SwarmBrains read their DataMiner's features in-process when the
+        # model shares them (see step()); the other moats arrive over Redis
+        self._reads_feature_cache = product_focus == "Finance" and self.uses_feature_cache()
+        if not self._reads_feature_cache:
+            self._register_listener(self.market_data_channel, self.handle_market_data)
         self._register_listener(self.control_channel, self.handle_system_control)
 
         self.trading_halted = False
         self.prediction_score = 0.5  # Starts neutral (50% confidence)
 
+        # Policy snapshots are written behind, in batches shared with the swarm
+        self._policy_key = f"policy:{self.name}"
+        self._policy_buffer = _PolicyWriteBuffer.for_model(model)
+        self._state_saved_at = 0.0
+
+        # Register with the model's SwarmBrain registry (Rule of 3 sampling);
+        # only SwarmBrain_* agents join, as with the Instigator's old name filter
+        swarm_brains = getattr(model, 'swarm_brains', None)
+        if swarm_brains is not None and 'SwarmBrain' in self.name:
+            swarm_brains.append(self)
+
     def step(self):
-        """This agent is reactive to market data ticks."""
-        pass
+        """
+        Reactive to market data ticks. Finance agents in a model with a
+        feature cache pick up their pair's newest DataMiner tick here.
+        """
+        if self._reads_feature_cache:
+            snapshot = self.latest_features(self.pair)
+            if snapshot is not None:
+                self.handle_features(snapshot.features)
+
+    def remove(self):
+        """Leave the model's SwarmBrain registry along with the model itself."""
+        swarm_brains = getattr(self.model, 'swarm_brains', None)
+        if swarm_brains is not None and self in swarm_brains:
+            swarm_brains.remove(self)
+        super().remove()
 
     def handle_system_control(self, message: dict):
         if message.get("command") == "HALT_TRADING":
             self.trading_halted = True
             logging.critical(f"[{self.name}] TRADING HALTED by Risk Manager. Reason: {message.get('reason')}")
+            self.save_state(status="Halted", last_update=time.time())
 
     def handle_market_data(self, message: dict):
+        """Redis callback for new market data"""
+        self.handle_features(message.get('features'))
+
+    def handle_features(self, features: dict):
         """
-        Callback for new market data. Now uses the rich 'features' set with FRL logging.
+        Handles one tick of market data. Now uses the rich 'features' set with FRL logging.
         """
         if self.trading_halted:
             return
 
         try:
-            features = message.get('features')
             if not features:
                 return  # Ignore if features are still building up
 
             # 1. Extract Rich Features
-            current_rsi = features.get('RSI', 50)
-            current_mom = features.get('MOM', 0)
-            current_atr = features.get('ATR', 1)
-            current_close = features.get('close', 0)
+            current_rsi = _feature(features, 'RSI', 50)
+            current_mom = _feature(features, 'MOM', 0)
+            current_atr = _feature(features, 'ATR', 1)
+            current_close = _feature(features, 'close', 0)
 
             # --- FRL LOGGING (Crucial for the Swarm) ---
             # 1. Prediction Score (Simulated: Confidence increases with Volatility + Momentum)
-            self.prediction_score = np.clip(0.5 + (abs(current_mom) * 2) - (current_atr * 0.05), 0.1, 0.9)
-
-            # 2. Create Strategy Vector (Belief State Moat)
-            # This vector is the heart of the clustering/FRL logic.
-            # It represents the agent's current belief about the market.
-            # Vector elements: [RSI Threshold, ATR Multiplier, Current Momentum, RSI Confidence]
-            strategy_vector = [
-                self.rsi_threshold,
-                self.atr_multiplier,
-                current_mom,
-                100 - abs(50 - current_rsi) * 2  # Higher confidence when extreme RSI
-            ]
+            # 2. Strategy Vector (Belief State Moat) - the heart of the clustering/FRL logic,
+            #    the agent's current belief about the market:
+            #    [RSI Threshold, ATR Multiplier, Current Momentum, RSI Confidence]
+            # ...and the trade decision (step 5), all from one compiled kernel call
+            self.prediction_score, strategy_vec, action = compute_policy(
+                float(current_rsi), float(current_mom), float(current_atr),
+                float(self.rsi_threshold), float(self.atr_multiplier),
+                self.position == "LONG"
+            )
+            strategy_vector = strategy_vec.tolist()
 
             # 3. Log Prediction and Strategy to Vector DB
             # BIG ROCK 33: Pattern Decay Management
@@ -146,9 +248,9 @@ class PatternLearnerAgent(MycelialAgent):
                     'close': round(current_close, 2)
                 }
             }
-            # The Vector DB writes the current prediction for peers and dashboard to read
-            if self.vector_db:  # type: ignore
-                self.vector_db.set(f"policy:{self.name}", json.dumps(log_data))  # type: ignore
+            # The Vector DB holds the current prediction for peers and dashboard to read
+            # (buffered; the latest snapshot is flushed every few model steps)
+            self._policy_buffer.put(self._policy_key, log_data)
 
             # --- 4. Check for Missing Tools (Autonomous Request) ---
             # If the swarm hits a high-volatility zone but lacks data features, it requests a tool.
@@ -160,17 +262,31 @@ class PatternLearnerAgent(MycelialAgent):
                 })
 
             # --- 5. Trading Logic (BIG ROCK 28: Prediction Score Threshold) ---
-            # DECISION FILTER: Only act when prediction confidence exceeds 80%
-            if self.prediction_score > 0.8 and self.position == "FLAT":
+            # DECISION FILTER (in compute_policy): only BUY when prediction
+            # confidence exceeds 80%; exit a LONG once RSI clears the threshold
+            if action == ACTION_BUY:
                 # High confidence BUY signal
-                if current_rsi < 30 and current_mom > 0:
-                    self.position = "LONG"
-                    self.send_order(direction="buy", current_close=current_close)
-            elif self.position == "LONG" and current_rsi > self.rsi_threshold:
+                self.position = "LONG"
+                self.send_order(direction="buy", current_close=current_close)
+            elif action == ACTION_SELL:
                 # Exit LONG position
                 self.position = "FLAT"
                 self.send_order(direction="sell", current_close=current_close)
 
+            # --- 6. Dashboard State (agent:<name> hash) ---
+            # Written on every position change, otherwise at most every few seconds
+            if action != ACTION_HOLD or current_time - self._state_saved_at >= AGENT_STATE_SAVE_INTERVAL:
+                self._state_saved_at = current_time
+                self.save_state(
+                    status="Active",
+                    position=self.position,
+                    rsi=current_rsi,
+                    momentum=current_mom,
+                    atr=current_atr,
+                    signals=self.trade_count,
+                    last_update=current_time
+                )
+
         except Exception as e:
             logging.error(f"[{self.name}] Error in strategy logic: {e}")
 
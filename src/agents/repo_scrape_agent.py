@@ -3,6 +3,7 @@ import logging
 from .base_agent import MycelialAgent
 import time
 import os
+import numpy as np
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
@@ -13,6 +14,12 @@ except ImportError:
     GITHUB_AVAILABLE = False
     logging.warning("[REPO_SCRAPE] PyGithub not installed. Install with: pip install PyGithub")
 
+# Inclusive bounds for simulated (commits_24h, contributors, open_issues, dependency_entropy)
+_SIM_INT_LOW = np.array([5, 10, 20, 1])
+_SIM_INT_HIGH = np.array([150, 500, 300, 100])
+# Dependency entropy that counts as a full-strength (1.0) code moat reading
+DEPENDENCY_ENTROPY_SCALE = 100.0
+
 class RepoScrapeAgent(MycelialAgent):
     """
     PHASE 3.2: The Data Engineer for the Code Innovation Swarm
@@ -53,6 +60,7 @@ class RepoScrapeAgent(MycelialAgent):
         super().__init__(model)
         self.target = target_language
         self.channel = f"code-data:{self.target}"
+        self._moat_key = f"{self.channel}:dependency_entropy"
         self.name = f"RepoScraper_{self.unique_id}"
         self.use_real_api = use_real_api and GITHUB_AVAILABLE
 
@@ -85,6 +93,7 @@ class RepoScrapeAgent(MycelialAgent):
         self.last_fetch_time = 0
         self.fetch_interval = 300  # 5 minutes between fetches
         self.cached_data = {}
+        self._rng = np.random.default_rng()  # Simulated-data fallback
 
         logging.info(
             f"[{self.name}] Initialized | Language: {self.target} | "
@@ -205,15 +214,16 @@ class RepoScrapeAgent(MycelialAgent):
         """
         Fallback: Generate simulated data (original behavior)
         """
-        import random
-
-        novelty_score = random.uniform(0.5, 9.5)
-        dependency_entropy = random.randint(1, 100)
+        novelty_score = float(self._rng.uniform(0.5, 9.5))
+        # One vectorized draw for all four integer metrics
+        commits, contributors, open_issues, dependency_entropy = (
+            self._rng.integers(_SIM_INT_LOW, _SIM_INT_HIGH, endpoint=True).tolist()
+        )
 
         return {
-            "total_commits_24h": random.randint(5, 150),
-            "total_contributors": random.randint(10, 500),
-            "total_open_issues": random.randint(20, 300),
+            "total_commits_24h": commits,
+            "total_contributors": contributors,
+            "total_open_issues": open_issues,
             "repos_analyzed": len(self.tracked_repos),
             "dependency_entropy": dependency_entropy,
             "novelty_score": novelty_score,
@@ -244,6 +254,8 @@ class RepoScrapeAgent(MycelialAgent):
         }
 
         self.publish(self.channel, message)
+        # Code moat reading for MarketExplorer (0-1, real API values clamp at 1)
+        self.store_moat_signal(self._moat_key, metrics["dependency_entropy"] / DEPENDENCY_ENTROPY_SCALE)
 
     def _publish_cached_data(self):
         """
@@ -57,7 +57,10 @@ class RiskManagementAgent(MycelialAgent):
             # Check drawdown
             drawdown = (self.peak_portfolio_value - self.current_portfolio_value) / self.peak_portfolio_value
 
-            logging.debug(f"[{self.name}] Current Value: {self.current_portfolio_value}, Peak: {self.peak_portfolio_value}, Drawdown: {drawdown:.2%}")
+            logging.debug(
+                "[%s] Current Value: %s, Peak: %s, Drawdown: %.2f%%",
+                self.name, self.current_portfolio_value, self.peak_portfolio_value, drawdown * 100
+            )
 
             if drawdown > self.max_drawdown and not self.is_halted:
                 self.trigger_system_halt(drawdown)
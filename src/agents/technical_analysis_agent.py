@@ -18,7 +18,7 @@ class TechnicalAnalysisAgent(MycelialAgent):
     Key Innovation from Original:
     - NO RANDOM SIGNALS: All signals calculated from actual market data
     - Dynamic pair support: `pair_to_watch` parameter (not hardcoded)
-    - Subscribes to market-data:{pair} channels for real-time data
+    - Reads market-data:{pair} ticks (in-process via model.feature_cache when available)
     - Slight parameter randomization for team diversity (Rule of 3)
     """
     def __init__(self, model, pair_to_watch: str, team_id: int):
@@ -27,9 +27,12 @@ class TechnicalAnalysisAgent(MycelialAgent):
         self.team_id = team_id
         self.name = f"TA_{pair_to_watch}_{team_id}"
 
-        # Subscribe to market data for this specific pair
+        # Subscribe to market data for this specific pair, unless the model shares
+        # its DataMiner's features in-process (read in step() instead)
         self.market_channel = f"market-data:{pair_to_watch.replace('/', '-')}"
-        self._register_listener(self.market_channel, self.handle_market_data)
+        self._reads_feature_cache = self.uses_feature_cache()
+        if not self._reads_feature_cache:
+            self._register_listener(self.market_channel, self.handle_market_data)
 
         # TA parameters (Rule of 3: slight randomization for diversity)
         self.rsi_period = 14 + random.randint(-2, 2)  # 12-16 period
@@ -59,11 +62,19 @@ class TechnicalAnalysisAgent(MycelialAgent):
 
     def step(self):
         """
-        Purely reactive agent - signals generated from handle_market_data callbacks
+        Reactive agent - signals generated from market data ticks. With an
+        in-process feature cache, the pair's newest DataMiner tick is picked up here.
         """
-        pass
+        if self._reads_feature_cache:
+            snapshot = self.latest_features(self.pair)
+            if snapshot is not None:
+                self.handle_features(snapshot.features, snapshot.timestamp)
 
     def handle_market_data(self, message: dict):
+        """Redis callback for market data ticks from DataMinerAgent"""
+        self.handle_features(message.get('features'), message.get('timestamp', time.time()))
+
+    def handle_features(self, features: dict, timestamp: float):
         """
         CRITICAL FIX: Real TA calculations (not random)
 
@@ -71,7 +82,6 @@ class TechnicalAnalysisAgent(MycelialAgent):
         Calculates RSI, MACD, and Bollinger Bands from actual price data.
         """
         try:
-            features = message.get('features')
             if not features:
                 return
 
@@ -80,7 +90,7 @@ class TechnicalAnalysisAgent(MycelialAgent):
                 'close': features.get('close', 0),
                 'high': features.get('high', features.get('close', 0)),
                 'low': features.get('low', features.get('close', 0)),
-                'timestamp': message.get('timestamp', time.time())
+                'timestamp': timestamp
             }
 
             self.market_buffer.append(tick_data)
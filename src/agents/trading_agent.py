@@ -129,7 +129,7 @@ class TradingAgent(MycelialAgent):
             # Check for Signal Collision
             self._check_for_collision(pair)
 
-            logging.debug(f"[{self.name}] Baseline idea: {direction.upper()} {pair}")
+            logging.debug("[%s] Baseline idea: %s %s", self.name, direction.upper(), pair)
 
         except Exception as e:
             logging.error(f"[{self.name}] Error handling baseline idea: {e}")
@@ -158,7 +158,7 @@ class TradingAgent(MycelialAgent):
             # Check for Signal Collision
             self._check_for_collision(pair)
 
-            logging.debug(f"[{self.name}] Mycelial idea: {direction.upper()} {pair}")
+            logging.debug("[%s] Mycelial idea: %s %s", self.name, direction.upper(), pair)
 
         except Exception as e:
             logging.error(f"[{self.name}] Error handling mycelial idea: {e}")
@@ -131,6 +131,29 @@ class BacktestResults:
     # Daily equity curve
     equity_curve: List[Tuple[datetime, float]] = field(default_factory=list)
 
+    # Cached closed-position frame (rebuilt only when trades change)
+    _closed_positions_df: Optional[pd.DataFrame] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def closed_positions_df(self) -> pd.DataFrame:
+        """Closed trades as one DataFrame (one row per position), materialized once"""
+        if self._closed_positions_df is None or len(self._closed_positions_df) != len(self.trades):
+            self._closed_positions_df = pd.DataFrame(
+                [
+                    (t.pair, t.direction, t.price, t.exit_price, t.pnl_pct,
+                     t.rsi, t.macd, t.cross_moat_score, t.timestamp)
+                    for t in self.trades
+                ],
+                columns=['pair', 'direction', 'entry_price', 'exit_price', 'pnl_pct',
+                         'entry_rsi', 'entry_macd', 'cross_moat_score', 'entry_time']
+            )
+        return self._closed_positions_df
+
+    @property
+    def closed_positions(self) -> List[Dict]:
+        """Closed trades as a list of position dicts"""
+        return self.closed_positions_df.to_dict('records')
+
 
 # =============================================================================
 # BACKTESTING ENGINE
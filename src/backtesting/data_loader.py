@@ -9,12 +9,22 @@ Provides functions to:
 """
 
 import logging
+import os
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import time
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DEFAULT_CACHE_DIR = "cache"
+
 
 def load_kraken_ohlcv_history(
     pairs: List[str],
@@ -294,20 +304,93 @@ def simulate_github_data(
     return df
 
 
+def _cache_path(cache_dir: str, pair: str, kind: str, start_date: datetime, end_date: datetime) -> str:
+    """Parquet cache file for one pair's history over an exact date window"""
+    window = f"{start_date:%Y%m%dT%H%M%S}_{end_date:%Y%m%dT%H%M%S}"
+    return os.path.join(cache_dir, f"{pair}_{kind}_{window}.parquet")
+
+
+def _read_cached_frame(path: str) -> Optional[pd.DataFrame]:
+    """Memory-map a cached parquet file, or return None on a miss"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return pq.read_table(path, memory_map=True).to_pandas()
+    except Exception as e:
+        logging.warning(f"[DATA_LOADER] Ignoring unreadable cache file {path}: {e}")
+        return None
+
+
+def _write_cached_frame(path: str, df: pd.DataFrame):
+    """Persist a loaded DataFrame so the next run with the same window skips the load"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pq.write_table(pa.Table.from_pandas(df), path, compression='zstd')
+    except Exception as e:
+        logging.warning(f"[DATA_LOADER] Failed to write cache file {path}: {e}")
+
+
+def _load_with_cache(
+    pairs: List[str],
+    kind: str,
+    start_date: datetime,
+    end_date: datetime,
+    cache_dir: Optional[str],
+    loader
+) -> Dict[str, pd.DataFrame]:
+    """
+    Serve each pair from the parquet cache, calling loader(missing_pairs)
+    once for the pairs that aren't cached yet and caching its results
+    """
+    if not cache_dir or not PARQUET_AVAILABLE:
+        return loader(pairs)
+
+    data = {}
+    missing = []
+    for pair in pairs:
+        df = _read_cached_frame(_cache_path(cache_dir, pair, kind, start_date, end_date))
+        if df is None:
+            missing.append(pair)
+        else:
+            data[pair] = df
+
+    if missing:
+        loaded = loader(missing)
+        for pair, df in loaded.items():
+            _write_cached_frame(_cache_path(cache_dir, pair, kind, start_date, end_date), df)
+        data.update(loaded)
+
+    logging.info(
+        f"[DATA_LOADER] {kind} cache | "
+        f"Hits: {len(pairs) - len(missing)} | Misses: {len(missing)}"
+    )
+
+    # Preserve the caller's pair order
+    return {pair: data[pair] for pair in pairs if pair in data}
+
+
 def load_backtest_data(
     pairs: List[str],
     start_date: datetime,
     end_date: datetime,
-    use_real_data: bool = True
+    use_real_data: bool = True,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR
 ) -> tuple[Dict[str, pd.DataFrame], Dict[str, pd.DataFrame]]:
     """
     Load all data required for backtesting
 
+    Each pair's history is cached as parquet under cache_dir, keyed by
+    (pair, start_date, end_date, use_real_data), so repeated backtests over
+    the same window memory-map the cached Arrow data instead of
+    re-fetching or re-simulating it. Caching is skipped if pyarrow is not
+    installed or cache_dir is None.
+
     Args:
         pairs: List of trading pairs
         start_date: Start date
         end_date: End date
         use_real_data: If True, attempt to load real Kraken data; otherwise simulate
+        cache_dir: Directory for the parquet cache (None disables caching)
 
     Returns:
         (market_data, cross_moat_data) tuple of dictionaries
@@ -320,15 +403,24 @@ def load_backtest_data(
 
     # Load market data
     if use_real_data:
-        market_data = load_kraken_ohlcv_history(pairs, start_date, end_date)
+        market_data = _load_with_cache(
+            pairs, "ohlcv", start_date, end_date, cache_dir,
+            lambda missing: load_kraken_ohlcv_history(missing, start_date, end_date)
+        )
     else:
-        market_data = {
-            pair: simulate_ohlcv_data(pair, start_date, end_date)
-            for pair in pairs
-        }
+        market_data = _load_with_cache(
+            pairs, "ohlcv-sim", start_date, end_date, cache_dir,
+            lambda missing: {
+                pair: simulate_ohlcv_data(pair, start_date, end_date)
+                for pair in missing
+            }
+        )
 
     # Load cross-moat data (currently always simulated)
-    cross_moat_data = load_github_history(pairs, start_date, end_date)
+    cross_moat_data = _load_with_cache(
+        pairs, "github", start_date, end_date, cache_dir,
+        lambda missing: load_github_history(missing, start_date, end_date)
+    )
 
     logging.info(
         f"[DATA_LOADER] Data loaded | "
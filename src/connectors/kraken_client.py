@@ -12,15 +12,51 @@ from kraken.exceptions import (
     KrakenServiceUnavailableError
 )
 
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for throttling outgoing REST calls.
+    acquire() blocks until a token is available.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 class KrakenClient:
     """
     Our system's only interface to the Kraken exchange.
     Includes threading lock to prevent EAPI:Invalid nonce errors.
 
     PHASE 2.4: Added error recovery with exponential backoff and automatic reconnection.
+
+    One instance is shared by every agent in the model. The SDK's Market client
+    keeps a single requests.Session, so ticker calls reuse pooled keep-alive
+    connections; public calls are additionally throttled by a token bucket to
+    stay under Kraken's rate limit.
     """
+    PUBLIC_RATE = 1.0  # public calls per second (sustained)
+    PUBLIC_BURST = 15
+    TICKER_BATCH_SIZE = 100  # pairs per Ticker request (keeps the URL short)
+
     def __init__(self):
         self.nonce_lock = threading.Lock()  # Nonce lock for thread safety
+        self.public_limiter = TokenBucket(self.PUBLIC_RATE, self.PUBLIC_BURST)
         self.max_retries = 3
         self.base_delay = 2.0  # seconds
         self.initialized = False
@@ -142,6 +178,7 @@ class KrakenClient:
             return {}
 
         def _fetch_ticker():
+            self.public_limiter.acquire()
             result = self.market.get_ticker(pair=pair)
             if result and isinstance(result, dict) and pair in result:
                 return result[pair]
@@ -153,6 +190,58 @@ class KrakenClient:
             logging.error(f"[KRAKEN] Failed to fetch market data for {pair}: {e}")
             return {}
 
+    def get_market_data_batch(self, pairs: list) -> dict:
+        """
+        Fetches ticker information for several pairs in one request per
+        TICKER_BATCH_SIZE pairs (Kraken's Ticker endpoint accepts a
+        comma-separated pair list).
+        Returns {pair: ticker}; pairs missing from the response are omitted.
+        """
+        if not self.market:
+            logging.error("[KRAKEN] Market client not initialized")
+            return {}
+
+        pairs = list(pairs)
+        tickers = {}
+        for start in range(0, len(pairs), self.TICKER_BATCH_SIZE):
+            chunk = pairs[start:start + self.TICKER_BATCH_SIZE]
+
+            def _fetch_tickers():
+                self.public_limiter.acquire()
+                return self.market.get_ticker(pair=chunk)
+
+            try:
+                result = self._retry_with_backoff(_fetch_tickers)
+            except Exception as e:
+                logging.error(f"[KRAKEN] Failed to fetch market data for {len(chunk)} pairs: {e}")
+                continue
+
+            if result and isinstance(result, dict):
+                tickers.update((pair, result[pair]) for pair in chunk if pair in result)
+        return tickers
+
+    def get_asset_pairs(self) -> dict:
+        """
+        Fetches every tradeable asset pair ({pair: info}) with retry logic,
+        throttled like the other public calls.
+        The SDK's Market.get_asset_pairs() is memoized for the life of the
+        process (its cache_clear is hidden behind the SDK's own decorators), so
+        the AssetPairs endpoint is requested directly to get a fresh list.
+        """
+        if not self.market:
+            logging.error("[KRAKEN] Market client not initialized")
+            return {}
+
+        def _fetch_asset_pairs():
+            self.public_limiter.acquire()
+            return self.market.request(method="GET", uri="/0/public/AssetPairs", auth=False)
+
+        try:
+            return self._retry_with_backoff(_fetch_asset_pairs) or {}
+        except Exception as e:
+            logging.error(f"[KRAKEN] Failed to fetch asset pairs: {e}")
+            return {}
+
     def place_order(self, pair: str, order_type: str, direction: str, amount: float, price: float = None) -> dict:
         """
         PHASE 2.4: Places a new order with retry logic.
@@ -10,6 +10,7 @@ Provides unified interface for enriched market intelligence.
 
 import logging
 import requests
+import threading
 import time
 from typing import Dict, Optional, List
 from datetime import datetime
@@ -257,16 +258,36 @@ class MarketDataAggregator:
     """
     Unified market data aggregator combining all sources
 
-    Provides enriched market intelligence for decision making
+    Provides enriched market intelligence for decision making.
+    Agents should use MarketDataAggregator.shared() so they share one set of
+    API clients and one enriched-data cache.
     """
 
+    # Seconds an enriched-data response is reused for the same symbol
+    ENRICHED_DATA_TTL = 15.0
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
     def __init__(self):
         self.cmc = CoinMarketCapClient()
         self.twelve = TwelveDataClient()
         self.freecrypto = FreeCryptoAPIClient()
 
+        # {symbol: (fetched_at, enriched_data)}
+        self._enriched_cache = {}
+        self._cache_lock = threading.Lock()
+
         logging.info("[AGGREGATOR] Market data aggregator initialized")
 
+    @classmethod
+    def shared(cls) -> 'MarketDataAggregator':
+        """Process-wide aggregator instance, created on first use"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
     def get_enriched_market_data(self, symbol: str) -> Dict:
         """
         Get comprehensive market data from all sources
@@ -276,7 +297,24 @@ class MarketDataAggregator:
         - Market cap and ranking
         - Sentiment indicators
         - Traditional market correlations
+
+        Responses are cached per symbol for ENRICHED_DATA_TTL seconds, so
+        agents watching the same symbol share one set of API calls.
         """
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._enriched_cache.get(symbol)
+        if cached is not None and now - cached[0] < self.ENRICHED_DATA_TTL:
+            return cached[1]
+
+        enriched_data = self._fetch_enriched_market_data(symbol)
+
+        with self._cache_lock:
+            self._enriched_cache[symbol] = (now, enriched_data)
+        return enriched_data
+
+    def _fetch_enriched_market_data(self, symbol: str) -> Dict:
+        """Query every source for `symbol` (uncached)"""
         enriched_data = {
             'symbol': symbol,
             'timestamp': datetime.now().isoformat(),
@@ -4,27 +4,94 @@ import json
 import logging
 import threading
 import time
-from config.settings import REDIS_HOST, REDIS_PORT
+from collections import defaultdict
+from config.settings import REDIS_HOST, REDIS_PORT, REDIS_MAX_CONNECTIONS
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # OPT_NON_STR_KEYS keeps parity with json.dumps for int/float dict keys
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(message) -> bytes:
+        return orjson.dumps(message, option=_ORJSON_OPTIONS)
+
+    _loads = orjson.loads
+else:
+    def _dumps(message) -> bytes:
+        return json.dumps(message).encode()
+
+    _loads = json.loads
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# High-volume simulated feature channels carried as MessagePack when installed.
+# Payloads stay self-describing: JSON objects start with '{', msgpack maps never do.
+MSGPACK_CHANNEL_PREFIXES = ("govt-data:", "logistics-data:")
+_MSGPACK_CHANNEL_PREFIXES_B = tuple(p.encode() for p in MSGPACK_CHANNEL_PREFIXES)
 
 class RedisClient:
     """
     Implements the 'Nervous System' (Part 4.2) of our Mycelial network.
     Handles all Redis Pub/Sub communication, serializing and deserializing
     messages (Python dicts <-> JSON strings) for the agents.
+    Uses orjson for (de)serialization when installed, falling back to json;
+    govt-data/logistics-data channels use msgpack when it is installed.
 
     PHASE 2.4: Added error recovery with exponential backoff and reconnection logic.
+
+    All clients share one process-wide ConnectionPool by default, so creating
+    several RedisClient objects doesn't repeat the TCP handshake per client.
+    Subscriptions share a single pubsub connection per client and are
+    dispatched to callbacks by channel in Python.
     """
-    def __init__(self):
+    _default_pool = None
+    _default_pool_lock = threading.Lock()
+
+    def __init__(self, pool: redis.ConnectionPool = None):
         self.host = REDIS_HOST
         self.port = REDIS_PORT
+        self.pool = pool or self.default_pool()
         self.connection = None
         self.connection_lock = threading.Lock()
         self.max_retries = 5
         self.base_delay = 1.0  # seconds
 
+        # Shared subscription state: one pubsub + one dispatcher thread per client
+        self._handlers = defaultdict(list)  # {channel: [callback, ...]}
+        self._pubsub = None
+        self._pending_channels = []  # New channels for the dispatcher thread to subscribe
+        self._dispatcher_thread = None
+        self._subscription_lock = threading.RLock()
+
         # Initial connection with retry logic
         self._connect_with_retry()
 
+    @classmethod
+    def default_pool(cls) -> redis.ConnectionPool:
+        """Lazily create the ConnectionPool shared by all RedisClient instances"""
+        with cls._default_pool_lock:
+            if cls._default_pool is None:
+                cls._default_pool = redis.ConnectionPool(
+                    host=REDIS_HOST,
+                    port=REDIS_PORT,
+                    db=0,
+                    max_connections=REDIS_MAX_CONNECTIONS,
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                    socket_keepalive=True,
+                    health_check_interval=30
+                )
+            return cls._default_pool
+
     def _connect_with_retry(self):
         """
         PHASE 2.4: Connect to Redis with exponential backoff retry logic
@@ -39,15 +106,7 @@ class RedisClient:
         for attempt in range(self.max_retries):
             try:
                 with self.connection_lock:
-                    self.connection = redis.Redis(
-                        host=self.host,
-                        port=self.port,
-                        db=0,
-                        decode_responses=False,
-                        socket_connect_timeout=5,
-                        socket_keepalive=True,
-                        health_check_interval=30
-                    )
+                    self.connection = redis.Redis(connection_pool=self.pool)
                     self.connection.ping()
                     logging.info(f"[REDIS] Connected to {self.host}:{self.port}")
                     return True
@@ -92,19 +151,59 @@ class RedisClient:
         logging.warning("[REDIS] No active connection, attempting to connect...")
         return self._connect_with_retry()
 
+    @staticmethod
+    def encode_message(message) -> bytes:
+        """Serialize a message to the JSON wire format used on every channel"""
+        return _dumps(message)
+
+    @staticmethod
+    def uses_msgpack(channel) -> bool:
+        """Whether messages published on `channel` (str or bytes) are msgpack-encoded"""
+        if not MSGPACK_AVAILABLE:
+            return False
+        if isinstance(channel, bytes):
+            return channel.startswith(_MSGPACK_CHANNEL_PREFIXES_B)
+        return channel.startswith(MSGPACK_CHANNEL_PREFIXES)
+
+    @classmethod
+    def encode_for_channel(cls, channel, message) -> bytes:
+        """Serialize a message in the wire format used on `channel`"""
+        if cls.uses_msgpack(channel):
+            return msgpack.packb(message, use_bin_type=True)
+        return _dumps(message)
+
+    @classmethod
+    def decode_message(cls, channel, data):
+        """Deserialize a payload received on `channel` (JSON, or msgpack on msgpack channels)"""
+        if cls.uses_msgpack(channel) and data[:1] != b'{':
+            return msgpack.unpackb(data, raw=False)
+        return _loads(data)
+
     def publish_message(self, channel: str, message: dict):
         """
         PHASE 2.4: Publishes a Python dictionary as a JSON string to a Redis channel.
         Now includes automatic reconnection on failure.
         """
+        try:
+            json_message = self.encode_for_channel(channel, message)
+        except Exception as e:
+            logging.error(f"[REDIS] Error publishing to {channel}: {e}")
+            return
+
+        self.publish_raw(channel, json_message)
+
+    def publish_raw(self, channel: str, payload: bytes):
+        """
+        Publishes an already-encoded message (see encode_message) to a Redis channel.
+        Lets callers that resend the same payload skip re-serialization.
+        """
         if not self._ensure_connection():
             logging.error("[REDIS] Cannot publish - connection unavailable")
             return
 
         try:
-            json_message = json.dumps(message)
-            self.connection.publish(channel, json_message)
-            logging.debug(f"[REDIS] Published to {channel}: {json_message[:100]}...")
+            self.connection.publish(channel, payload)
+            logging.debug("[REDIS] Published to %s: %.100s...", channel, payload)
         except (redis.ConnectionError, redis.TimeoutError) as e:
             logging.error(f"[REDIS] Connection error publishing to {channel}: {e}")
             # Attempt reconnection for next operation
@@ -112,73 +211,149 @@ class RedisClient:
         except Exception as e:
             logging.error(f"[REDIS] Error publishing to {channel}: {e}")
 
+    def publish_raw_many(self, items):
+        """
+        Publishes several already-encoded messages in one pipelined round trip.
+        `items` is an iterable of (channel, payload) pairs.
+        """
+        if not self._ensure_connection():
+            logging.error("[REDIS] Cannot publish - connection unavailable")
+            return
+
+        try:
+            pipe = self.connection.pipeline(transaction=False)
+            for channel, payload in items:
+                pipe.publish(channel, payload)
+            pipe.execute()
+        except (redis.ConnectionError, redis.TimeoutError) as e:
+            logging.error(f"[REDIS] Connection error publishing batch: {e}")
+            self._ensure_connection()
+        except Exception as e:
+            logging.error(f"[REDIS] Error publishing batch: {e}")
+
     def subscribe(self, channel: str, callback_function):
         """
         PHASE 2.4: Subscribes to a channel and runs the callback function for each message.
         Now includes automatic reconnection on connection loss.
 
-        This must run in a non-blocking background thread.
-        Each subscription gets its own isolated pubsub object (private mailbox).
+        All subscriptions on this client share one pubsub connection and one
+        background dispatcher thread, which routes each message to every
+        callback registered for its channel. Each callback still gets its own
+        freshly decoded dict (private mailbox), so handlers can't see each
+        other's mutations.
+
+        PubSub objects aren't thread-safe, so a new channel is only queued
+        here; the dispatcher thread issues the SUBSCRIBE itself between reads.
         """
         if not self._ensure_connection():
             logging.error(f"[REDIS] Cannot subscribe to {channel} - connection unavailable")
             return
 
-        def _listener_thread():
-            retry_delay = 1.0
-            max_retry_delay = 60.0
-
-            while True:  # Auto-reconnect loop
-                try:
-                    # Ensure connection before creating pubsub
-                    if not self._ensure_connection():
-                        logging.error(f"[REDIS] Failed to connect for {channel}, retrying in {retry_delay}s...")
-                        time.sleep(retry_delay)
-                        retry_delay = min(retry_delay * 2, max_retry_delay)
-                        continue
+        with self._subscription_lock:
+            if channel not in self._handlers:
+                self._pending_channels.append(channel)
+            self._handlers[channel].append(callback_function)
 
-                    # Create a new, isolated pubsub object for this subscriber
-                    pubsub = self.connection.pubsub(ignore_subscribe_messages=True)
-                    pubsub.subscribe(channel)
-                    logging.info(f"[REDIS] Subscribed to channel: {channel}")
-
-                    # Reset retry delay on successful connection
-                    retry_delay = 1.0
-
-                    # Listen for messages
-                    for message in pubsub.listen():
-                        try:
-                            # Deserialize the JSON message back into a Python dict
-                            data = json.loads(message['data'])
-                            # Pass the dict to the agent's callback
-                            callback_function(data)
-                        except json.JSONDecodeError as e:
-                            logging.warning(f"[REDIS] Invalid JSON from {channel}: {e}")
-                        except Exception as e:
-                            logging.warning(f"[REDIS] Error processing message from {channel}: {e}")
-
-                except redis.ConnectionError as e:
-                    logging.error(
-                        f"[REDIS] Connection lost for {channel}: {e} | "
-                        f"Reconnecting in {retry_delay}s..."
-                    )
-                    try:
-                        pubsub.close()
-                    except:
-                        pass
-                    time.sleep(retry_delay)
-                    retry_delay = min(retry_delay * 2, max_retry_delay)
+            if self._dispatcher_thread is None:
+                # Start the listener in a daemon thread so it doesn't block
+                self._dispatcher_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+                self._dispatcher_thread.start()
+                logging.info("[REDIS] Subscription dispatcher thread started")
+
+        logging.info(f"[REDIS] Subscription registered for {channel}")
+
+    def _open_pubsub(self):
+        """Create the shared pubsub and (re)subscribe every registered channel"""
+        pubsub = self.connection.pubsub(ignore_subscribe_messages=True)
+        with self._subscription_lock:
+            channels = list(self._handlers)
+            if channels:
+                pubsub.subscribe(*channels)
+            self._pending_channels.clear()
+            self._pubsub = pubsub
+        logging.info(f"[REDIS] Subscribed to {len(channels)} channel(s): {channels}")
+        return pubsub
+
+    def _subscribe_pending(self, pubsub):
+        """Subscribe channels queued by subscribe(); dispatcher thread only"""
+        with self._subscription_lock:
+            channels, self._pending_channels = self._pending_channels, []
+        if channels:
+            pubsub.subscribe(*channels)
+            logging.info(f"[REDIS] Subscribed to channel(s): {channels}")
+
+    def _close_pubsub(self):
+        with self._subscription_lock:
+            pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+
+    def _dispatch_loop(self):
+        """Single listener for all subscriptions, with auto-reconnect"""
+        retry_delay = 1.0
+        max_retry_delay = 60.0
 
-                except Exception as e:
-                    logging.error(f"[REDIS] Unhandled error in listener for {channel}: {e}")
-                    try:
-                        pubsub.close()
-                    except:
-                        pass
+        while True:  # Auto-reconnect loop
+            try:
+                # Ensure connection before creating pubsub
+                if not self._ensure_connection():
+                    logging.error(f"[REDIS] Failed to connect for subscriptions, retrying in {retry_delay}s...")
                     time.sleep(retry_delay)
                     retry_delay = min(retry_delay * 2, max_retry_delay)
+                    continue
+
+                pubsub = self._open_pubsub()
+
+                # Reset retry delay on successful connection
+                retry_delay = 1.0
+
+                # Listen for messages
+                while True:
+                    self._subscribe_pending(pubsub)
+                    if not pubsub.subscribed:
+                        # Nothing subscribed yet; wait briefly
+                        time.sleep(0.1)
+                        continue
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._dispatch(message)
+
+            except redis.ConnectionError as e:
+                logging.error(
+                    f"[REDIS] Subscription connection lost: {e} | "
+                    f"Reconnecting in {retry_delay}s..."
+                )
+                self._close_pubsub()
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, max_retry_delay)
 
-        # Start the listener in a daemon thread so it doesn't block
-        thread = threading.Thread(target=_listener_thread, daemon=True)
-        thread.start()
-        logging.info(f"[REDIS] Subscription listener thread started for {channel}")
+            except Exception as e:
+                logging.error(f"[REDIS] Unhandled error in subscription dispatcher: {e}")
+                self._close_pubsub()
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, max_retry_delay)
+
+    def _dispatch(self, message: dict):
+        """Deliver one pubsub message to every callback registered for its channel"""
+        channel = message['channel']
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+
+        handlers = self._handlers.get(channel)
+        if not handlers:
+            return
+
+        for callback_function in list(handlers):
+            try:
+                # Deserialize the JSON message back into a Python dict
+                data = self.decode_message(channel, message['data'])
+                # Pass the dict to the agent's callback
+                callback_function(data)
+            except json.JSONDecodeError as e:
+                logging.warning(f"[REDIS] Invalid JSON from {channel}: {e}")
+                return
+            except Exception as e:
+                logging.warning(f"[REDIS] Error processing message from {channel}: {e}")
@@ -7,6 +7,7 @@ from src.agents.trading_agent import TradingAgent
 from src.agents.risk_management_agent import RiskManagementAgent
 from src.agents.pattern_learner_agent import PatternLearnerAgent
 from src.agents.repo_scrape_agent import RepoScrapeAgent
+from src.agents.base.data_engineer_base import DataEngineerBase
 from src.agents.builder_agent import BuilderAgent
 from src.agents.logistics_miner_agent import LogisticsMinerAgent
 from src.agents.govt_data_miner_agent import GovtDataMinerAgent
@@ -27,6 +28,22 @@ import json
 import time
 import threading  # BIG ROCK 31: Graceful Shutdown
 import queue  # PHASE 2.2: Thread-safe SQLite write queue
+from concurrent.futures import ThreadPoolExecutor
+
+# Agents whose step() is dominated by network I/O (API fetch + Redis publish).
+# These are stepped concurrently; everything else stays on the model thread.
+# DataMinerAgent's feature kernel is compiled with nogil, so its CPU work
+# also runs in parallel across pairs on the same pool. MarketExplorerAgent
+# scans (Kraken tickers + Redis moat signals) overlap across all nine teams;
+# KrakenClient's token bucket keeps them under the public rate limit.
+IO_BOUND_AGENT_TYPES = (DataEngineerBase, RepoScrapeAgent, DataMinerAgent, MarketExplorerAgent)
+MAX_IO_STEP_WORKERS = 32
+
+# Seconds the cross-moat signal readings are reused across MarketExplorer scans
+MOAT_SIGNAL_TTL = 60.0
+
+# Seconds Kraken's tradeable pair list is reused (the universe changes over days)
+TRADEABLE_PAIRS_TTL = 3600.0
 
 class MycelialModel(mesa.Model):
     """
@@ -69,10 +86,53 @@ class MycelialModel(mesa.Model):
         self.archived_pattern_count = 0
         self.archive_check_interval = 300  # Check every 5 minutes (300 steps)
 
+        # Persistent pool for stepping I/O-bound agents (created on first step)
+        self._io_executor = None
+
+        # Per-step publish pipeline: agents queue their PUBLISHes here while a
+        # step is running and the whole tick is sent in one round trip at the
+        # end of step(). Outside a step (listener callbacks) publishes go direct.
+        self._pub_pipe = None
+        self._pub_lock = threading.Lock()
+        # Single background writer that executes each tick's pipeline, so
+        # step() doesn't wait on the PUBLISH replies (nobody reads them)
+        self._pub_writer = None
+        self._stepping = False
+
         # BIG ROCK 43: Active asset tracking (Q3: max 15 assets)
         self.active_assets = {}  # {pair: {"team_type": str, "confidence": float, "status": str, "deployed_at": float}}
         self.max_active_assets = 15
 
+        # Latest DataMiner features per pair ({pair: FeatureSnapshot}). Finance
+        # SwarmBrains and TA agents read it instead of subscribing to
+        # market-data; DataMiners still publish for other processes
+        self.feature_cache = {}
+
+        # Live SwarmBrains (PatternLearnerAgents), kept by the agents themselves
+        # as they are created and removed, so the Instigator never scans all agents
+        self.swarm_brains = []
+
+        # Kraken tickers for every watched pair, fetched in one request at the
+        # start of each step ({pair: ticker}); DataMiners read from here
+        self.ticker_snapshot = {}
+
+        # Tickers for the MarketExplorer pair universe, fetched by the first
+        # explorer to scan in a step and shared by the other teams that step
+        self.current_ticker_snapshot = {}
+        self._ticker_snapshot_step = -1
+        self._ticker_snapshot_lock = threading.Lock()
+
+        # Cross-moat signal readings ({redis key: float}) shared by all
+        # explorers, refreshed at most every MOAT_SIGNAL_TTL seconds
+        self.moat_signals = {}
+        self._moat_signals_at = None
+        self._moat_signals_lock = threading.Lock()
+
+        # Kraken USD pair universe for the explorers, refreshed hourly
+        self.tradeable_pairs = []
+        self._tradeable_pairs_at = None
+        self._tradeable_pairs_lock = threading.Lock()
+
         # Initialize with bootstrap assets (BTC, ETH)
         self.active_assets["XXBTZUSD"] = {
             "team_type": "Bootstrap",
@@ -119,6 +179,8 @@ class MycelialModel(mesa.Model):
             self.running = False
             return
 
+        self._pub_pipe = self.redis_client.connection.pipeline(transaction=False)
+
         # PHASE 2.2: SQL Database Initialization with Thread-Safe Write Queue
         self.db_connection = None
         self.db_cursor = None
@@ -144,6 +206,10 @@ class MycelialModel(mesa.Model):
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
+            # Serves "most recent patterns" queries without a full sort
+            self.db_cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_patterns_timestamp ON patterns(timestamp DESC)'
+            )
             self.db_connection.commit()
             logging.info("[SQL] Pattern database initialized: mycelial_patterns.db")
         except Exception as e:
@@ -341,11 +407,43 @@ class MycelialModel(mesa.Model):
                     # In production: Send Redis message to halt policy sharing temporarily
                     # self.redis_client.publish("system-control", {"action": "halt_policy_sharing"})
 
-            # Step each agent in random order
-            agents_list = list(self.agents)
+            # Step each agent in random order. I/O-bound data engineers run
+            # concurrently on the pool while traders, risk managers and other
+            # CPU agents keep their sequential ordering on this thread.
+            # Agents with a step_interval > 1 are only stepped on their ticks.
+            tick = self.step_counter + 1
+            agents_list = [a for a in self.agents if a.step_interval == 1 or tick % a.step_interval == 0]
             random.shuffle(agents_list)
-            for agent in agents_list:
-                agent.step()
+            io_agents = [a for a in agents_list if isinstance(a, IO_BOUND_AGENT_TYPES)]
+            cpu_agents = [a for a in agents_list if not isinstance(a, IO_BOUND_AGENT_TYPES)]
+
+            self._refresh_ticker_snapshot(io_agents)
+
+            self._begin_publish_batch()
+            try:
+                io_results = None
+                if io_agents:
+                    if self._io_executor is None:
+                        self._io_executor = ThreadPoolExecutor(
+                            max_workers=min(MAX_IO_STEP_WORKERS, len(io_agents)),
+                            thread_name_prefix="io-agent-step"
+                        )
+                    io_results = self._io_executor.map(lambda a: a.step(), io_agents)
+
+                for agent in cpu_agents:
+                    agent.step()
+
+                if io_results is not None:
+                    # Wait for the tick to finish and surface any agent exception
+                    for _ in io_results:
+                        pass
+            finally:
+                self._flush_publishes()
+
+            # SwarmBrain policy snapshots are written behind, every few steps
+            policy_write_buffer = getattr(self, 'policy_write_buffer', None)
+            if policy_write_buffer is not None:
+                policy_write_buffer.tick()
 
             # BIG ROCK 33: Pattern Archiving Check (every 5 minutes)
             self.step_counter += 1
@@ -356,6 +454,108 @@ class MycelialModel(mesa.Model):
             logging.error(f"Error during model step: {e}")
             self.running = False
 
+    def _refresh_ticker_snapshot(self, agents):
+        """Fetch this tick's tickers for all DataMiners with a single Kraken call"""
+        pairs = list({a.pair for a in agents if isinstance(a, DataMinerAgent)})
+        self.ticker_snapshot = self.kraken_client.get_market_data_batch(pairs) if pairs else {}
+
+    def get_ticker_snapshot(self, pairs):
+        """
+        Tickers for `pairs` ({pair: ticker}) as of the current step. Fetched
+        once per step; concurrent explorers wait for and reuse the same
+        snapshot instead of each calling Kraken.
+        """
+        with self._ticker_snapshot_lock:
+            if self._ticker_snapshot_step != self.step_counter:
+                self.current_ticker_snapshot = self.kraken_client.get_market_data_batch(pairs)
+                self._ticker_snapshot_step = self.step_counter
+            return self.current_ticker_snapshot
+
+    def get_moat_signals(self, fetch):
+        """
+        Cross-moat signal readings, refreshed with `fetch()` (one Redis MGET)
+        once they are older than MOAT_SIGNAL_TTL seconds.
+        """
+        with self._moat_signals_lock:
+            now = time.monotonic()
+            if self._moat_signals_at is None or now - self._moat_signals_at >= MOAT_SIGNAL_TTL:
+                self.moat_signals = fetch()
+                self._moat_signals_at = now
+            return self.moat_signals
+
+    def get_tradeable_pairs(self, fetch):
+        """
+        Kraken pairs the explorers scan, refreshed with `fetch()` once older
+        than TRADEABLE_PAIRS_TTL seconds. Failed or empty fetches are not
+        cached, so the next scan retries; until then the last list is kept.
+        """
+        with self._tradeable_pairs_lock:
+            now = time.monotonic()
+            if self._tradeable_pairs_at is None or now - self._tradeable_pairs_at >= TRADEABLE_PAIRS_TTL:
+                pairs = fetch()
+                if not pairs:
+                    return self.tradeable_pairs or pairs
+                self.tradeable_pairs = pairs
+                self._tradeable_pairs_at = now
+            return self.tradeable_pairs
+
+    def queue_publish(self, channel: str, payload: bytes):
+        """
+        Queue an already-encoded message for the end-of-step publish flush.
+        Thread-safe, so agents stepped on the I/O pool can call it directly.
+        Outside of step() the message is published immediately.
+        """
+        with self._pub_lock:
+            if self._stepping:
+                self._pub_pipe.publish(channel, payload)
+                return
+
+        self.redis_client.publish_raw(channel, payload)
+
+    def queue_publish_many(self, items):
+        """
+        Queue several already-encoded (channel, payload) messages at once.
+        Outside of step() they are sent together in one pipelined round trip.
+        """
+        with self._pub_lock:
+            if self._stepping:
+                for channel, payload in items:
+                    self._pub_pipe.publish(channel, payload)
+                return
+
+        self.redis_client.publish_raw_many(items)
+
+    def _begin_publish_batch(self):
+        """Start queueing agent publishes for this step (if the pipeline exists)"""
+        with self._pub_lock:
+            self._stepping = self._pub_pipe is not None
+
+    def _flush_publishes(self):
+        """
+        Send every PUBLISH queued during this step in a single round trip.
+        Fire-and-forget: the filled pipeline is handed to the background writer
+        (one thread, so ticks stay in order) and a fresh one takes its place.
+        """
+        with self._pub_lock:
+            self._stepping = False
+            if self._pub_pipe is None or not len(self._pub_pipe):
+                return
+            pipe = self._pub_pipe
+            self._pub_pipe = self.redis_client.connection.pipeline(transaction=False)
+
+        if self._pub_writer is None:
+            self._pub_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="redis-publish")
+        self._pub_writer.submit(self._execute_publishes, pipe)
+
+    def _execute_publishes(self, pipe):
+        """Runs on the publish writer thread"""
+        try:
+            pipe.execute()
+        except Exception as e:
+            # The tick's messages are dropped
+            logging.error(f"[REDIS] Failed to flush step publishes: {e}")
+            self.redis_client._ensure_connection()
+
     def _calculate_system_risk(self) -> float:
         """
         BIG ROCK 20: Calculate current system risk level (0.0 to 1.0).
@@ -384,7 +584,7 @@ class MycelialModel(mesa.Model):
                 logging.critical("=" * 80)
 
                 # Broadcast HALT_TRADING to all agents
-                self.redis_client.publish("system-control", {
+                self.redis_client.publish_message("system-control", {
                     "command": "HALT_TRADING",
                     "reason": f"Emergency shutdown: {reason}"
                 })
@@ -393,6 +593,11 @@ class MycelialModel(mesa.Model):
                 logging.info("[SHUTDOWN] Archiving final patterns...")
                 self._archive_high_value_patterns()
 
+                # Write out any buffered SwarmBrain policy snapshots
+                policy_write_buffer = getattr(self, 'policy_write_buffer', None)
+                if policy_write_buffer is not None:
+                    policy_write_buffer.flush()
+
                 # Close database connection
                 if self.db_connection:
                     self.db_connection.commit()
@@ -401,6 +606,10 @@ class MycelialModel(mesa.Model):
 
                 # Stop model execution
                 self.running = False
+                if self._io_executor is not None:
+                    self._io_executor.shutdown(wait=False)
+                if self._pub_writer is not None:
+                    self._pub_writer.shutdown(wait=False)
                 logging.critical("[SHUTDOWN] Model stopped. System is safe to exit.")
 
         except Exception as e:
@@ -447,7 +656,9 @@ class MycelialModel(mesa.Model):
                 agents_to_remove.append(agent)
 
         for agent in agents_to_remove:
-            self.schedule.remove(agent)
+            # Mesa 3: the agent deregisters itself (and leaves swarm_brains)
+            agent.remove()
+        self.feature_cache.pop(pair, None)
 
         # Archive patterns before hibernation
         self._archive_asset_patterns(pair)
@@ -582,7 +793,7 @@ class MycelialModel(mesa.Model):
                         )
 
                         # Publish consensus to Builder Agent
-                        self.redis_client.publish("prospecting-consensus", {
+                        self.redis_client.publish_message("prospecting-consensus", {
                             "pair": pair,
                             "team_type": team_type,
                             "votes": len(votes),
@@ -732,7 +943,7 @@ class MycelialModel(mesa.Model):
                 if cursor == 0:
                     break
 
-            logging.debug(f"[SCAN] Found {len(keys)} keys matching '{pattern}'")
+            logging.debug("[SCAN] Found %d keys matching '%s'", len(keys), pattern)
             return keys
 
         except Exception as e:
@@ -819,7 +1030,7 @@ class MycelialModel(mesa.Model):
                         },
                         'timestamp': time.time()
                     }
-                    self.redis_client.publish("pattern-validation-request", json.dumps(validation_request))
+                    self.redis_client.publish_message("pattern-validation-request", validation_request)
 
                 logging.info(f"[VALIDATION] Sent {len(high_value_patterns)} validation requests to Deep Research agents")
             else:
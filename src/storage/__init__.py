@@ -1,4 +1,6 @@
 # src/storage/__init__.py
-from .chroma_client import ChromaDBClient, create_pattern_embedding
+from .chroma_client import (
+    ChromaDBClient, create_pattern_embedding, create_pattern_embeddings_from_columns,
+)
 
-__all__ = ['ChromaDBClient', 'create_pattern_embedding']
+__all__ = ['ChromaDBClient', 'create_pattern_embedding', 'create_pattern_embeddings_from_columns']
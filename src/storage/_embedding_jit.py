@@ -0,0 +1,43 @@
+# src/storage/_embedding_jit.py - JIT-compiled pattern embedding kernel
+"""
+Numeric core of create_pattern_embeddings_from_columns().
+
+Takes one float32 column per feature and writes the normalized (N, 8)
+embedding matrix into a preallocated output array. Compiled with Numba when
+available (see _njit.py), plain NumPy otherwise.
+"""
+
+import numpy as np
+
+from ._njit import njit
+
+
+EMBED_DIM = 8
+
+
+@njit(cache=True, fastmath=True)
+def _embed_batch(rsi, macd, volume, price_change_pct, cross_moat_score,
+                 hour, weekday, pnl_pct, out):
+    # Technical indicators
+    out[:, 0] = rsi / 100.0                       # Normalize 0-1
+    out[:, 1] = (macd + 10.0) / 20.0              # Normalize roughly -10 to 10
+    out[:, 2] = np.log1p(volume) / 20.0           # Log normalize volume
+
+    # Price movements
+    out[:, 3] = (price_change_pct + 10.0) / 20.0  # Normalize -10% to +10%
+
+    # Cross-moat signals
+    out[:, 4] = cross_moat_score / 2.0            # 0-2 scale
+
+    # Time features
+    out[:, 5] = hour / 24.0
+    out[:, 6] = weekday / 7.0
+
+    # Performance features
+    out[:, 7] = (pnl_pct + 20.0) / 40.0           # Normalize -20% to +20%
+
+
+def warm_up():
+    """Trigger JIT compilation on a tiny dummy batch so real ingests skip it"""
+    columns = [np.zeros(2, dtype=np.float32) for _ in range(EMBED_DIM)]
+    _embed_batch(*columns, np.empty((2, EMBED_DIM), dtype=np.float32))
@@ -0,0 +1,22 @@
+# src/storage/_njit.py - Optional Numba JIT decorator
+"""
+Numba is an optional dependency. When it is installed, `njit` compiles the
+decorated kernel to machine code; otherwise it returns the function unchanged
+so the same (NumPy) code runs in the interpreter.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and parameterized use)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
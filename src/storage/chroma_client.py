@@ -19,6 +19,14 @@ from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import json
 
+from ._embedding_jit import EMBED_DIM, _embed_batch, warm_up as _warm_up_embedding_jit
+from ._njit import NUMBA_AVAILABLE
+
+# Batched embeddings are held in half precision: the features are hand-scaled
+# to roughly 0-1, so float16 loses nothing that matters for similarity and
+# halves the buffers. ChromaDB takes float32, so they're upcast on insert.
+EMBEDDING_DTYPE = np.float16
+
 
 try:
     import chromadb
@@ -80,6 +88,10 @@ class ChromaDBClient:
 
         logging.info("[CHROMADB] Collections initialized")
 
+        # Compile the embedding kernel now so the first real ingest doesn't pay for it
+        if NUMBA_AVAILABLE:
+            _warm_up_embedding_jit()
+
     def _get_or_create_collection(self, name: str, metadata: Dict = None):
         """Get existing collection or create new one"""
         try:
@@ -120,6 +132,52 @@ class ChromaDBClient:
             f"Success: {success} | Pair: {metadata.get('pair', 'unknown')}"
         )
 
+    def store_patterns_bulk(self, ids: List[str], embeddings: np.ndarray,
+                            metadatas: List[Dict], successes: np.ndarray,
+                            batch_size: int = 500):
+        """
+        Store many trading patterns with one collection.add() per batch
+
+        Patterns are split by success into trading_patterns/failed_patterns,
+        so N patterns cost ~N/batch_size round trips instead of N.
+
+        Args:
+            ids: Unique pattern identifiers
+            embeddings: (N, D) array of pattern vectors (float16 from the
+                batch embedding helpers; upcast to float32 for ChromaDB)
+            metadatas: Pattern metadata, aligned with ids
+            successes: (N,) bool array, True for successful patterns
+            batch_size: Maximum patterns per collection.add() call
+        """
+        if len(ids) == 0:
+            return
+
+        # Upcast at the ChromaDB boundary (no copy if already float32)
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        successes = np.asarray(successes, dtype=bool)
+
+        # Add timestamp if not present
+        now_iso = datetime.now().isoformat()
+        for metadata in metadatas:
+            if 'timestamp' not in metadata:
+                metadata['timestamp'] = now_iso
+
+        for collection, mask in ((self.trading_patterns, successes),
+                                 (self.failed_patterns, ~successes)):
+            indices = np.flatnonzero(mask)
+            for start in range(0, len(indices), batch_size):
+                batch = indices[start:start + batch_size]
+                collection.add(
+                    ids=[ids[i] for i in batch],
+                    embeddings=embeddings[batch],
+                    metadatas=[metadatas[i] for i in batch]
+                )
+
+        logging.debug(
+            f"[CHROMADB] Bulk patterns stored | Count: {len(ids)} | "
+            f"Success: {int(successes.sum())} | Failed: {int((~successes).sum())}"
+        )
+
     def find_similar_patterns(self, query_embedding: List[float],
                              n_results: int = 10,
                              success_only: bool = True,
@@ -146,15 +204,7 @@ class ChromaDBClient:
         )
 
         # Format results
-        similar_patterns = []
-        if results['ids'] and len(results['ids'][0]) > 0:
-            for i in range(len(results['ids'][0])):
-                pattern = {
-                    'id': results['ids'][0][i],
-                    'distance': results['distances'][0][i],
-                    'metadata': results['metadatas'][0][i]
-                }
-                similar_patterns.append(pattern)
+        similar_patterns = self._format_query_results(results, 0) if results['ids'] else []
 
         logging.debug(
             f"[CHROMADB] Similarity search | "
@@ -164,6 +214,63 @@ class ChromaDBClient:
 
         return similar_patterns
 
+    def find_similar_patterns_batch(self, query_embeddings: np.ndarray,
+                                    n_results: int = 10,
+                                    success_only: bool = True,
+                                    filter_metadata: Dict = None) -> List[List[Dict]]:
+        """
+        Find similar patterns for many query vectors with one collection.query()
+
+        M queries cost one round trip and one batched HNSW search instead of M.
+
+        Args:
+            query_embeddings: (M, D) array of query vectors (float16 from the
+                batch embedding helpers; upcast to float32 for ChromaDB)
+            n_results: Number of similar patterns to return per query
+            success_only: Only search successful patterns
+            filter_metadata: Optional metadata filters, applied to every query
+
+        Returns:
+            M lists of similar patterns (as find_similar_patterns), aligned
+            with the rows of query_embeddings
+        """
+        if len(query_embeddings) == 0:
+            return []
+
+        collection = self.trading_patterns if success_only else self.failed_patterns
+
+        # Upcast at the ChromaDB boundary (no copy if already float32)
+        query_embeddings = np.asarray(query_embeddings, dtype=np.float32)
+
+        results = collection.query(
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+            where=filter_metadata
+        )
+
+        n_queries = len(query_embeddings)
+        if not results['ids']:
+            return [[] for _ in range(n_queries)]
+        batch = [self._format_query_results(results, q) for q in range(n_queries)]
+
+        logging.debug(
+            f"[CHROMADB] Batch similarity search | "
+            f"Queries: {n_queries} x {query_embeddings.shape[1]}D | "
+            f"Found: {sum(len(patterns) for patterns in batch)} patterns"
+        )
+
+        return batch
+
+    @staticmethod
+    def _format_query_results(results: Dict, q: int) -> List[Dict]:
+        """Matches for query row q of a collection.query() result"""
+        return [
+            {'id': pattern_id, 'distance': distance, 'metadata': metadata}
+            for pattern_id, distance, metadata in zip(
+                results['ids'][q], results['distances'][q], results['metadatas'][q]
+            )
+        ]
+
     def get_pattern_clusters(self, n_clusters: int = 5, success_only: bool = True) -> List[List[str]]:
         """
         Get pattern clusters for Federated Reinforcement Learning
@@ -417,6 +524,51 @@ def create_pattern_embedding(pattern_data: Dict) -> List[float]:
     return features
 
 
+def create_pattern_embeddings_from_columns(n: int, *, hour, weekday,
+                                           rsi=50.0, macd=0.0, volume=0.0,
+                                           price_change_pct=0.0,
+                                           cross_moat_score=0.0,
+                                           pnl_pct=0.0) -> np.ndarray:
+    """
+    Create embeddings straight from per-feature columns (struct-of-arrays)
+
+    For callers that already hold their patterns column-wise (e.g. a
+    DataFrame of closed positions), this skips building N pattern dicts
+    just to pull the columns back out of them. Each feature may be an
+    (N,) array or a scalar applied to every row.
+
+    Args:
+        n: Number of patterns
+        hour, weekday: Entry time features
+        rsi, macd, volume, price_change_pct, cross_moat_score, pnl_pct:
+            Pattern features (defaults match create_pattern_embedding)
+
+    Returns:
+        (N, 8) float16 array, one embedding per pattern
+    """
+    def column(values) -> np.ndarray:
+        # Always a writable C-contiguous float32 array, the layout warm_up()
+        # compiles for, so no call pays for a second kernel specialization
+        values = np.asarray(values, dtype=np.float32)
+        if values.ndim == 0:
+            return np.full(n, values, dtype=np.float32)
+        return np.require(np.broadcast_to(values, (n,)), np.float32, ['C_CONTIGUOUS', 'WRITEABLE'])
+
+    # The kernel computes in float32; the result is kept as EMBEDDING_DTYPE
+    embeddings = np.empty((n, EMBED_DIM), dtype=np.float32)
+    _embed_batch(
+        column(rsi),
+        column(macd),
+        column(volume),
+        column(price_change_pct),
+        column(cross_moat_score),
+        column(hour),
+        column(weekday),
+        column(pnl_pct),
+        embeddings
+    )
+    return embeddings.astype(EMBEDDING_DTYPE)
+
 # =============================================================================
 # MAIN - Example Usage
 # =============================================================================
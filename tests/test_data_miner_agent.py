@@ -0,0 +1,211 @@
+"""
+Mycelial Finance - DataMiner Feature Unit Tests
+
+Unit tests for the DataMinerAgent ring buffer, feature calculation and
+the message it publishes. Features are checked against the pandas
+implementation the NumPy kernel replaced.
+
+Run with: pytest tests/test_data_miner_agent.py
+"""
+
+import json
+import math
+import mesa
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from src.agents.data_miner_agent import DataMinerAgent, calculate_features
+from src.connectors.redis_client import RedisClient, _dumps, _loads
+
+
+def reference_features(df: pd.DataFrame, period=14):
+    """The previous pandas calculate_features (pd.concat history buffer)"""
+    if df.empty or len(df) < period + 1:
+        return None
+
+    delta = df['close'].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    df['RSI'] = 100 - (100 / (1 + rs))
+
+    high_low = df['high'] - df['low']
+    high_close = np.abs(df['high'] - df['close'].shift())
+    low_close = np.abs(df['low'] - df['close'].shift())
+    ranges = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    df['ATR'] = ranges.ewm(span=period, adjust=False).mean()
+
+    df['MOM'] = df['close'].pct_change(periods=5)
+    return df.iloc[-1].to_dict()
+
+
+def random_walk(n, seed=7):
+    """n ticks of (close, high, low) around 100"""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 0.5, n))
+    high = close + rng.uniform(0.0, 1.0, n)
+    low = close - rng.uniform(0.0, 1.0, n)
+    return close, high, low
+
+
+@pytest.fixture
+def model():
+    """Create a bare Mesa model with mocked Redis and Kraken clients"""
+    model = mesa.Model()
+    model.redis_client = MagicMock()
+    model.kraken_client = MagicMock()
+    model.ticker_snapshot = {}
+    return model
+
+
+class TestCalculateFeatures:
+    """Unit tests for calculate_features"""
+
+    def test_history_too_short(self):
+        """Test no features until period + 1 closes are buffered"""
+        close = np.full(14, 100.0)
+        assert calculate_features(close, close + 1, close - 1, period=14) is None
+
+    def test_flat_window_omits_rsi(self):
+        """Test a flat window leaves RSI out instead of publishing NaN"""
+        close = np.full(20, 100.0)
+        features = calculate_features(close, close + 1, close - 1, period=14)
+
+        assert 'RSI' not in features
+        assert features['MOM'] == 0.0
+        assert features['ATR'] == pytest.approx(2.0)
+
+    def test_flat_window_round_trips_through_redis_encoding(self):
+        """Test the flat-window message encodes to strict JSON with no nulls"""
+        close = np.full(20, 100.0)
+        features = calculate_features(close, close + 1, close - 1, period=14)
+        encoded = _dumps({"features": features})
+
+        # Strict parsing rejects NaN/Infinity tokens
+        decoded = json.loads(encoded, parse_constant=lambda token: pytest.fail(token))
+        assert decoded == _loads(encoded)
+        assert None not in decoded["features"].values()
+
+    def test_rising_window(self):
+        """Test RSI saturates at 100 with no losing ticks"""
+        close = np.linspace(100.0, 119.0, 20)
+        features = calculate_features(close, close + 1, close - 1, period=14)
+
+        assert features['RSI'] == 100.0
+        assert features['MOM'] == pytest.approx(close[-1] / close[-6] - 1.0)
+
+    def test_matches_pandas_implementation(self, model):
+        """Test features equal the replaced pandas version tick by tick, across buffer wraparound"""
+        agent = DataMinerAgent(model, "XXBTZUSD")
+        history = pd.DataFrame(columns=['close', 'high', 'low'], dtype=float)
+        checked = 0
+
+        for close, high, low in zip(*random_walk(agent.buffer_size * 3)):
+            agent._append_prices(close, high, low)
+            new_row = pd.DataFrame({'close': [close], 'high': [high], 'low': [low]})
+            history = pd.concat([history, new_row], ignore_index=True)
+            if len(history) > agent.buffer_size:
+                history = history.iloc[-agent.buffer_size:].reset_index(drop=True)
+
+            features = calculate_features(*agent._history(), agent.period)
+            expected = reference_features(history.copy(), agent.period)
+            if expected is None:
+                assert features is None
+                continue
+
+            for name in ('close', 'high', 'low', 'RSI', 'ATR', 'MOM'):
+                assert features[name] == pytest.approx(expected[name], rel=1e-9, abs=1e-12)
+            checked += 1
+
+        assert checked > agent.buffer_size
+
+
+class TestRingBuffer:
+    """Unit tests for the DataMinerAgent history ring buffer"""
+
+    def test_history_is_oldest_to_newest(self, model):
+        """Test the window holds the latest buffer_size ticks in order once wrapped"""
+        agent = DataMinerAgent(model, "XXBTZUSD")
+        ticks = np.arange(agent.buffer_size * 2 + 5, dtype=np.float64)
+
+        for i, tick in enumerate(ticks, start=1):
+            agent._append_prices(tick, tick + 1.0, tick - 1.0)
+            close, high, low = agent._history()
+            expected = ticks[max(0, i - agent.buffer_size):i]
+            np.testing.assert_array_equal(close, expected)
+            np.testing.assert_array_equal(high, expected + 1.0)
+            np.testing.assert_array_equal(low, expected - 1.0)
+
+    def test_history_views_are_contiguous(self, model):
+        """Test the window is a zero-copy contiguous view of the buffer"""
+        agent = DataMinerAgent(model, "XXBTZUSD")
+        for tick in range(agent.buffer_size + 3):
+            agent._append_prices(float(tick), float(tick), float(tick))
+
+        close, _, _ = agent._history()
+        assert close.flags['C_CONTIGUOUS']
+        assert np.shares_memory(close, agent.close_buf)
+
+
+class TestDataMinerStep:
+    """Unit tests for DataMinerAgent.step publishing"""
+
+    @staticmethod
+    def ticker(close):
+        return {'c': [str(close)], 'h': [str(close + 1.0)], 'l': [str(close - 1.0)]}
+
+    def published(self, model):
+        return [_loads(call.args[1]) for call in model.redis_client.publish_raw.call_args_list]
+
+    def test_publishes_once_history_is_built(self, model):
+        """Test step() publishes the enriched features on the pair's channel"""
+        agent = DataMinerAgent(model, "XXBTZUSD")
+        for close in np.linspace(100.0, 110.0, agent.period + 1):
+            model.ticker_snapshot = {"XXBTZUSD": self.ticker(close)}
+            agent.step()
+
+        model.redis_client.publish_raw.assert_called_once()
+        assert model.redis_client.publish_raw.call_args.args[0] == b"market-data:XXBTZUSD"
+        message = self.published(model)[0]
+        assert message['source'] == agent.name
+        assert message['pair'] == "XXBTZUSD"
+        assert message['features']['close'] == pytest.approx(110.0)
+        assert message['features']['RSI'] == 100.0
+
+    def test_flat_market_publishes_without_rsi(self, model):
+        """Test a flat window publishes valid features with RSI left out"""
+        agent = DataMinerAgent(model, "XXBTZUSD")
+        model.ticker_snapshot = {"XXBTZUSD": self.ticker(100.0)}
+        for _ in range(agent.period + 1):
+            agent.step()
+
+        features = self.published(model)[0]['features']
+        assert 'RSI' not in features
+        assert all(value is not None and math.isfinite(value) for value in features.values())
+
+    @pytest.mark.parametrize("closes", [np.linspace(100.0, 110.0, 15), np.full(15, 100.0)],
+                             ids=["rising", "flat"])
+    def test_struct_and_dict_encodings_agree(self, model, closes, monkeypatch):
+        """Test the msgspec Struct message decodes to the same dict as the fallback"""
+        pytest.importorskip("msgspec")
+        import src.agents.data_miner_agent as data_miner_agent
+
+        payloads = []
+        model.queue_publish = lambda channel, payload: payloads.append(payload)
+        model.redis_client.encode_for_channel = RedisClient.encode_for_channel
+
+        messages = []
+        for msgspec_available in (True, False):
+            monkeypatch.setattr(data_miner_agent, "MSGSPEC_AVAILABLE", msgspec_available)
+            payloads.clear()
+            agent = DataMinerAgent(model, "XXBTZUSD")
+            for close in closes:
+                model.ticker_snapshot = {"XXBTZUSD": self.ticker(close)}
+                agent.step()
+            message = _loads(payloads[0])
+            message.pop('timestamp')
+            message.pop('source')  # Agent names differ by unique_id
+            messages.append(message)
+
+        assert messages[0] == messages[1]
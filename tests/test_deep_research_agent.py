@@ -0,0 +1,37 @@
+"""
+Mycelial Finance - Deep Research Agent Unit Tests
+
+Unit tests for the DeepResearchAgent narrative listener check.
+Uses a mocked Redis connection, so no Redis server is needed.
+
+Run with: pytest tests/test_deep_research_agent.py
+"""
+
+import mesa
+import pytest
+from unittest.mock import MagicMock
+from src.agents.deep_research_agent import DeepResearchAgent
+
+
+class TestNarrativeListeners:
+    """Unit tests for DeepResearchAgent._has_narrative_listeners"""
+
+    @pytest.fixture
+    def model(self):
+        """Create a bare Mesa model with no pattern-narrative subscribers"""
+        model = mesa.Model()
+        model.redis_client = MagicMock()
+        model.kraken_client = MagicMock()
+        connection = model.redis_client.connection
+        connection.pubsub_numsub.return_value = [(b"pattern-narrative", 0)]
+        connection.pubsub_numpat.return_value = 0
+        return model
+
+    def test_no_listeners(self, model):
+        """Test nothing subscribed means no narratives are needed"""
+        assert DeepResearchAgent(model)._has_narrative_listeners() is False
+
+    def test_pattern_subscription_counts(self, model):
+        """Test a PSUBSCRIBE dashboard counts as a listener"""
+        model.redis_client.connection.pubsub_numpat.return_value = 1
+        assert DeepResearchAgent(model)._has_narrative_listeners() is True
@@ -0,0 +1,82 @@
+"""
+Mycelial Finance - In-Process Feature Cache Unit Tests
+
+Unit tests for DataMinerAgent sharing its features through
+model.feature_cache, and the Finance SwarmBrains / TA agents reading them
+in step() instead of subscribing to market-data.
+
+Run with: pytest tests/test_feature_cache.py
+"""
+
+import mesa
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from src.agents.data_miner_agent import DataMinerAgent
+from src.agents.pattern_learner_agent import PatternLearnerAgent
+from src.agents.technical_analysis_agent import TechnicalAnalysisAgent
+from src.connectors.redis_client import _loads
+
+
+def ticker(close):
+    return {'c': [str(close)], 'h': [str(close + 1.0)], 'l': [str(close - 1.0)]}
+
+
+class TestFeatureCache:
+    """Unit tests for the model.feature_cache read path"""
+
+    @pytest.fixture
+    def model(self):
+        """Create a bare Mesa model with a feature cache and mocked clients"""
+        model = mesa.Model()
+        model.redis_client = MagicMock()
+        model.kraken_client = MagicMock()
+        model.ticker_snapshot = {}
+        model.feature_cache = {}
+        model.swarm_brains = []
+        return model
+
+    def subscribed_channels(self, model):
+        return [call.args[0] for call in model.redis_client.subscribe.call_args_list]
+
+    def test_in_process_readers_skip_market_data_subscription(self, model):
+        """Test Finance SwarmBrains and TA agents don't subscribe to market-data"""
+        PatternLearnerAgent(model, "XXBTZUSD", product_focus="Finance")
+        TechnicalAnalysisAgent(model, "XXBTZUSD", team_id=1)
+        PatternLearnerAgent(model, "XXBTZUSD", product_focus="Logistics")
+
+        channels = self.subscribed_channels(model)
+        assert "market-data:XXBTZUSD" not in channels
+        assert "logistics-data:US-West" in channels
+
+    def test_readers_get_each_miner_tick_once(self, model):
+        """Test each DataMiner tick is handed to a reader exactly once"""
+        miner = DataMinerAgent(model, "XXBTZUSD")
+        learner = PatternLearnerAgent(model, "XXBTZUSD", product_focus="Finance")
+        ta = TechnicalAnalysisAgent(model, "XXBTZUSD", team_id=1)
+        learner.handle_features = MagicMock()
+        ta.handle_features = MagicMock()
+
+        for close in np.linspace(100.0, 110.0, miner.period + 3):
+            model.ticker_snapshot = {"XXBTZUSD": ticker(close)}
+            miner.step()
+            learner.step()
+            learner.step()  # Nothing new: not handled again
+            ta.step()
+
+        snapshot = model.feature_cache["XXBTZUSD"]
+        assert learner.handle_features.call_count == 3
+        learner.handle_features.assert_called_with(snapshot.features)
+        assert snapshot.features['close'] == pytest.approx(110.0)
+        assert ta.handle_features.call_count == 3
+        ta.handle_features.assert_called_with(snapshot.features, snapshot.timestamp)
+
+    def test_cache_matches_published_features(self, model):
+        """Test the cached features are the ones published for other processes"""
+        miner = DataMinerAgent(model, "XXBTZUSD")
+        for close in np.linspace(100.0, 110.0, miner.period + 1):
+            model.ticker_snapshot = {"XXBTZUSD": ticker(close)}
+            miner.step()
+
+        published = model.redis_client.publish_raw.call_args.args[1]
+        assert _loads(published)['features'] == model.feature_cache["XXBTZUSD"].features
@@ -145,3 +145,37 @@ class TestKrakenClient:
 
         # Counter should have increased
         assert kraken_client.rate_limit_counter > initial_counter
+
+
+class TestKrakenAssetPairs:
+    """Unit tests for KrakenClient.get_asset_pairs"""
+
+    @pytest.fixture
+    def client(self):
+        """Create a KrakenClient with a mocked Market client and rate limiter"""
+        client = KrakenClient()
+        client.market = Mock()
+        client.public_limiter = Mock()
+        return client
+
+    def test_each_call_requests_a_fresh_list(self, client):
+        """Test refreshes hit the AssetPairs endpoint, not the SDK's memoized method"""
+        client.market.request.side_effect = [{"XXBTZUSD": {}}, {"XXBTZUSD": {}, "NEWUSD": {}}]
+
+        assert client.get_asset_pairs() == {"XXBTZUSD": {}}
+        assert client.get_asset_pairs() == {"XXBTZUSD": {}, "NEWUSD": {}}
+        client.market.get_asset_pairs.assert_not_called()
+        client.market.request.assert_called_with(method="GET", uri="/0/public/AssetPairs", auth=False)
+
+    def test_rate_limited(self, client):
+        """Test every fetch takes a public-call token"""
+        client.market.request.return_value = {}
+        client.get_asset_pairs()
+        client.get_asset_pairs()
+
+        assert client.public_limiter.acquire.call_count == 2
+
+    def test_uninitialized_market(self, client):
+        """Test no Market client returns an empty dict"""
+        client.market = None
+        assert client.get_asset_pairs() == {}
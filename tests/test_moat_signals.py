@@ -0,0 +1,62 @@
+"""
+Mycelial Finance - Cross-Moat Signal Unit Tests
+
+Unit tests for the miners' float32 moat readings and the MarketExplorer
+lookup that reads them back. Uses fakeredis, so no Redis server is needed.
+
+Run with: pytest tests/test_moat_signals.py
+"""
+
+import fakeredis
+import mesa
+import pytest
+from unittest.mock import MagicMock
+from src.agents.base_agent import MOAT_FLOAT_PREFIX
+from src.agents.corp_data_miner_agent import CorpDataMinerAgent
+from src.agents.govt_data_miner_agent import GovtDataMinerAgent
+from src.agents.logistics_miner_agent import LogisticsMinerAgent
+from src.agents.market_explorer_agent import MOAT_SIGNAL_KEYS, MarketExplorerAgent
+from src.agents.repo_scrape_agent import RepoScrapeAgent
+
+
+class TestMoatSignals:
+    """Unit tests for store_moat_signal and MarketExplorer's moat lookup"""
+
+    @pytest.fixture
+    def model(self):
+        """Create a bare Mesa model whose Redis connection is fakeredis"""
+        model = mesa.Model()
+        model.redis_client = MagicMock()
+        model.redis_client.connection = fakeredis.FakeStrictRedis()
+        model.kraken_client = MagicMock()
+        return model
+
+    def test_miners_feed_every_explorer_signal(self, model):
+        """Test one step of each miner stores a 0-1 reading for every moat key"""
+        for miner in (GovtDataMinerAgent(model), LogisticsMinerAgent(model),
+                      CorpDataMinerAgent(model), RepoScrapeAgent(model, use_real_api=False)):
+            miner.step()
+
+        signals = MarketExplorerAgent(model, "Swing", 1)._fetch_moat_signals()
+
+        assert set(signals) == set(MOAT_SIGNAL_KEYS.values())
+        for key, value in signals.items():
+            assert model.redis_client.connection.exists(MOAT_FLOAT_PREFIX + key)
+            assert 0.0 <= value <= 1.0
+
+    def test_readings_round_trip_and_clamp(self, model):
+        """Test readings come back at float32 precision, clamped to 0-1"""
+        miner = GovtDataMinerAgent(model)
+        explorer = MarketExplorerAgent(model, "Swing", 1)
+        key = MOAT_SIGNAL_KEYS["government"]
+
+        miner.store_moat_signal(key, 0.75)
+        assert explorer._get_redis_signal(key) == 0.75
+        miner.store_moat_signal(key, 3.2)
+        assert explorer._get_redis_signal(key) == 1.0
+
+    def test_missing_readings_are_zero(self, model):
+        """Test keys no miner has written yet read as no signal"""
+        signals = MarketExplorerAgent(model, "Swing", 1)._fetch_moat_signals()
+
+        assert signals == dict.fromkeys(MOAT_SIGNAL_KEYS.values(), 0.0)
@@ -0,0 +1,78 @@
+"""
+Mycelial Finance - Pattern Embedding Unit Tests
+
+Unit tests for the pattern embedding utilities in chroma_client.
+Pure NumPy, so ChromaDB itself is not needed.
+
+Run with: pytest tests/test_pattern_embeddings.py
+"""
+
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pytest
+from src.storage._njit import NUMBA_AVAILABLE
+from src.storage._embedding_jit import _embed_batch, warm_up
+from src.storage.chroma_client import create_pattern_embedding, create_pattern_embeddings_from_columns
+
+
+class TestPatternEmbeddings:
+    """Unit tests for the single and column-wise embedders"""
+
+    def test_columns_match_single_pattern_embedder(self):
+        """Test column-wise embeddings equal create_pattern_embedding row by row"""
+        timestamps = [datetime(2025, 1, 6, 9), datetime(2025, 3, 15, 17), datetime(2025, 7, 4, 23)]
+        patterns = [
+            {'rsi': 28.5, 'macd': -1.2, 'volume': 2.5e6, 'price_change_pct': -3.1,
+             'cross_moat_score': 1, 'pnl_pct': -4.0, 'timestamp': timestamps[0]},
+            {'rsi': 71.0, 'macd': 0.8, 'volume': 9.0e5, 'price_change_pct': 2.2,
+             'cross_moat_score': 2, 'pnl_pct': 6.5, 'timestamp': timestamps[1]},
+            {'rsi': 50.0, 'macd': 0.0, 'volume': 0.0, 'price_change_pct': 0.0,
+             'cross_moat_score': 0, 'pnl_pct': 0.0, 'timestamp': timestamps[2]},
+        ]
+
+        def column(key):
+            return np.array([p[key] for p in patterns])
+
+        embeddings = create_pattern_embeddings_from_columns(
+            len(patterns),
+            hour=[t.hour for t in timestamps],
+            weekday=[t.weekday() for t in timestamps],
+            rsi=column('rsi'),
+            macd=column('macd'),
+            volume=column('volume'),
+            price_change_pct=column('price_change_pct'),
+            cross_moat_score=column('cross_moat_score'),
+            pnl_pct=column('pnl_pct')
+        )
+        expected = np.array([create_pattern_embedding(p) for p in patterns])
+
+        assert embeddings.shape == (3, 8)
+        # Stored at reduced precision (EMBEDDING_DTYPE)
+        np.testing.assert_allclose(embeddings.astype(np.float64), expected, atol=2e-3)
+
+    def test_scalar_features_broadcast(self):
+        """Test scalar features apply to every row, with the single-embedder defaults"""
+        embeddings = create_pattern_embeddings_from_columns(4, hour=12, weekday=2)
+        expected = create_pattern_embedding({'timestamp': datetime(2025, 1, 1, 12)})
+
+        for row in embeddings:
+            np.testing.assert_allclose(row.astype(np.float64), expected, atol=2e-3)
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_calls_reuse_the_warmed_kernel(self):
+        """Test real call mixes hit the signature warm_up() compiled, not a new one"""
+        warm_up()
+        assert len(_embed_batch.signatures) == 1
+
+        positions = pd.DataFrame({'pnl_pct': [1.5, -2.0, 0.5], 'hour': [9, 13, 22]})
+        read_only = np.array([0, 3, 4], dtype=np.float32)
+        read_only.flags.writeable = False
+
+        # Memory-builder style: DataFrame columns mixed with scalar features
+        create_pattern_embeddings_from_columns(3, hour=positions['hour'], weekday=read_only,
+                                               volume=0.0, pnl_pct=positions['pnl_pct'])
+        # Lists and strided views
+        create_pattern_embeddings_from_columns(3, hour=[1, 2, 3], weekday=np.arange(6.0)[::2])
+
+        assert len(_embed_batch.signatures) == 1
@@ -0,0 +1,77 @@
+"""
+Mycelial Finance - SwarmBrain (PatternLearnerAgent) Unit Tests
+
+Unit tests for the PatternLearnerAgent market-data handler.
+Uses a mocked Redis connection, so no Redis server is needed.
+
+Run with: pytest tests/test_pattern_learner_agent.py
+"""
+
+import mesa
+import pytest
+from unittest.mock import MagicMock
+from src.agents.pattern_learner_agent import PatternLearnerAgent
+
+
+class TestPatternLearnerAgent:
+    """Unit tests for PatternLearnerAgent"""
+
+    @pytest.fixture
+    def model(self):
+        """Create a bare Mesa model with mocked Redis and Kraken clients"""
+        model = mesa.Model()
+        model.redis_client = MagicMock()
+        model.kraken_client = MagicMock()
+        model.swarm_brains = []
+        return model
+
+    @pytest.fixture
+    def agent(self, model):
+        """Create a Finance SwarmBrain"""
+        return PatternLearnerAgent(model, "XXBTZUSD")
+
+    def test_null_rsi_treated_as_missing(self, agent, model):
+        """Test a null RSI (undefined over a flat window) falls back to neutral"""
+        agent.handle_market_data({'features': {'close': 100.0, 'ATR': 2.0, 'MOM': 0.0, 'RSI': None}})
+
+        snapshot = model.policy_write_buffer._pending[f"policy:{agent.name}"]
+        assert snapshot['raw_features']['RSI'] == 50
+        assert snapshot['strategy_vector'][3] == 100.0
+
+    def test_tick_saves_dashboard_state(self, agent, model):
+        """Test the first tick writes the agent:<name> hash and announces it"""
+        agent.handle_market_data({'features': {'close': 100.0, 'ATR': 2.0, 'MOM': 0.01, 'RSI': 40.0}})
+
+        connection = model.redis_client.connection
+        connection.hset.assert_called_once()
+        key = connection.hset.call_args.args[0]
+        fields = connection.hset.call_args.kwargs['mapping']
+        assert key == f"agent:{agent.name}"
+        assert fields['position'] == "FLAT"
+        assert fields['rsi'] == 40.0
+        model.redis_client.publish_raw.assert_called_with("agent.updates", agent.name.encode())
+
+    def test_unchanged_position_state_is_throttled(self, agent, model):
+        """Test back-to-back HOLD ticks write the dashboard state only once"""
+        tick = {'features': {'close': 100.0, 'ATR': 2.0, 'MOM': 0.0, 'RSI': 50.0}}
+        agent.handle_market_data(tick)
+        agent.handle_market_data(tick)
+
+        assert model.redis_client.connection.hset.call_count == 1
+
+    def test_halt_saves_status(self, agent, model):
+        """Test HALT_TRADING marks the agent halted on the dashboard"""
+        agent.handle_system_control({"command": "HALT_TRADING", "reason": "test"})
+
+        assert agent.trading_halted
+        fields = model.redis_client.connection.hset.call_args.kwargs['mapping']
+        assert fields['status'] == "Halted"
+
+    def test_swarm_brain_registry(self, agent, model):
+        """Test SwarmBrains join the model registry and leave it when removed"""
+        assert model.swarm_brains == [agent]
+
+        agent.remove()
+
+        assert model.swarm_brains == []
+        assert agent not in model.agents
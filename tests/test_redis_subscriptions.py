@@ -0,0 +1,71 @@
+"""
+Mycelial Finance - Redis Subscription Dispatcher Unit Tests
+
+Unit tests for the shared pubsub dispatcher behind RedisClient.subscribe().
+Uses a mocked pubsub, so no Redis server is needed.
+
+Run with: pytest tests/test_redis_subscriptions.py
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from src.connectors.redis_client import RedisClient
+
+
+class TestRedisSubscriptions:
+    """Unit tests for RedisClient subscription handling"""
+
+    @pytest.fixture
+    def redis_client(self):
+        """Create a RedisClient with no live connection or dispatcher thread"""
+        with patch.object(RedisClient, '_connect_with_retry'):
+            client = RedisClient(pool=MagicMock())
+        client._ensure_connection = MagicMock(return_value=True)
+        client._dispatcher_thread = MagicMock()  # Don't start the real thread
+        return client
+
+    def test_subscribe_does_not_touch_pubsub(self, redis_client):
+        """Test subscribe() only queues a new channel for the dispatcher thread"""
+        pubsub = MagicMock()
+        redis_client._pubsub = pubsub
+
+        redis_client.subscribe("market-data:XXBTZUSD", lambda message: None)
+
+        pubsub.subscribe.assert_not_called()
+        assert redis_client._pending_channels == ["market-data:XXBTZUSD"]
+
+    def test_dispatcher_subscribes_pending_channels(self, redis_client):
+        """Test the dispatcher issues one SUBSCRIBE for all queued channels"""
+        pubsub = MagicMock()
+        redis_client.subscribe("a", lambda message: None)
+        redis_client.subscribe("b", lambda message: None)
+        redis_client.subscribe("a", lambda message: None)  # Known channel: no resubscribe
+
+        redis_client._subscribe_pending(pubsub)
+
+        pubsub.subscribe.assert_called_once_with("a", "b")
+        assert redis_client._pending_channels == []
+
+    def test_reopen_subscribes_everything_once(self, redis_client):
+        """Test a (re)opened pubsub subscribes all channels and clears the queue"""
+        pubsub = MagicMock()
+        redis_client.connection = MagicMock()
+        redis_client.connection.pubsub.return_value = pubsub
+        redis_client.subscribe("a", lambda message: None)
+        redis_client.subscribe("b", lambda message: None)
+
+        redis_client._open_pubsub()
+        redis_client._subscribe_pending(pubsub)
+
+        pubsub.subscribe.assert_called_once_with("a", "b")
+
+    def test_dispatch_gives_each_callback_its_own_message(self, redis_client):
+        """Test every callback on a channel gets a separately decoded dict"""
+        received = []
+        redis_client.subscribe("a", received.append)
+        redis_client.subscribe("a", received.append)
+
+        redis_client._dispatch({"channel": b"a", "data": b'{"x": 1}'})
+
+        assert received == [{"x": 1}, {"x": 1}]
+        assert received[0] is not received[1]